@@ -5,6 +5,7 @@ import logging
 import argparse
 import time
 import threading
+import concurrent.futures
 import re
 from urllib.parse import urlparse
 from rich import print
@@ -23,10 +24,19 @@ from bigcharts_md import bc_quote
 from ml_urlhinter import url_hinter
 from ml_nlpreader import ml_nlpreader
 from y_techevents import y_techevents
-from nasdaq_wrangler import nq_wrangler
+from nasdaq_decoder import nq_decoder
 from y_cookiemonster import y_cookiemonster
-from ml_sentiment import ml_sentiment
+from ml_sentbatch import ml_sentbatch
+from ml_sentcache import InferenceCache
+from ml_registry import ModelRegistry         # torch / transformers load on 1st sentiment use only
 from db_graph import db_graph
+from http_pool import http_pool
+from render_pool import render_pool
+from net_capture import net_capture
+from rate_limiter import rate_limiter
+from fast_parse import fast_parse
+from yf_embedded import yf_embedded
+from article_stream import article_stream
 
 # Globals
 work_inst = 0
@@ -45,6 +55,10 @@ parser.add_argument('-t','--tops', help='show top ganers/losers', action='store_
 parser.add_argument('-u','--unusual', help='unusual up & down volume', action='store_true', dest='bool_uvol', required=False, default=False)
 parser.add_argument('-v','--verbose', help='verbose error logging', action='store_true', dest='bool_verbose', required=False, default=False)
 parser.add_argument('-x','--xray', help='dump detailed debug data structures', action='store_true', dest='bool_xray', required=False, default=False)
+parser.add_argument('--record', help='record every raw network payload into DIR', action='store', dest='record_dir', metavar='DIR', required=False, default=None)
+parser.add_argument('--parse', help='HTML parse mode: classic (html.parser, whole page) or fast (lxml + subtree strainer)', action='store', dest='parse_mode', choices=fast_parse.modes, required=False, default=fast_parse.mode)
+parser.add_argument('--sentiment', help='sentiment inference backend: torch (fp32), int8 (dynamic quantized) or onnx (onnxruntime)', action='store', dest='sent_backend', choices=('torch', 'int8', 'onnx'), required=False, default=None)
+parser.add_argument('--replay', help='replay a recorded run from DIR (no network)', action='store', dest='replay_dir', metavar='DIR', required=False, default=None)
 
 # Threading globals
 extract_done = threading.Event()
@@ -63,7 +77,8 @@ def do_nice_wait(topg_inst):
     for r in range(6):
         logging.info('do_nice_wait() cycle: %s' % topg_inst.cycle )
         time.sleep(5)    # wait immediatley to let remote update
-        topg_inst.get_topg_data()       # extract data from finance.Yahoo.com
+        topg_inst.ext_req = y_cookiemonster(3).get_js_data('finance.yahoo.com/markets/stocks/most-active/', have=topg_inst.last_digest)    # conditional re-poll
+        topg_inst.ext_get_data(topg_inst.yti)       # skips BS4 if payload is unchanged
         topg_inst.build_tg_df0()
         topg_inst.build_top10()
         topg_inst.build_tenten60(r)     # pass along current cycle
@@ -84,10 +99,13 @@ def bkgrnd_worker():
     global work_inst
     logging.info('main::bkgrnd_worker() IN Thread - bkgrnd_worker()' )
     logging.info('main::bkgrnd_worker() Ref -> inst #: %s' % work_inst.yti )
+    tenten_reader = y_cookiemonster(3)
     for r in range(4):
         logging.info('main::bkgrnd_worker():: Loop: %s' % r )
         time.sleep(30)    # wait immediatley to let remote update
-        work_inst.build_tg_df0()
+        work_inst.ext_req = tenten_reader.get_js_data('finance.yahoo.com/markets/stocks/most-active/', have=work_inst.last_digest)    # conditional re-poll
+        work_inst.ext_get_data(work_inst.yti)       # skips BS4 if payload is unchanged
+        work_inst.build_tg_df0()                    # skips DF0 rebuild if payload is unchanged
         work_inst.build_top10()
         work_inst.build_tenten60(r)
 
@@ -97,6 +115,53 @@ def bkgrnd_worker():
     return      # dont know if this this requireed or good semantics?
 
 
+#######################################################################
+# Acquisition stage workers
+# Each worker does ALL the network I/O + DataFrame build-out for 1 data source
+# and hands back the populated class instance. main() fans them out over a thread pool
+# and then prints each one (in the original fixed order) as its own future resolves.
+
+def acquire_topgainers():
+    """Fetch + build Large cap Top Gainers dataset"""
+    topgainer_reader = y_cookiemonster(1)         # instantiate class of cookiemonster
+    mlx_top_dataset = y_topgainers(1)             # instantiate class
+    mlx_top_dataset.init_dummy_session()          # setup cookie jar and headers
+    mlx_top_dataset.ext_req = topgainer_reader.get_js_data('finance.yahoo.com/markets/stocks/most-active/')
+    mlx_top_dataset.ext_get_data(1)
+    mlx_top_dataset.build_tg_df0()                # build full dataframe
+    mlx_top_dataset.build_top10()                 # build top 10
+    return mlx_top_dataset
+
+def acquire_daylosers():
+    """Fetch + build Large cap Top Losers dataset"""
+    toploser_reader = y_cookiemonster(2)          # instantiate class of cookiemonster
+    mlx_loser_dataset = y_daylosers(1)            # instantiate class
+    mlx_loser_dataset.init_dummy_session()        # setup cookie jar and headers
+    mlx_loser_dataset.ext_req = toploser_reader.get_js_data('finance.yahoo.com/markets/stocks/losers/')
+    mlx_loser_dataset.ext_get_data(1)
+    mlx_loser_dataset.build_tl_df0()              # build full dataframe
+    mlx_loser_dataset.build_top10()               # build top 10
+    return mlx_loser_dataset
+
+def acquire_smallcaps():
+    """Fetch + build Small cap gainers screener dataset"""
+    scap_reader = y_cookiemonster(2)              # instantiate class of cookiemonster
+    small_cap_dataset = smallcap_screen(1)        # instantiate class of a Small Scap Screener
+    small_cap_dataset.init_dummy_session()        # setup cookie jar and headers
+    small_cap_dataset.ext_req = scap_reader.get_js_data('finance.yahoo.com/research-hub/screener/small_cap_gainers/')
+    small_cap_dataset.ext_get_data(1)
+    small_cap_dataset.build_df0()                 # build full dataframe
+    small_cap_dataset.build_top10()               # build top 10
+    return small_cap_dataset
+
+def acquire_unvolumes(global_args):
+    """Fetch + build Nasdaq.com Unusual volume UP & DOWN datasets"""
+    un_vol_activity = un_volumes(1, global_args)  # instantiate NEW nasdaq data class, args = global var
+    un_vol_activity.get_un_vol_data()             # extract JSON data (Up & DOWN) from api.nasdaq.com
+    un_vol_activity.build_df(0)                   # 0 = UP Unusual volume
+    un_vol_activity.build_df(1)                   # 1 = DOWN unusual volume
+    return un_vol_activity
+
 ############################# main() ##################################
 
 def main():
@@ -113,6 +178,17 @@ def main():
     else:
         logging.disable(20)                 # Log lvel = INFO
 
+    fast_parse.set_mode(args['parse_mode'])
+
+    if args['record_dir'] is not None and args['replay_dir'] is not None:
+        parser.error("--record and --replay are mutually exclusive")
+    if args['record_dir'] is not None:
+        print ( f"Recording all network payloads to: {args['record_dir']}" )
+        net_capture.set_mode('record', args['record_dir'])
+    if args['replay_dir'] is not None:
+        print ( f"Replaying recorded network payloads from: {args['replay_dir']}" )
+        net_capture.set_mode('replay', args['replay_dir'])
+
     if args['newsymbol'] is not False:
         print ( " " )
         print ( f"Scanning news for symbol: {args['newsymbol']}" )
@@ -121,34 +197,30 @@ def main():
 
     recommended = {}        # dict of recomendations
 
+########### 0 - Concurrent data acquisition ################
+# All independent sources are fetched + built in parallel. Each print stage below only
+# waits on its own future, so total wall time ~= the slowest source, not the sum of all.
+    acq_jobs = {}
+    acq_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix='aop_acq')
+    if args['bool_tops'] is True:
+        acq_jobs['tops'] = acq_pool.submit(rate_limiter.carry(acquire_topgainers))
+        acq_jobs['losers'] = acq_pool.submit(rate_limiter.carry(acquire_daylosers))
+    if args['bool_scr'] is True:
+        acq_jobs['scap'] = acq_pool.submit(rate_limiter.carry(acquire_smallcaps))
+    if args['bool_uvol'] is True:
+        acq_jobs['uvol'] = acq_pool.submit(rate_limiter.carry(acquire_unvolumes), args)
+    acq_pool.shutdown(wait=False)            # no new jobs. Workers keep running
+
 ########### 1 - TOP GAINERS ################
     if args['bool_tops'] is True:
         print ( "========== Large Cap / Top Gainers ===============================" )
-        ## new JS data extractor
-        topgainer_reader = y_cookiemonster(1)         # instantiate class of cookiemonster
-        mlx_top_dataset = y_topgainers(1)             # instantiate class
-        mlx_top_dataset.init_dummy_session()          # setup cookie jar and headers
- 
-        mlx_top_dataset.ext_req = topgainer_reader.get_js_data('finance.yahoo.com/markets/stocks/most-active/')
-        mlx_top_dataset.ext_get_data(1)
-
-        x = mlx_top_dataset.build_tg_df0()     # build full dataframe
-        mlx_top_dataset.build_top10()          # show top 10
+        mlx_top_dataset = acq_jobs['tops'].result()   # wait for concurrent fetch + build-out
         mlx_top_dataset.print_top10()          # print it
         print ( " " )
 
 ########### 2 - TOP LOSERS ################
         print ( "========== Large Cap / Top Loosers ================================" )
-        ## new JS data extractor
-        toploser_reader = y_cookiemonster(2)         # instantiate class of cookiemonster
-        mlx_loser_dataset = y_daylosers(1)           # instantiate class
-        mlx_loser_dataset.init_dummy_session()       # setup cookie jar and headers
- 
-        mlx_loser_dataset.ext_req = toploser_reader.get_js_data('finance.yahoo.com/markets/stocks/losers/')
-        mlx_loser_dataset.ext_get_data(1)
-
-        x = mlx_loser_dataset.build_tl_df0()     # build full dataframe
-        mlx_loser_dataset.build_top10()          # show top 10
+        mlx_loser_dataset = acq_jobs['losers'].result()    # wait for concurrent fetch + build-out
         mlx_loser_dataset.print_top10()          # print it
         print ( " " )
 
@@ -171,6 +243,7 @@ def main():
         print ( " " )
         # print ( work_inst.tg_df2.sort_values(by=['Symbol','Time'], ascending=True ) )
         print ( work_inst.tg_df2.sort_values(by=['ERank','Time'] ) )
+        print ( f"10x10x60 cycles - rebuilt: {work_inst.cycle_stats['built']} / skipped (unchanged): {work_inst.cycle_stats['skipped']}" )
 
     else:
         print ( " " )
@@ -179,19 +252,7 @@ def main():
 # small caps are isolated outside the regular dataset by yahoo.com
     if args['bool_scr'] is True:
         print ( "========== Small Cap / Top Gainers / +5% with Mkt-cap > $299M ==========" )
-        scap_reader = y_cookiemonster(2)             # instantiate class of cookiemonster
-        small_cap_dataset = smallcap_screen(1)       # instantiate class of a Small Scap Screener
-        small_cap_dataset.init_dummy_session()       # setup cookie jar and headers
- 
-        #small_cap_dataset.get_data(1)
-        #small_cap_dataset.ext_req = scap_reader.get_js_data('finance.yahoo.com/screener/predefined/small_cap_gainers/')
-        #small_cap_dataset.ext_req = scap_reader.get_js_data('finance.yahoo.com/research-hub/screener/small_cap_gainers/?guccounter=1&guce_referrer=aHR0cHM6Ly9sb2dpbi55YWhvby5jb20v&guce_referrer_sig=AQAAAI3vp_nhrREFAZEd8hz2PmJEWD7VaT_BSBndiFDRmuxRoEdN6B1ueh0ElsNdB6qSP0A-d1sAs_P0_lteTp51lkefa5U4qBxlDDl5HILBDRTJQ9XuGlBvQ-CzUUPSkSF3vyMhxlQnuAaSsrUSJpAZiHIJTy4YcbWJTYz7YRtOm2sH')
-        small_cap_dataset.ext_req = scap_reader.get_js_data('finance.yahoo.com/research-hub/screener/small_cap_gainers/')
-
-        small_cap_dataset.ext_get_data(1)
-        
-        x = small_cap_dataset.build_df0()         # build full dataframe
-        small_cap_dataset.build_top10()           # show top 10
+        small_cap_dataset = acq_jobs['scap'].result()    # wait for concurrent fetch + build-out
         small_cap_dataset.print_top10()           # print it
 
         #yf_sc_screener = cookie_monster(1, "/screener/predefined/small_cap_gainers/", args)
@@ -211,12 +272,7 @@ def main():
 # process Nasdaq.com unusual_vol ################
     if args['bool_uvol'] is True:
         print ( "========== Unusually high Volume / Up =======================================================" )
-        un_vol_activity = un_volumes(1, args)       # instantiate NEW nasdaq data class, args = global var
-        un_vol_activity.get_un_vol_data()           # extract JSON data (Up & DOWN) from api.nasdaq.com
-
-        # should test success of extract before attempting DF population
-        un_vol_activity.build_df(0)           # 0 = UP Unusual volume
-        un_vol_activity.build_df(1)           # 1 = DOWN unusual volume
+        un_vol_activity = acq_jobs['uvol'].result()     # wait for concurrent fetch + build-out (UP & DOWN)
 
         # find lowest price stock in unusuall UP volume list
         up_unvols = un_vol_activity.up_unvol_listall()      # temp DF, nicely ordered & indexed of unusual UP vol activity
@@ -423,14 +479,21 @@ def main():
 # ###################################################################################
 
     if args['newsymbol'] is not False:
+            rate_limiter.set_lane('bulk')               # news crawling yields to interactive quotes
             sx = 1
             cmi_debug = __name__+"::_args_newsymbol.#1"
             news_symbol = str(args['newsymbol'])        # symbol provided on CMDLine
-            final_sent_df = pd.DataFrame()              # reset DataFrame for each article
             print ( " " )
             print ( f"M/L news reader for Stock [ {news_symbol} ] =========================" )
             news_ai = ml_nlpreader(1, args)
-            sent_ai = ml_sentiment(1, args)
+            sent_model = ModelRegistry.get(backend=args['sent_backend'], cache=InferenceCache())     # lazy, shared. persistent cache: repeat runs skip seen text
+            if sent_model.backend != 'torch':
+                parity = sent_model.parity_check()          # fp32 label agreement on the fixture corpus
+                print ( f"Sentiment backend: {parity['backend']} / fp32 label agreement: {parity['agreement']:.2%}" )
+                if parity['agreement'] < 0.95:
+                    print ( f"Sentiment backend: {parity['backend']} failed parity / fall back to torch fp32" )
+                    sent_model.set_backend('torch')
+            sent_ai = ml_sentbatch(1, args, sent_model)
             news_ai.nlp_read_one(news_symbol, args)     # includes scan_news_feed() & eval_news_feed_stories()
             kgraphdb = db_graph(1, args)                # inst a class 
             kgraphdb.con_aopkgdb(1)                     # connect to neo4j db
@@ -445,57 +508,29 @@ def main():
     # ################################################################
     # MAIN control loop for AI M/L NLP reading & Sentimnent analysis
     # ################################################################
+            # pass 1 : read every viable article & queue its paragraphs. No inference yet
             for sn_idx, sn_row in news_ai.yfn.ml_ingest.items():    # all pages extrated in ml_ingest
-                aggmean_sent_df = pd.DataFrame()  # reset DataFrame for each article
                 # TESTING code only - to make testing complete quicker (only test 4 docs)
                 thint = news_ai.nlp_summary(3, sn_idx)       # TESTING: News article TYPE in ml_ingest to look for
                 # TESTING: Long term, this will be a list of all the articles
-                
                 if thint == 0.0:    # only compute type 0.0 prepared and validated new articles in ML_ingest
-                    ttc, twc, tsc = news_ai.yfn.extract_article_data(sn_idx, sent_ai)
-                    ttkz += ttc
-                    twcz += twc
-                    tscz += tsc
-                    this_urlhash = sent_ai.active_urlhash
-                    pd.set_option('display.max_rows', None)
-                    pd.set_option('max_colwidth', 30)
-                    aggregate_mean = sent_ai.sen_df0.loc[sent_ai.sen_df0['urlhash'] == this_urlhash].groupby('snt')['rnk'].mean()    # fill NaN with 0.0
-                   
-                    # aggregate_mean DF keys are only set if the sentiment analysis computes a pos/net/neu sentimentfor the article.
-                    # If the article has no matching sentiment, thekeys are not set in the DF.
-                    # Check if the keys exists, and create a default = 0.0 if not
-                    nx, px, zx = 0.0, 0.0, 0.0
-                    try:
-                        px = aggregate_mean.loc['positive']
-                    except KeyError:
-                        logging.info( f'%s - Positive sentiment DF key missing / Create + Set: 0.0' % cmi_debug )
-                        aggregate_mean.loc['positive'] = 0.0
-
-                    try:
-                        nx = aggregate_mean.loc['negative']
-                    except KeyError:
-                        aggregate_mean.loc['negative'] = 0.0
-                        logging.info( f'%s - Negative sentiment DF key missing / Create + Set: 0.0' % cmi_debug )
-
-                    try:
-                        zx = aggregate_mean.loc['neutral']
-                    except KeyError:
-                        logging.info( f'%s - Neutral sentiment DF key missing / Create + Set: 0.0' % cmi_debug )
-                        aggregate_mean.loc['neutral'] = 0.0
-
-                    #print ( f"\n\n### DEBUG: Article Dataframe 3 ####" )
-                    data_payload = [[ \
-                            sn_idx, \
-                            this_urlhash, \
-                            px, \
-                            nx, \
-                            zx ]]
-
-                    # build the Sentiment DF that shows interesting computed sentiment for each article
-                    sent_df_row = pd.DataFrame(data_payload, columns=['art', 'urlhash', 'psnt', 'nsnt', 'zsnt'] )
-                    aggmean_sent_df = pd.concat([aggmean_sent_df, sent_df_row])
-                    merge_row = pd.merge(news_ai.yfn.sen_stats_df, aggmean_sent_df, on=['art', 'urlhash'])
-                    final_sent_df = pd.concat([final_sent_df, merge_row], ignore_index=True)
+                    art = news_ai.yfn.article_paragraphs(sn_idx)
+                    if art is not None:
+                        sent_ai.add(art[0], sn_idx, art[2], art[1])
+
+            # pass 2 : 1 batched inference run over the paragraphs of ALL queued articles
+            sent_ai.run()
+
+            # pass 3 : scatter results back per article (by urlhash)
+            for this_urlhash, a_stats in sent_ai.articles.items():
+                sn_idx = a_stats['art']
+                ttc, twc, tsc = a_stats['tokens'], a_stats['words'], a_stats['paras']
+                ttkz += ttc
+                twcz += twc
+                tscz += tsc
+                s_count = sent_ai.counts(this_urlhash)
+                news_ai.yfn.article_stats(sn_idx, this_urlhash, s_count)
+                print ( f"Article: {sn_idx} / Total tokens generated: {ttc} / Neutral: {s_count['neutral']} / Postive: {s_count['positive']} / Negative: {s_count['negative']}")
 
             ################################################################
             # END of article processing loop
@@ -513,27 +548,17 @@ def main():
             if args['bool_verbose'] is True:        # Logging level
                 news_ai.yfn.dump_ml_ingest()
                 print (f"{sent_ai.sen_df0}")
+                print (f"Page cache: {news_ai.ml_yfn_dataset.yfn_jsdb.stats()}")
+                print (f"DOM cache: {news_ai.ml_yfn_dataset.dom_stats}")
+                print (f"Article stream: {article_stream.stats}")
+                print (f"Sentiment cache: {sent_ai.model.cache.stats()}")
+                if render_pool.shared is not None:
+                    print (f"Render pool: {render_pool.shared.stats()}")
  
             #sent_ai.sen_df1 = sent_ai.sen_df0.groupby('snt').agg(['count'])
             pd.set_option("expand_frame_repr", False)
-            aggregation_functions = { \
-                'art': 'nunique', \
-                'urlhash': 'nunique', \
-                'positive': 'sum', \
-                'neutral': 'sum', \
-                'negative': 'sum', \
-                'psnt': 'mean', \
-                'nsnt': 'mean', \
-                'zsnt': 'mean'
-                }
-
-            # Calculate the totals row
-            totals_row = final_sent_df.agg(aggregation_functions)
-            totals_df = pd.DataFrame(totals_row).T
-            totals_df.index = ['Totals']
-            final_sent_df['art'] = final_sent_df['art'].astype(object)
-            totals_df['urlhash'] = ''       # Or np.nan if preferred for a numerical representation
-            df_final = pd.concat([final_sent_df, totals_df])
+            pd.set_option('max_colwidth', 30)
+            df_final = sent_ai.final_df()           # 1 row per article (counts + mean scores) & a Totals row
             print ( f"{df_final}")
             print (f"\n")
 
@@ -594,32 +619,16 @@ def main():
     """
 
     if args['qsymbol'] is not False:
+        rate_limiter.set_lane('interactive')            # live quotes jump ahead of any queued bulk fetches
         nq = nquote(1, args)                          # Nasdqa quote instance from nasdqa_quotes.py
         nq.init_dummy_session()                       # note: this will set nasdaq magic cookie
         nq_symbol = args['qsymbol'].upper()
         logging.info( f"%s - Get Nasdaq.com quote for symbol {nq_symbol}" % cmi_debug )
-        nq.update_headers(nq_symbol, "stocks")        # set path: header object. doesnt touch secret nasdaq cookies
-        nq.form_api_endpoint(nq_symbol, "stocks")     # set API endpoint url - default GUESS asset_class=stocks
-        ac = nq.learn_aclass(nq_symbol)
-
-        if ac != "stocks":
-            logging.info( f"%s - re-shape asset class endpoint to: {ac}" % cmi_debug )
-            nq.form_api_endpoint(nq_symbol, ac)       # re-form API endpoint if default asset_class guess was wrong)
-            nq.get_nquote(nq_symbol.upper())          # get a live quote
-            wq = nq_wrangler(1, args)                 # instantiate a class for Quote Data Wrangeling
-            wq.asset_class = ac
-        else:
-            nq.get_nquote(nq_symbol.rstrip())
-            wq = nq_wrangler(1, args)                 # instantiate a class for Quote Data Wrangeling
-            wq.asset_class = ac                       # wrangeler class MUST know the class of asset its working on
-
-        logging.info( f"============ Getting nasdaq quote data for asset class: {ac} ==========" )
-        wq.setup_zones(1, nq.quote_json1, nq.quote_json2, nq.quote_json3)
-        wq.do_wrangle()
-        wq.clean_cast()
-        wq.build_data_sets()
+        nq_batch = nq.get_nquotes([nq_symbol])               # asset class (cached) + all 3 data zones
+        quote_df, nq_quotes = nq_decoder.decode(nq_batch)     # schema driven decode -> typed DF + qd_quote dicts
+        logging.info( f"============ Getting nasdaq quote data for asset class: {(nq_batch.get(nq_symbol) or {}).get('asset_class')} ==========" )
         # add Tech Events Sentiment to quote dict{}
-        te_nq_quote = wq.qd_quote
+        te_nq_quote = nq_quotes.get(nq_symbol, {})
         """
         te = y_techevents(2)
         te.form_api_endpoints(nq_symbol)
@@ -640,7 +649,7 @@ def main():
         print ( f"                          {nq_symbol}" )
         print ( f"===============================================================" )
         c = 1
-        for k, v in wq.qd_quote.items():
+        for k, v in te_nq_quote.items():
             print ( f"{c} - {k} : {v}" )
             c += 1
         """
@@ -692,6 +701,14 @@ def main():
         print ( f"========================================================" )
         print ( " " )
 
+# Connection pool stats ###############################################################
+    if args['bool_verbose'] is True or args['bool_xray'] is True:
+        http_pool.print_stats()                 # keep-alive connections opened vs reused, per host
+        rate_limiter.print_stats()              # per host tokens granted + time spent paced
+        yf_embedded.print_stats()               # yahoo pages served by the embedded JSON fast path vs the DOM path
+        if net_capture.active():
+            print ( f"Network capture [{net_capture.mode}] - captured: {net_capture.captured} / replayed: {net_capture.replayed}" )
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,131 @@
+#! python3
+import re
+import logging
+from lxml import etree
+from yf_selectors import yf_selectors
+
+# logging setup
+logging.basicConfig(level=logging.INFO)
+
+#####################################################
+
+class stream_p(str):
+    """1 article paragraph. A str that also answers .text / .get_text() like the BS4 <p> tags it replaces"""
+
+    @property
+    def text(self):
+        return str(self)
+
+    def get_text(self, *args, **kwargs):
+        return str(self)
+
+#####################################################
+
+class body_target:
+    """
+    lxml parser target (SAX style events). Tracks when the parser is inside the article body container,
+    collects the text of each <p> in it & flags done once the container closes
+    """
+
+    def __init__(self, tag, classes):
+        self.tag = tag              # container tag ('' = any)
+        self.classes = classes      # set of classes the container must carry
+        self.depth = 0              # open tags inside the container (0 = not in container)
+        self.p_buf = None           # text parts of the <p> being read
+        self.ready = []             # finished paragraphs, drained by the generator
+        self.done = False
+        return
+
+    def start(self, tag, attrib):
+        if self.done:
+            return
+        if self.depth == 0:
+            if (self.tag in ('', tag)) and self.classes.issubset(attrib.get('class', '').split()):
+                self.depth = 1
+            return
+        self.depth += 1
+        if tag == 'p':
+            self.p_buf = []
+        return
+
+    def end(self, tag):
+        if self.done or self.depth == 0:
+            return
+        self.depth -= 1
+        if tag == 'p' and self.p_buf is not None:
+            text = "".join(self.p_buf).strip()
+            if text:
+                self.ready.append(stream_p(text))
+            self.p_buf = None
+        if self.depth == 0:
+            self.done = True            # article body closed. Rest of the page is never parsed
+        return
+
+    def data(self, text):
+        if self.p_buf is not None:
+            self.p_buf.append(text)
+        return
+
+    def close(self):
+        return None
+
+#####################################################
+
+class article_stream:
+    """
+    Early terminating, streaming article body extractor for extract_article_data()
+    Feeds the page into an lxml event parser in chunks, yields each <p> of the article body container as soon as
+    it closes & stops feeding the moment the container closes. Scripts, ads, footers & comments after the
+    article are never parsed and no DOM tree is built, so the sentiment stage can start on paragraph 1
+    while the rest of the body is still being read.
+    The container comes from the yf_selectors 'article' 'body' profile zone (must be a tag.class.class selector)
+    """
+
+    # global accessors
+    chunk = 16 * 1024           # bytes of markup fed to the parser per step
+    simple_rx = re.compile(r'^([a-zA-Z0-9]*)((?:\.[\w-]+)+)$')
+    stats = {'pages': 0, 'early_stop': 0, 'paragraphs': 0, 'fed_bytes': 0, 'page_bytes': 0}
+
+######################################################################
+# method 1
+    @staticmethod
+    def container():
+        """(tag, class set) of the article body container, from the current yf_selectors profile"""
+        css = yf_selectors.profiles['article']['body'].strip()
+        m = article_stream.simple_rx.match(css)
+        if m is None:
+            raise ValueError(f"article body selector not streamable (need tag.class form): {css}")
+        return m.group(1).lower(), set(m.group(2).lstrip('.').split('.'))
+
+######################################################################
+# method 2
+    @staticmethod
+    def paragraphs(markup, chunk=None):
+        """
+        Generator. Yields the article body paragraphs (stream_p) in page order
+        markup : page html (str)
+        """
+        cmi_debug = __name__+"::"+article_stream.paragraphs.__name__
+        step = chunk or article_stream.chunk
+        tag, classes = article_stream.container()
+        target = body_target(tag, classes)
+        parser = etree.HTMLParser(target=target, recover=True, remove_comments=True)
+        article_stream.stats['pages'] += 1
+        article_stream.stats['page_bytes'] += len(markup)
+        pos = 0
+        while pos < len(markup) and not target.done:
+            parser.feed(markup[pos:pos + step])
+            pos += step
+            while target.ready:
+                article_stream.stats['paragraphs'] += 1
+                yield target.ready.pop(0)
+        if target.done:
+            article_stream.stats['early_stop'] += 1
+        else:
+            parser.close()              # flush the tail (body never closed or not found)
+        while target.ready:
+            article_stream.stats['paragraphs'] += 1
+            yield target.ready.pop(0)
+        article_stream.stats['fed_bytes'] += min(pos, len(markup))
+        logging.info( f"%s - parsed {min(pos, len(markup))} of {len(markup)} chars / early stop: {target.done}" % cmi_debug )
+        return
@@ -3,6 +3,8 @@ import time
 import logging
 import re
 
+from rate_limiter import rate_limiter
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -40,7 +42,8 @@ class AlphaVantageClient:
         Fetches the daily time-series data for a given stock symbol.
 
         Implements an exponential backoff retry mechanism for handling rate limits
-        and transient API errors.
+        and transient API errors. Each attempt is paced by the shared per-host
+        rate limiter, so concurrent callers stay under the API call frequency.
 
         Args:
             symbol (str): The stock ticker symbol (e.g., "AAPL").
@@ -68,6 +71,7 @@ class AlphaVantageClient:
 
         while attempts < self.max_retries:
             try:
+                rate_limiter.acquire(self.base_url)
                 response = self.session.get(self.base_url, params=params, timeout=self.timeout)
 
                 if response.status_code == 200:
@@ -4,6 +4,8 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from rate_limiter import rate_limiter
+
 class TwitterClient:
     """
     A client to interact with the Twitter/X API v2 using a persistent, resilient session.
@@ -49,6 +51,7 @@ class TwitterClient:
     def search_tweets(self, ticker: str, max_tweets: int = 100) -> list[dict]:
         """
         Searches for recent tweets mentioning a specific stock ticker, handling pagination.
+        Each page request is paced by the shared per-host rate limiter.
 
         Args:
             ticker (str): The stock ticker symbol (e.g., "AAPL").
@@ -71,6 +74,7 @@ class TwitterClient:
         while True:
             try:
                 logging.debug(f"Searching tweets with params: {params}")
+                rate_limiter.acquire(self.BASE_URL)
                 response = self.session.get(self.BASE_URL, params=params, timeout=10)
                 response.raise_for_status()
 
@@ -7,6 +7,8 @@ import pytz
 from pandas.tseries.holiday import USFederalHolidayCalendar
 from datetime import timedelta
 
+from ml_registry import ModelRegistry
+
 class TweetProcessor:
     """
     A utility class for cleaning and tokenizing tweet text.
@@ -94,13 +96,14 @@ class FeatureEngineer:
         return data.dropna()
 
 
-def run_processing_pipeline(raw_data: dict, sentiment_model: 'SentimentAnalysisModel') -> dict:
+def run_processing_pipeline(raw_data: dict, sentiment_model: 'SentimentAnalysisModel' = None) -> dict:
     """
     Orchestrates the entire data processing pipeline.
     
     Args:
         raw_data (dict): The dictionary output from run_ingestion_pipeline.
         sentiment_model (SentimentAnalysisModel): An instantiated sentiment analysis model.
+            Defaults to the process-wide shared model, loaded only if there are tweets to score.
 
     Returns:
         dict: A dictionary of feature-rich DataFrames for each stock.
@@ -131,6 +134,8 @@ def run_processing_pipeline(raw_data: dict, sentiment_model: 'SentimentAnalysisM
             tweet_data_df['tokens'] = tweet_data_df['cleaned_text'].apply(
                 lambda x: TweetProcessor.tokenize_and_remove_stopwords(x, stop_words)
             )
+            if sentiment_model is None:
+                sentiment_model = ModelRegistry.get()
             tweet_data_df['sentiment_score'] = sentiment_model.predict(tweet_data_df['tokens'])
             
             # Temporal Alignment
@@ -0,0 +1,81 @@
+#! python3
+import time
+import logging
+import threading
+from bs4 import BeautifulSoup, SoupStrainer
+
+# logging setup
+logging.basicConfig(level=logging.INFO)
+
+#####################################################
+
+class fast_parse:
+    """
+    Central BS4 parse front-end for the screener & quote page scrapers, with 2 selectable modes.
+    classic : BeautifulSoup(page, 'html.parser') over the whole page (the original behaviour)
+    fast    : lxml backend + a SoupStrainer, so only the target subtree(s) are ever built into the tree.
+              Every page type only reads 1 <tbody> / #quote table, so the rest of a multi-hundred-KB
+              page is tokenized by lxml (C) but never turned into python Tag objects.
+    Callers keep using the normal BS4 API (find / find_all / stripped_strings) on the result.
+    """
+
+    # global accessors
+    modes = ('classic', 'fast')
+    mode = 'fast'           # process-wide default parse mode (aop.py --parse)
+    # page type -> SoupStrainer() kwargs of the subtree(s) that page type actually reads. None = whole page
+    targets = { 'screener': {'name': 'tbody'}, \
+                'bc_basic': {'attrs': {'id': 'quote'}}, \
+                'bc_quick': {'name': ['h1', 'table']}, \
+                'mw_quote': None }
+    strainers = {}          # page type -> built SoupStrainer (lazy)
+    stat_lock = threading.Lock()
+    parse_stats = {}        # (page type, mode) -> [pages, secs]
+
+######################################################################
+# method 1
+    @staticmethod
+    def set_mode(mode):
+        if mode not in fast_parse.modes:
+            raise ValueError(f"unknown parse mode: {mode}")
+        fast_parse.mode = mode
+        return
+
+    @staticmethod
+    def strainer(target):
+        spec = fast_parse.targets.get(target)
+        if spec is None:
+            return None
+        if target not in fast_parse.strainers:
+            fast_parse.strainers[target] = SoupStrainer(**spec)
+        return fast_parse.strainers[target]
+
+######################################################################
+# method 2
+    @staticmethod
+    def soup(markup, target, mode=None):
+        """
+        Parse markup (str or bytes) for a known page target (see targets{})
+        mode : 'classic' | 'fast'. Default = fast_parse.mode
+        return : BeautifulSoup doc
+        """
+        cmi_debug = __name__+"::"+fast_parse.soup.__name__
+        mode = fast_parse.mode if mode is None else mode
+        t0 = time.perf_counter()
+        if mode == 'fast':
+            doc = BeautifulSoup(markup, 'lxml', parse_only=fast_parse.strainer(target))
+        else:
+            doc = BeautifulSoup(markup, 'html.parser')
+        secs = time.perf_counter() - t0
+        with fast_parse.stat_lock:
+            ps = fast_parse.parse_stats.setdefault((target, mode), [0, 0.0])
+            ps[0] += 1
+            ps[1] += secs
+        logging.info( f"%s - {target} [{mode}] parsed in {secs * 1000:.2f} ms" % cmi_debug )
+        return doc
+
+######################################################################
+# method 3
+    @staticmethod
+    def stats():
+        with fast_parse.stat_lock:
+            return { f"{t}/{m}": {'pages': v[0], 'mean_ms': round(v[1] * 1000 / v[0], 3)} for (t, m), v in fast_parse.parse_stats.items() }
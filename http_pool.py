@@ -0,0 +1,220 @@
+#! python3
+import time
+import threading
+import hashlib
+import logging
+from collections import OrderedDict
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from requests_html import HTMLSession
+from rich import print
+from net_capture import net_capture
+from rate_limiter import rate_limiter
+
+# logging setup
+logging.basicConfig(level=logging.INFO)
+
+#####################################################
+
+class counted_http_pool(HTTPConnectionPool):
+    """urllib3 connection pool that tallies every connection checkout as OPENED or REUSED"""
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout=timeout)
+        # a pooled connection that still holds a live socket is a keep-alive reuse.
+        # Anything else (fresh conn or a dropped/reset one) has to do a new TCP (+TLS) handshake
+        http_pool.tally(self.host, getattr(conn, 'sock', None) is not None)
+        return conn
+
+class counted_https_pool(HTTPSConnectionPool):
+    """urllib3 TLS connection pool that tallies every connection checkout as OPENED or REUSED"""
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout=timeout)
+        http_pool.tally(self.host, getattr(conn, 'sock', None) is not None)
+        return conn
+
+class counted_adapter(HTTPAdapter):
+    """HTTPAdapter that builds its keep-alive pools from the counted pool classes"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': counted_http_pool, 'https': counted_https_pool}
+        return
+
+    def send(self, request, **kwargs):
+        # record/replay hook. Every scraper fetch funnels through here (see net_capture)
+        if net_capture.mode == 'replay':
+            return net_capture.replay_response(request, self)
+        rate_limiter.acquire(request.url)           # per host pacing (blocks in priority lane order)
+        resp = super().send(request, **kwargs)
+        if net_capture.mode == 'record':
+            net_capture.record_response(request, resp)
+        return resp
+
+#####################################################
+
+class http_pool:
+    """
+    Process-wide registry of keep-alive HTTP sessions, shared by every scraper class.
+    One HTMLSession per site, keyed by registrable domain (e.g. www.nasdaq.com & api.nasdaq.com
+    both map to nasdaq.com) so sibling hosts share a single cookie jar. The nasdaq/yahoo cookie
+    hacks depend on that. Each session mounts a counted_adapter sized from host_sizing{}.
+    """
+
+    # global accessors
+    sessions = {}           # site key -> HTMLSession (keep-alive pools + cookie jar)
+    conn_stats = {}         # host -> {'opened': n, 'reused': n}
+    reg_lock = threading.Lock()     # guards sessions{} creation
+    stat_lock = threading.Lock()    # guards conn_stats{} counters
+    validators = OrderedDict()      # url -> {'etag', 'last_mod', 'digest', 'ts'} of the last 2xx cond_get(). LRU order
+    val_lock = threading.Lock()
+    val_max = 256                   # LRU bound on validators{}
+    val_ttl = 3600                  # secs a validator set stays usable
+
+    # per-site pool sizing : (pool_connections, pool_maxsize)
+    #   pool_connections = num of distinct host pools cached inside the adapter
+    #   pool_maxsize = max keep-alive connections held open per host
+    host_sizing = { \
+                    'yahoo.com': (4, 16), \
+                    'nasdaq.com': (4, 16), \
+                    'marketwatch.com': (2, 8), \
+                    'alphavantage.co': (1, 4), \
+                    'twitter.com': (1, 4) }
+    default_sizing = (2, 4)
+
+##############################################################################
+# method #1
+    @staticmethod
+    def site_key(target):
+        """
+        Reduce a URL or bare host string to its registrable domain (last 2 labels).
+        e.g. 'https://api.nasdaq.com/api/quote/...' -> 'nasdaq.com'
+        """
+        host = urlparse(target).hostname if '//' in target else target.split('/')[0]
+        host = (host or "").lower()
+        return ".".join(host.split('.')[-2:])
+
+##############################################################################
+# method #2
+    @staticmethod
+    def get_session(target):
+        """
+        Return the shared HTMLSession for the site that target (URL or host) lives on.
+        Creates + mounts the pooled session on 1st use. Thread safe.
+        """
+        cmi_debug = __name__+"::"+http_pool.get_session.__name__
+        key = http_pool.site_key(target)
+        with http_pool.reg_lock:
+            s = http_pool.sessions.get(key)
+            if s is None:
+                pc, pm = http_pool.host_sizing.get(key, http_pool.default_sizing)
+                logging.info( f"%s - NEW pooled session: {key} / pools: {pc} / maxsize: {pm}" % cmi_debug )
+                s = HTMLSession()
+                ca = counted_adapter(pool_connections=pc, pool_maxsize=pm)
+                s.mount('https://', ca)
+                s.mount('http://', ca)
+                http_pool.sessions[key] = s
+        return s
+
+##############################################################################
+# method #3
+    @staticmethod
+    def tally(host, reused):
+        """Bump the opened/reused connection counter for host"""
+        with http_pool.stat_lock:
+            hs = http_pool.conn_stats.setdefault(host, {'opened': 0, 'reused': 0})
+            if reused is True:
+                hs['reused'] += 1
+            else:
+                hs['opened'] += 1
+        return
+
+##############################################################################
+# method #4
+    @staticmethod
+    def stats():
+        """Return a snapshot of the per-host counters + overall totals"""
+        with http_pool.stat_lock:
+            snap = {h: dict(v) for h, v in http_pool.conn_stats.items()}
+        opened = sum(v['opened'] for v in snap.values())
+        reused = sum(v['reused'] for v in snap.values())
+        return {'hosts': snap, 'opened': opened, 'reused': reused}
+
+##############################################################################
+# method #5
+    @staticmethod
+    def print_stats():
+        """Print connections OPENED vs REUSED per host"""
+        st = http_pool.stats()
+        print ( f"========== HTTP connection pool : opened vs reused ==========" )
+        for h, v in sorted(st['hosts'].items()):
+            print ( f"{h:32} opened: {v['opened']:4}  reused: {v['reused']:4}" )
+        print ( f"{'Total':32} opened: {st['opened']:4}  reused: {st['reused']:4}" )
+        return
+
+##############################################################################
+# method #6
+    @staticmethod
+    def close_all():
+        """Close every pooled session (drops all keep-alive sockets)"""
+        with http_pool.reg_lock:
+            for s in http_pool.sessions.values():
+                s.close()
+            http_pool.sessions.clear()
+        return
+
+##############################################################################
+# method #7
+    @staticmethod
+    def body_digest(resp):
+        """sha256 hex digest of a responses raw body bytes"""
+        return hashlib.sha256(resp.content).hexdigest()
+
+##############################################################################
+# method #8
+    @staticmethod
+    def cond_get(url, have=None, **kwargs):
+        """
+        Conditional GET for repeatedly polled pages. Re-sends the ETag / Last-Modified validators from
+        the last 2xx response for url (If-None-Match / If-Modified-Since) when the server offered them.
+        have = body digest of the copy of url the caller already holds. Validators are only sent when it
+        matches the recorded digest, so a 304 always means "your copy is still current".
+        Sets resp.body_digest & resp.unchanged (True = 304 Not Modified, or a byte identical body).
+        A 304 comes back as is (empty body) with body_digest = the digest of the caller's copy.
+        """
+        cmi_debug = __name__+"::"+http_pool.cond_get.__name__
+        now = time.time()
+        with http_pool.val_lock:
+            prev = http_pool.validators.get(url)
+            if prev is not None and now - prev['ts'] > http_pool.val_ttl:
+                del http_pool.validators[url]
+                prev = None
+        headers = dict(kwargs.pop('headers', None) or {})
+        if prev is not None and have is not None and have == prev['digest']:
+            if prev['etag'] is not None:
+                headers['If-None-Match'] = prev['etag']
+            if prev['last_mod'] is not None:
+                headers['If-Modified-Since'] = prev['last_mod']
+
+        resp = http_pool.get_session(url).get(url, headers=headers, **kwargs)
+        if resp.status_code == 304:
+            logging.info( f"%s - 304 Not Modified: {url}" % cmi_debug )
+            resp.body_digest = have
+            resp.unchanged = True
+            return resp
+
+        resp.body_digest = http_pool.body_digest(resp)
+        resp.unchanged = prev is not None and prev['digest'] == resp.body_digest
+        logging.info( f"%s - {resp.status_code} digest: {resp.body_digest[:12]} unchanged: {resp.unchanged}" % cmi_debug )
+        if 200 <= resp.status_code < 300:
+            with http_pool.val_lock:
+                http_pool.validators[url] = {'etag': resp.headers.get('ETag'), \
+                                             'last_mod': resp.headers.get('Last-Modified'), \
+                                             'digest': resp.body_digest, \
+                                             'ts': now}
+                http_pool.validators.move_to_end(url)
+                while len(http_pool.validators) > http_pool.val_max:
+                    http_pool.validators.popitem(last=False)
+        return resp
@@ -3,6 +3,9 @@ from bs4 import BeautifulSoup
 import urllib
 import re
 import logging
+from http_pool import http_pool
+from fast_parse import fast_parse
+from bigcharts_md import bc_quote
 
 # logging setup
 logging.basicConfig(level=logging.INFO)
@@ -97,7 +100,7 @@ class mw_quote:
             #s = url.text
             #data_soup = BeautifulSoup(resp.text, "html.parser")
             print ( f" ------------------ BS4.html.parse ---------------------" )
-            data_soup = BeautifulSoup(s, "html.parser")
+            data_soup = fast_parse.soup(s, 'mw_quote')     # fast mode = lxml backend (whole page is used)
             print ( data_soup )
 
         """
@@ -173,16 +176,16 @@ class mw_quote:
         self.symbol = ticker
         url_endpoint = "https://bigcharts.marketwatch.com/quickchart/qsymbinfo.asp?symb="
 
-        with urllib.request.urlopen( f"{url_endpoint}{ticker}" ) as url:
-            s = url.read()
-            data_soup = BeautifulSoup(s, "html.parser")
+        qq_url = f"{url_endpoint}{ticker}"
+        with http_pool.get_session(qq_url).get( qq_url, timeout=5 ) as url:      # pooled keep-alive session (was 1 urlopen per call)
+            s = url.content
+            data_soup = fast_parse.soup(s, 'bc_quick')     # same bigcharts qsymbinfo page as bc_quote
             qq_head = data_soup.find("h1", attrs={"class": "quote"} )
             qq_head_co = qq_head.find_all('div')[0]
             qq_head_data = qq_head.find_all('div')[3]
             qquote_table = data_soup.find("table", attrs={"id": "quote"} )
             qfin_table = data_soup.find("table", attrs={"class": "financials"} )
 
-            url.close()
             quote_data = qquote_table.find_all("td")
             fin_data = qfin_table.find_all("td")
 
@@ -221,6 +224,14 @@ class mw_quote:
                     self.quote[self.qlabels[k]] = clean2        # add to quote DICT
         return
 
+    def get_quotes(self, symbols, workers=8):
+        """
+        Batch quick quote many symbols. get_quickquote() reads the bigcharts qsymbinfo page, so this hands the
+        list to bc_quote.get_quotes() (concurrent pooled fetch, per worker scrape into its own dict)
+        return : DataFrame, 1 row per symbol (index = symbol) & 1 column per quote field
+        """
+        return bc_quote(self.inst_uid, self.args).get_quotes(symbols, quick=True, workers=workers)
+
     def q_polish(self):
         """This method curates & polishes a few data elements in the quote DICT
         that need additinoal treatement after the inital build-out. It also
@@ -0,0 +1,108 @@
+#! python3
+import re
+import numpy as np
+import pandas as pd
+import logging
+
+# logging setup
+logging.basicConfig(level=logging.INFO)
+
+#####################################################
+
+class md_clean:
+    """
+    Vectorized market data string cleaning. Every method takes a whole column (list, NumPy array
+    or pandas Series of raw scraped strings) and cleans it in 1 call, using pandas .str / to_numeric
+    ops instead of a python regex per cell. Used by the screeners (screen_table), un_volumes & nq_wrangler.
+    Unparseable cells & sentinels (N/A, UNCH, '', --) come back as NaN, so callers pick their own fill.
+    """
+
+    # global accessors
+    sentinels = ['N/A', 'UNCH', '', '--', '-']      # placeholder strings that mean "no data"
+    scales = {'K': 1e3, 'M': 1e6, 'B': 1e9, 'T': 1e12}
+    scale_rx = r'^\s*([-+]?[\d,]*\.?\d+)\s*([KMBT]?)\s*$'
+    quote_rx = r'[\'"]'
+
+######################################################################
+# method 1
+    @staticmethod
+    def series(col):
+        """Any array-like -> pandas Series of str (None / NaN become '')"""
+        s = col if isinstance(col, pd.Series) else pd.Series(list(col) if not isinstance(col, np.ndarray) else col, dtype=object)
+        return s.fillna('').astype(str).str.strip()
+
+    @staticmethod
+    def sentinel_nan(col, extra=()):
+        """Replace sentinel strings (+ any extra) with NaN"""
+        s = md_clean.series(col)
+        return s.mask(s.isin(md_clean.sentinels + list(extra)))
+
+######################################################################
+# method 2
+    @staticmethod
+    def to_float(col, strip=" $,", unsigned=False):
+        """
+        '$1,234.50' / '-0.25' / 'N/A' -> 1234.5 / -0.25 / NaN
+        strip : chars removed before casting. unsigned=True also drops the +/- sign (magnitude only)
+        """
+        chars = strip + ("+-" if unsigned else "")
+        s = md_clean.sentinel_nan(col)
+        if chars:
+            s = s.str.replace(f"[{re.escape(chars)}]", "", regex=True)
+        return pd.to_numeric(s, errors='coerce').astype(np.float64)
+
+    @staticmethod
+    def percent(col, unsigned=False):
+        """ '+1.35%' / '(-2.1%)' / 'UNCH' -> 1.35 / -2.1 / NaN  (still in percent units)"""
+        return md_clean.to_float(col, strip=" %(),", unsigned=unsigned)
+
+    @staticmethod
+    def sign(col):
+        """Sign extraction : leading '-' -> -1, leading '+' or a bare number -> +1, sentinel -> 0"""
+        s = md_clean.sentinel_nan(col)
+        out = np.where(s.str.startswith('-', na=False), -1, 1)
+        return pd.Series(np.where(s.isna(), 0, out), index=s.index, dtype=np.int8)
+
+######################################################################
+# method 3
+    @staticmethod
+    def scale_suffix(col, keep=('M', 'B', 'T')):
+        """
+        Split suffix scaled numbers. '15.753B' -> (15.753, 'B') / '812.4M' -> (812.4, 'M')
+        keep : suffixes accepted. Anything else (N/A, unscaled, junk) -> (NaN, '')
+        return : (mantissa float Series, suffix str Series)
+        """
+        parts = md_clean.series(col).str.extract(md_clean.scale_rx)
+        ok = parts[1].isin(keep)
+        mant = pd.to_numeric(parts[0].str.replace(",", "", regex=False), errors='coerce').where(ok)
+        return mant.astype(np.float64), parts[1].where(ok, '')
+
+    @staticmethod
+    def scaled(col):
+        """Suffix scaled numbers -> absolute values. '70.25k' / '1.2M' / '61,447' -> 70250.0 / 1200000.0 / 61447.0"""
+        parts = md_clean.series(col).str.upper().str.extract(md_clean.scale_rx)
+        mant = pd.to_numeric(parts[0].str.replace(",", "", regex=False), errors='coerce')
+        return (mant * parts[1].map(md_clean.scales).fillna(1.0)).astype(np.float64)
+
+    @staticmethod
+    def scale_down(col, keep=('M', 'B', 'T')):
+        """
+        Inverse of scaled(), for raw numeric JSON values. 15753000000 -> (15.753, 'B')
+        Values below the smallest kept scale, or NaN -> (NaN, '')
+        return : (mantissa float Series rounded to 3 dp, suffix str Series)
+        """
+        v = pd.to_numeric(pd.Series(list(col), dtype=object), errors='coerce').astype(np.float64)
+        mant = pd.Series(np.nan, index=v.index)
+        suffix = pd.Series('', index=v.index, dtype=object)
+        for s in sorted(keep, key=md_clean.scales.get):        # ascending, so the largest fitting scale wins
+            hit = v.abs() >= md_clean.scales[s]
+            mant = mant.mask(hit, (v / md_clean.scales[s]).round(3))
+            suffix = suffix.mask(hit, s)
+        return mant, suffix
+
+######################################################################
+# method 4
+    @staticmethod
+    def pad_name(col, width):
+        """Strip quote chars & left justify to width (replaces np.char.ljust + array2string per cell)"""
+        return md_clean.series(col).str.replace(md_clean.quote_rx, "", regex=True).str.ljust(width)
@@ -0,0 +1,107 @@
+"""
+This module contains the CPU inference backends for the sentiment analysis model.
+
+torch : the loaded model, fp32 eager PyTorch (SentimentAnalysisModel default, no wrapper)
+int8  : torch dynamic int8 quantization of every nn.Linear layer
+onnx  : the model exported to an ONNX graph and run through onnxruntime (optional dependency)
+"""
+import os
+import copy
+
+import torch
+
+BACKENDS = ('torch', 'int8', 'onnx')
+
+# Short financial news style sentences used to check a backend's labels against fp32
+PARITY_CORPUS = [
+    "Shares surged 12% after the company raised its full-year revenue guidance.",
+    "The firm reported a quarterly loss and withdrew its outlook for the year.",
+    "The board declared a regular quarterly dividend of $0.25 per share.",
+    "Analysts downgraded the stock to sell, citing weakening demand in China.",
+    "Record deliveries pushed operating margin to its highest level in five years.",
+    "The retailer will close 150 stores and cut 2,000 jobs as sales keep falling.",
+    "The annual shareholder meeting will be held on May 14 in Delaware.",
+    "Net income more than doubled on strong growth in cloud subscriptions.",
+    "Regulators opened an investigation into the bank's lending practices.",
+    "The company completed the previously announced acquisition for $1.2 billion in cash.",
+    "Free cash flow turned negative and debt rose to a record high.",
+    "The chipmaker beat earnings estimates and announced a $10 billion buyback.",
+    "Trading volume was in line with the 30-day average.",
+    "The airline warned that fuel costs will squeeze profits for the rest of the year.",
+    "Orders for the new product line exceeded expectations in every region.",
+    "The drugmaker's late-stage trial failed to meet its primary endpoint.",
+    "The company will report second quarter results after the market close on Tuesday.",
+    "Rising defaults forced the lender to triple its loan loss provisions.",
+    "Same-store sales grew 8%, well ahead of the 3% analysts expected.",
+    "The stock was little changed as investors awaited the Fed decision.",
+]
+
+
+class Int8Backend:
+    """
+    Dynamic int8 quantization (weights int8, activations quantized on the fly) of a CPU model.
+    """
+    name = 'int8'
+
+    def __init__(self, model: torch.nn.Module, device: str):
+        if device != 'cpu':
+            raise ValueError("The int8 backend only runs on cpu.")
+        self.model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        self.model.eval()
+
+    def __call__(self, tokens: dict) -> torch.Tensor:
+        with torch.no_grad():
+            return self.model(**tokens).logits
+
+
+class OnnxBackend:
+    """
+    The model exported once to an ONNX graph (cached on disk) and run with onnxruntime on cpu.
+    """
+    name = 'onnx'
+    default_path = os.path.expanduser("~/.cache/aop/finbert.onnx")
+
+    def __init__(self, model: torch.nn.Module, tokenizer, path: str = None):
+        try:
+            import onnxruntime
+        except ImportError as e:
+            raise ImportError("The onnx backend needs the onnxruntime package (pip install onnxruntime).") from e
+        self.path = path or self.default_path
+        if not os.path.exists(self.path):
+            self.export(model, tokenizer, self.path)
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = onnxruntime.InferenceSession(self.path, options, providers=['CPUExecutionProvider'])
+        self.input_names = [i.name for i in self.session.get_inputs()]
+
+    @staticmethod
+    def export(model: torch.nn.Module, tokenizer, path: str) -> None:
+        """
+        Exports the model with dynamic batch and sequence axes.
+        A cpu copy is exported, the caller's model (shared, maybe on cuda) is left as is.
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        sample = tokenizer(["export sample text"], return_tensors='pt')
+        names = list(sample.keys())
+        axes = {name: {0: 'batch', 1: 'sequence'} for name in names}
+        axes['logits'] = {0: 'batch'}
+        export_model = copy.deepcopy(model).cpu().eval()
+        torch.onnx.export(export_model, (), path, kwargs=dict(sample), input_names=names, output_names=['logits'],
+                          dynamic_axes=axes, opset_version=17, dynamo=False)
+
+    def __call__(self, tokens: dict) -> torch.Tensor:
+        feed = {name: tokens[name].cpu().numpy() for name in self.input_names}
+        return torch.from_numpy(self.session.run(['logits'], feed)[0])
+
+
+def make_backend(name: str, model: torch.nn.Module, tokenizer, device: str):
+    """
+    Backend callable (tokens -> logits) for a backend name. None for 'torch' (use the model directly).
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown sentiment backend '{name}'. Choose from {BACKENDS}.")
+    if name == 'int8':
+        return Int8Backend(model, device)
+    if name == 'onnx':
+        return OnnxBackend(model, tokenizer)
+    return None
@@ -89,22 +89,25 @@ class ml_nlpreader:
         logging.info( f'%s   - IN.#{self.yti}' % cmi_debug )
         news_symbol = str(self.args['newsymbol'])       # symbol provided on CMDLine
         
-        ml_yfn_reader = y_cookiemonster(3)
         ml_yfn_dataset = yfnews_reader(1, news_symbol, self.args )
-        ml_yfn_dataset.init_dummy_session()       # setup cookie jar and headers
         #self.yfn = yfnews_reader(1, news_symbol, self.args )  # create instance of YFN News reader
         #self.yfn.init_dummy_session('finance.yahoo.com/markets/stocks/most-active/')
         
         # old : hpath = '/quote/' + news_symbol + '/news?p=' + news_symbol
         ml_yfn_dataset.form_endpoint(news_symbol)
-        hpath = 'finance.yahoo.com/quote/' + news_symbol + '/news/'
-        ml_yfn_dataset.ext_req = ml_yfn_reader.get_js_data(hpath)   # returns HTMLSession() resp object        
-        logging.info( f"%s - ext_req: {type(ml_yfn_dataset.ext_req)} : {ml_yfn_dataset.ext_req.url}" % cmi_debug )
-        
-        #self.yfn.update_headers(hpath)
-        #self.yfn.update_cookies()
         self.ml_yfn_dataset = ml_yfn_dataset                # set global access to the YFN News reader instance
-        hash_state = ml_yfn_dataset.ext_do_js_get(0)        # get() & process the page JS data
+        hash_state = ml_yfn_dataset.yfn_jsdb.hash_url(ml_yfn_dataset.yfqnews_url)
+        if hash_state in ml_yfn_dataset.yfn_jsdb:           # fresh news feed in page cache. No network, no JS render
+            logging.info( f"%s - news feed served from page cache: {hash_state}" % cmi_debug )
+        else:
+            ml_yfn_reader = y_cookiemonster(3)
+            ml_yfn_dataset.init_dummy_session()       # setup cookie jar and headers
+            hpath = 'finance.yahoo.com/quote/' + news_symbol + '/news/'
+            ml_yfn_dataset.ext_req = ml_yfn_reader.get_js_data(hpath)   # returns HTMLSession() resp object        
+            logging.info( f"%s - ext_req: {type(ml_yfn_dataset.ext_req)} : {ml_yfn_dataset.ext_req.url}" % cmi_debug )
+            #self.yfn.update_headers(hpath)
+            #self.yfn.update_cookies()
+            hash_state = ml_yfn_dataset.ext_do_js_get(0)    # get() & process the page JS data
         
         logging.info( f"%s - globalize url_hinter: [ 1 ]" % cmi_debug )
         self.yfn_uh = url_hinter(1, self.args)              # create instance of urh hinter
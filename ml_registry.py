@@ -0,0 +1,155 @@
+"""
+This module contains the process-wide registry of loaded sentiment models.
+
+Importing it is cheap: torch, transformers and ml_sentiment are only imported
+the first time a model is requested, so commands that never score sentiment
+never pay for them.
+"""
+import os
+import logging
+import threading
+from typing import Optional
+
+logging.basicConfig(level=logging.INFO)
+
+
+class SharedSentimentModel:
+    """
+    Thread-safe handle on one shared SentimentAnalysisModel.
+
+    Inference and backend switches are serialized with a lock (the fast
+    tokenizers are not safe for concurrent calls). Every other attribute is
+    read straight from the wrapped model.
+    """
+
+    def __init__(self, model):
+        self._model = model
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name):
+        return getattr(self._model, name)
+
+    def predict_sentiment(self, text: str) -> dict:
+        with self._lock:
+            return self._model.predict_sentiment(text)
+
+    def bulk_predict_sentiment(self, texts: list[str]) -> list[dict]:
+        with self._lock:
+            return self._model.bulk_predict_sentiment(texts)
+
+    def predict(self, texts) -> list[float]:
+        with self._lock:
+            return self._model.predict(texts)
+
+    def predict_stream(self, texts, token_budget: int = None, window: int = None, with_tokens: bool = False):
+        """
+        Holds the lock while each result is produced, not for the life of the generator.
+        """
+        stream = self._model.predict_stream(texts, token_budget=token_budget, window=window, with_tokens=with_tokens)
+        while True:
+            with self._lock:
+                try:
+                    result = next(stream)
+                except StopIteration:
+                    return
+            yield result
+
+    def set_backend(self, name: str) -> None:
+        with self._lock:
+            self._model.set_backend(name)
+
+    def parity_check(self, corpus: Optional[list[str]] = None) -> dict:
+        with self._lock:
+            return self._model.parity_check(corpus)
+
+
+class ModelRegistry:
+    """
+    Lazily loads each sentiment model once per process and hands out a shared handle.
+    """
+    models = {}             # model name -> SharedSentimentModel
+    lock = threading.Lock()
+    num_threads = None      # torch intra-op threads. Default: $AOP_TORCH_THREADS, else torch's own default
+    interop_threads = None  # torch inter-op threads. Default: $AOP_TORCH_INTEROP, else torch's own default
+    warmup = False          # run one small batch right after loading
+    warmup_texts = ["Shares rose after the company beat earnings estimates."] * 4
+
+    @classmethod
+    def configure(cls, num_threads: Optional[int] = None, interop_threads: Optional[int] = None,
+                  warmup: Optional[bool] = None) -> None:
+        """
+        Sets the torch thread counts and warm-up used by the next model load.
+        Thread counts are applied immediately if torch is already imported.
+        """
+        if num_threads is not None:
+            cls.num_threads = num_threads
+        if interop_threads is not None:
+            cls.interop_threads = interop_threads
+        if warmup is not None:
+            cls.warmup = warmup
+        if cls.models:
+            cls._apply_threads()
+
+    @classmethod
+    def _apply_threads(cls) -> None:
+        import torch
+        num_threads = cls.num_threads or int(os.environ.get('AOP_TORCH_THREADS', 0))
+        interop_threads = cls.interop_threads or int(os.environ.get('AOP_TORCH_INTEROP', 0))
+        if num_threads:
+            torch.set_num_threads(num_threads)
+        if interop_threads:
+            try:
+                torch.set_interop_threads(interop_threads)
+            except RuntimeError:
+                # torch only accepts this before its first parallel op
+                logging.info(f"{__name__} - inter-op threads already fixed at {torch.get_num_interop_threads()}")
+
+    @classmethod
+    def get(cls, model_name: str = 'ProsusAI/finbert', backend: Optional[str] = None,
+            cache=None) -> SharedSentimentModel:
+        """
+        Shared handle on model_name, loading it on first use.
+        backend: switches the shared model's backend if given and different.
+        cache: InferenceCache to attach if the model has none yet.
+        """
+        with cls.lock:
+            handle = cls.models.get(model_name)
+            if handle is None:
+                cls._apply_threads()
+                from ml_sentiment import SentimentAnalysisModel
+                logging.info(f"{__name__} - loading {model_name}")
+                handle = SharedSentimentModel(SentimentAnalysisModel(model_name, cache=cache, backend=backend))
+                if cls.warmup:
+                    cls._warm(handle._model)
+                cls.models[model_name] = handle
+                return handle
+        if backend is not None and backend != handle.backend:
+            logging.info(f"{__name__} - {model_name} backend {handle.backend} -> {backend}")
+            handle.set_backend(backend)
+        if cache is not None and handle.cache is None:
+            handle._model.cache = cache
+        return handle
+
+    @classmethod
+    def _warm(cls, model) -> None:
+        """
+        One batch straight through the backend. Bypasses the inference cache, so the
+        warm-up really runs every time and never writes into the user's cache.
+        """
+        tokens = model.tokenizer(cls.warmup_texts, return_tensors='pt', padding=True, truncation=True)
+        model._classify(tokens)
+
+    @classmethod
+    def loaded(cls) -> list[str]:
+        """
+        Names of the models loaded in this process.
+        """
+        return list(cls.models)
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Drops every shared model (the next get() loads again).
+        """
+        with cls.lock:
+            cls.models.clear()
@@ -0,0 +1,186 @@
+#! python3
+import logging
+import pandas as pd
+
+# logging setup
+logging.basicConfig(level=logging.INFO)
+
+#####################################################
+
+class ml_sentbatch:
+    """
+    Cross article batched sentiment stage for the news loop (aop.py -n)
+    Collects the <p> paragraphs of every viable ml_ingest article 1st, then runs all of them through the
+    sentiment model in large batches (SentimentAnalysisModel.predict_stream, or bulk_predict_sentiment in
+    batch_size chunks) instead of 1 tiny model call per article. Results are scattered back to per
+    paragraph sen_df0 rows keyed by urlhash, rolled up per article by final_df() & into 1 symbol verdict
+    (sen_df3) by compute_precise_sentiment().
+    """
+
+    # global accessors
+    batch_size = 64             # texts per model call
+    sen_cols = [ 'art', 'urlhash', 'para', 'snt', 'rnk' ]
+    labels = ( 'positive', 'neutral', 'negative' )
+    final_cols = [ 'art', 'urlhash', 'positive', 'neutral', 'negative', 'psnt', 'nsnt', 'zsnt' ]
+    totals_agg = { 'art': 'nunique', 'urlhash': 'nunique', 'positive': 'sum', 'neutral': 'sum', 'negative': 'sum', \
+                   'psnt': 'mean', 'nsnt': 'mean', 'zsnt': 'mean' }
+    sen3_cols = [ 'Symbol', 'Sentiment', 'Ratio', 'P_pct', 'P_cat', 'P_score', 'N_pct', 'N_cat', 'N_score', 'P_mean', 'N_mean', 'Z_mean' ]
+    # % of all scored paragraphs -> (category, score). 1st band the pct reaches wins
+    pct_bands = ( (60.0, 'Dominant', 5), (45.0, 'Strong', 4), (30.0, 'Moderate', 3), (15.0, 'Weak', 2), (0.0001, 'Trace', 1), (0.0, 'None', 0) )
+    bull_ratio = 1.5            # pos/neg paragraph ratio at or above = Bullish
+    bear_ratio = 0.67           # at or below = Bearish. In between = Neutral
+
+    def __init__(self, yti, global_args, model):
+        """
+        model : anything with bulk_predict_sentiment(list of str) -> [{'label', 'score'}] (SentimentAnalysisModel)
+        """
+        cmi_debug = __name__+"::"+self.__init__.__name__
+        logging.info( f'%s - Instantiate.#{yti}' % cmi_debug )
+        self.args = global_args
+        self.yti = yti
+        self.model = model
+        self.pending = []                       # (art, urlhash, para #, text) waiting for the next run()
+        self.articles = {}                      # urlhash -> {'art', 'symbol', 'words', 'paras', 'tokens'}
+        self.sen_df0 = pd.DataFrame(columns=self.sen_cols)
+        self.sentiment_count = dict.fromkeys(self.labels, 0)
+        self.sen_df3 = pd.DataFrame(columns=self.sen3_cols)   # final per symbol sentiment. See compute_precise_sentiment()
+        self.active_urlhash = None
+        return
+
+######################################################################
+# method 1
+    def add(self, symbol, item_idx, paragraphs, urlhash):
+        """
+        Queue 1 article's paragraphs (BS4 <p> tags, stream_p or plain str). Nothing is scored yet
+        return : (num of paragraphs queued, num of words)
+        """
+        cmi_debug = __name__+"::"+self.add.__name__+".#"+str(self.yti)
+        words = paras = 0
+        for p in paragraphs:
+            text = p.get_text() if hasattr(p, 'get_text') else str(p)
+            text = text.strip()
+            if not text:
+                continue
+            self.pending.append( (item_idx, urlhash, paras, text) )
+            words += len(text.split())
+            paras += 1
+        self.articles[urlhash] = {'art': item_idx, 'symbol': symbol, 'words': words, 'paras': paras, 'tokens': 0}
+        self.active_urlhash = urlhash
+        logging.info( f'%s - queued article {item_idx} : {paras} paragraphs / {len(self.pending)} pending' % cmi_debug )
+        return paras, words
+
+######################################################################
+# method 2
+    def run(self):
+        """
+        Score every pending paragraph of every queued article in 1 batched pass
+        Appends 1 sen_df0 row per paragraph : art / urlhash / para # / snt (label) / rnk (score)
+        return : num of paragraphs scored
+        """
+        cmi_debug = __name__+"::"+self.run.__name__+".#"+str(self.yti)
+        pending, self.pending = self.pending, []
+        if not pending:
+            return 0
+        texts = [p[3] for p in pending]
+        if hasattr(self.model, 'predict_stream'):       # length bucketed, token budget micro-batches
+            preds = list(self.model.predict_stream(texts, with_tokens=True))
+        else:
+            preds = []
+            for i in range(0, len(texts), self.batch_size):
+                preds.extend(self.model.bulk_predict_sentiment(texts[i:i + self.batch_size]))
+        for p, r in zip(pending, preds):        # token stats for the news loop summary. Counted by the model, cache hits = 0
+            self.articles[p[1]]['tokens'] += r.get('tokens', 0)
+
+        rows = pd.DataFrame( { 'art': [p[0] for p in pending], \
+                               'urlhash': [p[1] for p in pending], \
+                               'para': [p[2] for p in pending], \
+                               'snt': [str(r['label']).lower() for r in preds], \
+                               'rnk': [float(r['score']) for r in preds] }, columns=self.sen_cols )
+        self.sen_df0 = rows if self.sen_df0.empty else pd.concat([self.sen_df0, rows], ignore_index=True)
+        logging.info( f'%s - scored {len(texts)} paragraphs from {rows["urlhash"].nunique()} articles' % cmi_debug )
+        return len(texts)
+
+######################################################################
+# method 3
+    def counts(self, urlhash):
+        """pos/neu/neg paragraph counts of 1 scored article. Also set as sentiment_count (old per article API)"""
+        c = self.sen_df0.loc[self.sen_df0['urlhash'] == urlhash, 'snt'].value_counts()
+        self.sentiment_count = {k: int(c.get(k, 0)) for k in self.labels}
+        self.active_urlhash = urlhash
+        return self.sentiment_count
+
+    def compute_sentiment(self, symbol, item_idx, paragraphs, urlhash):
+        """
+        Per article API (yfnews_reader.extract_article_data). Queue + score this 1 article right away
+        return : (total tokens, total words, total paragraphs)
+        """
+        paras, words = self.add(symbol, item_idx, paragraphs, urlhash)
+        self.run()
+        self.counts(urlhash)
+        return self.articles[urlhash]['tokens'], words, paras
+
+######################################################################
+# method 4
+    def means(self, urlhash):
+        """
+        Mean model score of each label over 1 scored article. A label the article never got is 0.0
+        return : {'psnt', 'nsnt', 'zsnt'}
+        """
+        m = self.sen_df0.loc[self.sen_df0['urlhash'] == urlhash].groupby('snt')['rnk'].mean()
+        return {'psnt': float(m.get('positive', 0.0)), 'nsnt': float(m.get('negative', 0.0)), 'zsnt': float(m.get('neutral', 0.0))}
+
+    def final_df(self):
+        """
+        1 row per scored article (pos/neu/neg paragraph counts + mean scores) & a 'Totals' row
+        return : DataFrame with final_cols (the aop.py -n article stats table)
+        """
+        rows = []
+        for urlhash, a in self.articles.items():
+            c = self.counts(urlhash)
+            rows.append({'art': a['art'], 'urlhash': urlhash, **c, **self.means(urlhash)})
+        final_sent_df = pd.DataFrame(rows, columns=self.final_cols)
+        totals_df = pd.DataFrame(final_sent_df.agg(self.totals_agg)).T.fillna(0.0)
+        totals_df.index = ['Totals']
+        totals_df['urlhash'] = ''
+        final_sent_df['art'] = final_sent_df['art'].astype(object)
+        return totals_df if final_sent_df.empty else pd.concat([final_sent_df, totals_df])
+
+######################################################################
+# method 5
+    def compute_precise_sentiment(self, symbol, df_final, positive_c, negative_c, positive_t, negative_t, neutral_t):
+        """
+        Final sentiment of 1 symbol from its final_df() totals
+        positive_c / negative_c : paragraph counts. positive_t / negative_t / neutral_t : mean scores
+        Sets sen_df3 (1 row, sen3_cols. db_graph.create_sym_node() stores it on the Symbol node)
+        return : dict of the sen_df3 row
+        """
+        cmi_debug = __name__+"::"+self.compute_precise_sentiment.__name__+".#"+str(self.yti)
+        neutral_c = df_final.iloc[-1]['neutral']
+        total = positive_c + negative_c + neutral_c
+        p_pct = round(100.0 * positive_c / total, 2) if total else 0.0
+        n_pct = round(100.0 * negative_c / total, 2) if total else 0.0
+        p_cat, p_score = self.band(p_pct)
+        n_cat, n_score = self.band(n_pct)
+        ratio = round(positive_c / negative_c, 2) if negative_c else float(positive_c)
+        if total == 0 or positive_c == negative_c:
+            sentiment = 'Neutral'
+        elif negative_c == 0 or ratio >= self.bull_ratio:
+            sentiment = 'Bullish'
+        elif ratio <= self.bear_ratio:
+            sentiment = 'Bearish'
+        else:
+            sentiment = 'Neutral'
+        res = {'Symbol': symbol, 'Sentiment': sentiment, 'Ratio': ratio, \
+               'P_pct': p_pct, 'P_cat': p_cat, 'P_score': p_score, \
+               'N_pct': n_pct, 'N_cat': n_cat, 'N_score': n_score, \
+               'P_mean': round(float(positive_t), 4), 'N_mean': round(float(negative_t), 4), 'Z_mean': round(float(neutral_t), 4)}
+        self.sen_df3 = pd.DataFrame([res], columns=self.sen3_cols)
+        logging.info( f'%s - {symbol} : {sentiment} / ratio: {ratio} / pos: {p_pct} pct / neg: {n_pct} pct' % cmi_debug )
+        return res
+
+    def band(self, pct):
+        """pct of paragraphs -> (category, score) from pct_bands"""
+        for floor, cat, score in self.pct_bands:
+            if pct >= floor:
+                return cat, score
+        return self.pct_bands[-1][1], self.pct_bands[-1][2]
@@ -0,0 +1,125 @@
+"""
+This module contains a persistent result cache for sentiment model inference.
+"""
+import os
+import re
+import time
+import array
+import hashlib
+import sqlite3
+import threading
+from typing import Optional
+
+
+class InferenceCache:
+    """
+    SQLite backed cache of sentiment predictions.
+
+    Keys are (model id, sha256 of the whitespace normalized text). Values are the
+    predicted label, its score and the raw logits. Rows carry a last-used time and
+    the least recently used rows are evicted once the cache grows past max_rows.
+    """
+    default_path = os.path.expanduser("~/.cache/aop/sentiment.sqlite")
+    max_rows = 500_000
+    evict_to = 0.9          # evict down to this fraction of max_rows
+    space_rx = re.compile(r'\s+')
+
+    def __init__(self, path: Optional[str] = None, max_rows: Optional[int] = None):
+        """
+        Opens (or creates) the cache database. path=':memory:' keeps it in process.
+        """
+        self.path = path or self.default_path
+        if max_rows is not None:
+            self.max_rows = max_rows
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(self.path, check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " model TEXT NOT NULL, key TEXT NOT NULL, label TEXT NOT NULL, score REAL NOT NULL,"
+            " logits BLOB, used REAL NOT NULL, PRIMARY KEY (model, key)) WITHOUT ROWID")
+        self.db.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+        self.db.commit()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def text_key(cls, text: str) -> str:
+        """
+        Hash of the text with runs of whitespace collapsed and the ends stripped.
+        """
+        return hashlib.sha256(cls.space_rx.sub(' ', text).strip().encode('utf-8')).hexdigest()
+
+    def get_many(self, model_id: str, texts: list[str]) -> list[Optional[dict]]:
+        """
+        Cached prediction per text ({'label', 'score', 'logits'}), None on a miss.
+        """
+        keys = [self.text_key(t) for t in texts]
+        found = {}
+        with self.lock:
+            for i in range(0, len(keys), 500):
+                part = list(set(keys[i:i + 500]))
+                rows = self.db.execute(
+                    f"SELECT key, label, score, logits FROM results WHERE model = ? AND key IN ({','.join('?' * len(part))})",
+                    [model_id, *part]).fetchall()
+                found.update({k: (label, score, logits) for k, label, score, logits in rows})
+            if found:
+                self.db.executemany("UPDATE results SET used = ? WHERE model = ? AND key = ?",
+                                    [(time.time(), model_id, k) for k in found])
+                self.db.commit()
+        results = []
+        for k in keys:
+            row = found.get(k)
+            if row is None:
+                self.misses += 1
+                results.append(None)
+            else:
+                self.hits += 1
+                logits = array.array('f', row[2]).tolist() if row[2] is not None else None
+                results.append({'label': row[0], 'score': row[1], 'logits': logits})
+        return results
+
+    def put_many(self, model_id: str, texts: list[str], results: list[dict]) -> None:
+        """
+        Stores fresh predictions, then evicts the least recently used rows if over max_rows.
+        """
+        now = time.time()
+        rows = []
+        for text, result in zip(texts, results):
+            logits = result.get('logits')
+            blob = array.array('f', logits).tobytes() if logits is not None else None
+            rows.append((model_id, self.text_key(text), result['label'], float(result['score']), blob, now))
+        with self.lock:
+            self.db.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self.db.commit()
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        LRU eviction. Caller holds the lock.
+        """
+        count = self.db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        if count <= self.max_rows:
+            return
+        drop = count - int(self.max_rows * self.evict_to)
+        self.db.execute(
+            "DELETE FROM results WHERE (model, key) IN (SELECT model, key FROM results ORDER BY used LIMIT ?)", (drop,))
+        self.db.commit()
+        self.evictions += drop
+
+    def stats(self) -> dict:
+        """
+        Hit/miss counters of this process and the number of stored rows.
+        """
+        with self.lock:
+            rows = self.db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'rows': rows,
+            'evictions': self.evictions,
+        }
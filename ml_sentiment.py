@@ -2,16 +2,31 @@
 This module contains the implementation for the sentiment analysis model
 and related utility functions.
 """
+import os
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
 import torch
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
 
+from ml_backends import PARITY_CORPUS, make_backend
+from ml_sentcache import InferenceCache
+
+LABEL_TO_VALUE = {'POSITIVE': 1, 'NEGATIVE': -1, 'NEUTRAL': 0}
+
 class SentimentAnalysisModel:
     """
     A class to encapsulate the sentiment analysis model.
     """
-    def __init__(self, model_name: str = 'ProsusAI/finbert'):
+    token_budget = 8192     # max padded tokens (batch rows * longest row) per predict_stream() micro-batch
+    stream_window = 1024    # texts read from the input iterable & length sorted together
+
+    def __init__(self, model_name: str = 'ProsusAI/finbert', cache: Optional[InferenceCache] = None,
+                 backend: Optional[str] = None):
         """
         Initializes and loads the sentiment analysis model and tokenizer.
+        cache: optional InferenceCache. Texts already scored by this model skip inference.
+        backend: 'torch' (fp32), 'int8' or 'onnx'. Default: $AOP_SENTIMENT_BACKEND, else 'torch'.
         """
         if model_name != 'ProsusAI/finbert':
             raise ValueError("Only 'ProsusAI/finbert' model is allowed.")
@@ -19,25 +34,43 @@ class SentimentAnalysisModel:
         self.tokenizer = AutoTokenizer.from_pretrained(model_name)
         self.model = AutoModelForSequenceClassification.from_pretrained(model_name)
         self.model.to(self.device)
+        self.model_name = model_name
+        self.cache = cache
+        self.set_backend(backend or os.environ.get('AOP_SENTIMENT_BACKEND', 'torch'))
 
-    def predict_sentiment(self, text: str) -> dict:
+    def set_backend(self, name: str) -> None:
         """
-        Predicts the sentiment of a single text string.
+        Switches the inference backend. The fp32 model stays loaded as the parity reference.
+        Cached results are kept per backend (the backend is part of the cache model id).
         """
-        tokens = self.tokenizer(text, return_tensors='pt', padding=True, truncation=True)
-        tokens = {key: val.to(self.device) for key, val in tokens.items()}
+        self.runner = make_backend(name, self.model, self.tokenizer, self.device)
+        self.backend = name
+        self.model_id = self.model_name if name == 'torch' else f"{self.model_name}#{name}"
 
-        with torch.no_grad():
-            outputs = self.model(**tokens)
-            logits = outputs.logits
+    def parity_check(self, corpus: Optional[list[str]] = None) -> dict:
+        """
+        Compares the active backend's labels with fp32 torch labels on a fixture corpus.
+        Returns the label agreement ratio and the texts whose labels differ.
+        """
+        corpus = corpus or PARITY_CORPUS
+        tokens = self.tokenizer(corpus, return_tensors='pt', padding=True, truncation=True)
+        reference = self._classify(tokens, runner=None)
+        active = self._classify(tokens)
+        mismatches = [text for text, ref, got in zip(corpus, reference, active) if ref['label'] != got['label']]
+        return {
+            'backend': self.backend,
+            'agreement': 1.0 - len(mismatches) / len(corpus),
+            'mismatches': mismatches,
+        }
 
-        probabilities = torch.nn.functional.softmax(logits, dim=-1)
-        prediction_idx = torch.argmax(probabilities, dim=-1).item()
-        
-        score = probabilities[0, prediction_idx].item()
-        label = self.model.config.id2label[prediction_idx]
+    def predict_sentiment(self, text: str) -> dict:
+        """
+        Predicts the sentiment of a single text string.
+        """
+        def infer(texts):
+            return self._classify(self.tokenizer(texts[0], return_tensors='pt', padding=True, truncation=True))
 
-        return {'label': label, 'score': score}
+        return self._cached([text], infer)[0]
 
     def bulk_predict_sentiment(self, texts: list[str]) -> list[dict]:
         """
@@ -45,21 +78,102 @@ class SentimentAnalysisModel:
         """
         if len(texts) > 1000:
             raise ValueError("Cannot process more than 1000 texts at a time.")
-        tokens = self.tokenizer(texts, return_tensors='pt', padding=True, truncation=True)
-        tokens = {key: val.to(self.device) for key, val in tokens.items()}
 
-        with torch.no_grad():
-            outputs = self.model(**tokens)
-            logits = outputs.logits
+        def infer(misses):
+            return self._classify(self.tokenizer(misses, return_tensors='pt', padding=True, truncation=True))
 
-        probabilities = torch.nn.functional.softmax(logits, dim=-1)
-        prediction_indices = torch.argmax(probabilities, dim=-1)
+        return self._cached(texts, infer)
+
+    def predict_stream(self, texts: Iterable[str], token_budget: int = None,
+                       window: int = None, with_tokens: bool = False) -> Iterator[dict]:
+        """
+        Streams sentiment predictions for an unbounded iterable of text strings.
 
-        scores = probabilities.gather(1, prediction_indices.unsqueeze(1)).squeeze().tolist()
-        labels = [self.model.config.id2label[idx.item()] for idx in prediction_indices]
+        Texts are read in windows, tokenized once without padding and sorted by
+        token length. Each micro-batch holds similar length texts and at most
+        token_budget padded tokens, so one long text never pads a whole batch.
+        Results are yielded in input order. with_tokens adds each text's token
+        count as 'tokens' (0 for a cache hit, which is never tokenized).
+        """
+        token_budget = token_budget or self.token_budget
+        window = window or self.stream_window
+        texts = iter(texts)
+        while True:
+            chunk = list(islice(texts, window))
+            if not chunk:
+                return
+            yield from self._cached(chunk, lambda misses: self._stream_window(misses, token_budget),
+                                    with_tokens=with_tokens)
+
+    def _stream_window(self, chunk: list[str], token_budget: int) -> list[dict]:
+        """
+        Length bucketed inference over one window of texts, results in input order.
+        Each result also carries the text's token count.
+        """
+        encoded = self.tokenizer(chunk, truncation=True)
+        lengths = [len(ids) for ids in encoded['input_ids']]
+        order = sorted(range(len(chunk)), key=lengths.__getitem__)
+        results = [None] * len(chunk)
+        start = 0
+        while start < len(order):
+            end = start + 1
+            # order is length sorted, so the last row of a batch is its longest
+            while end < len(order) and lengths[order[end]] * (end - start + 1) <= token_budget:
+                end += 1
+            batch = order[start:end]
+            features = [{key: encoded[key][i] for key in encoded.keys()} for i in batch]
+            tokens = self.tokenizer.pad(features, return_tensors='pt')
+            for i, result in zip(batch, self._classify(tokens)):
+                result['tokens'] = lengths[i]
+                results[i] = result
+            start = end
+        return results
+
+    def predict(self, texts: Iterable) -> list[float]:
+        """
+        Signed sentiment score per text (+score positive, -score negative, 0 neutral).
 
-        return [{'label': label, 'score': score} for label, score in zip(labels, scores)]
+        Accepts any number of strings or token lists (joined with spaces), e.g. the
+        tokens column of a tweet backfill in run_processing_pipeline.
+        """
+        texts = (t if isinstance(t, str) else ' '.join(t) for t in texts)
+        return [LABEL_TO_VALUE.get(p['label'].upper(), 0) * p['score'] for p in self.predict_stream(texts)]
 
+    def _cached(self, texts: list[str], infer, with_tokens: bool = False) -> list[dict]:
+        """
+        Serves texts from the inference cache and runs infer() on the unique misses only.
+        infer(list of texts) must return one {'label', 'score', 'logits'} dict per text.
+        with_tokens keeps infer()'s 'tokens' count in the results (0 when not reported).
+        """
+        if self.cache is None:
+            results = infer(texts)
+        else:
+            results = self.cache.get_many(self.model_id, texts)
+            misses = list(dict.fromkeys(t for t, r in zip(texts, results) if r is None))
+            if misses:
+                fresh = dict(zip(misses, infer(misses)))
+                self.cache.put_many(self.model_id, misses, [fresh[t] for t in misses])
+                results = [r if r is not None else fresh[t] for t, r in zip(texts, results)]
+        if with_tokens:
+            return [{'label': r['label'], 'score': r['score'], 'tokens': r.get('tokens', 0)} for r in results]
+        return [{'label': r['label'], 'score': r['score']} for r in results]
+
+    def _classify(self, tokens, runner=False) -> list[dict]:
+        """
+        Runs one padded batch through the active backend (runner=None forces fp32 torch).
+        """
+        runner = self.runner if runner is False else runner
+        tokens = {key: val.to(self.device) for key, val in tokens.items()}
+        if runner is None:
+            with torch.no_grad():
+                logits = self.model(**tokens).logits
+        else:
+            logits = runner(tokens)
+        probabilities = torch.nn.functional.softmax(logits, dim=-1)
+        scores, indices = probabilities.max(dim=-1)
+        id2label = self.model.config.id2label
+        return [{'label': id2label[idx], 'score': score, 'logits': row}
+                for idx, score, row in zip(indices.tolist(), scores.tolist(), logits.tolist())]
 
 def aggregate_daily_sentiment(predictions: list[dict]) -> dict:
     """
@@ -73,8 +187,6 @@ def aggregate_daily_sentiment(predictions: list[dict]) -> dict:
             'neutral_count': 0
         }
 
-    label_to_value = {'POSITIVE': 1, 'NEGATIVE': -1, 'NEUTRAL': 0}
-    
     total_weighted_score = 0.0
     total_weight = 0.0
     positive_count = 0
@@ -92,7 +204,7 @@ def aggregate_daily_sentiment(predictions: list[dict]) -> dict:
         elif label == 'NEUTRAL':
             neutral_count += 1
             
-        numeric_value = label_to_value.get(label, 0)
+        numeric_value = LABEL_TO_VALUE.get(label, 0)
         total_weighted_score += numeric_value * score
         total_weight += score
 
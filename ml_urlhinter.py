@@ -1,5 +1,6 @@
 #! python3
 from urllib.parse import urlparse
+import functools
 import logging
 import argparse
 
@@ -17,6 +18,50 @@ class url_hinter:
     yti = 0                 # Unique instance identifier
     hcycle = 0              # method call counter
     args = []               # class dict to hold global args being passed in from main() methods
+    cmi_classify = __name__+"::classify"
+    # INFO: U code only - This metainfo does NOT define locality. You cant inferr locality truth from it.
+    uhint_code = {
+                'news': ('Local News', 0),
+                'm': ('Fake local micro news', 1),
+                'live': ('Fake local micro news', 1),
+                'video': ('Video story', 2),
+                'rabs': ('External publication', 3),
+                'research': ('Research report', 4),
+                'about': ('Premium subscription add', 5),
+                'udef': ('Not yet defined', 9),
+                'err': ('Error mangled url', 10),
+                'bad': ('ERROR_unknown_state', 99)
+                }
+    # host + leading path segments -> uhint_code key. Compiled into the prefix trie below
+    routes = { ('finance.yahoo.com', 'news'): 'news', \
+               ('finance.yahoo.com', 'm'): 'm', \
+               ('finance.yahoo.com', 'live'): 'live', \
+               ('finance.yahoo.com', 'video'): 'video', \
+               ('finance.yahoo.com', 'research'): 'research', \
+               ('finance.yahoo.com', 'about'): 'about' }
+    trie = {}
+    tcode = {
+            0.0: ('Full Local article page', 0),
+            1.0: ('Fake local micro-stub', 0),
+            1.1: ('External publication link', 1),
+            2.0: ('OP-Ed page', 0),
+            2.1: ('OP-Ed stub', 1),
+            3.0: ('Curated report page', 0),
+            3.1: ('Curated report stub', 1),
+            4.0: ('Video story page', 0),
+            4.1: ('Video story stub', 1),
+            5.0: ('Micro-ad insert', 1),
+            5.1: ('Micro-ad insert', 3),
+            6.0: ('Premium subscription add', 0),
+            6.1: ('Bulk ad junk', 1),
+            7.0: ('Research report page', 0),
+            7.1: ('Research report stub', 1),
+            8.0: ('Unknown thint 8.0', 9),
+            9.0: ('Unknown thint 9.0', 9),
+            9.9: ('Unknown page structure', 9),
+            10.0: ('ERROR unknown state', 9),
+            99.9: ('Default NO-YET-SET', 9),
+            }
 
     def __init__(self, yti, global_args):
         cmi_debug = __name__+"::"+self.__init__.__name__
@@ -41,60 +86,61 @@ class url_hinter:
         9 = Not yet defined
         10 = Error mangled url
         11 = Error state for method
+        recvd_url : url string or urllib.parse.ParseResult
+        return : (u code, description). Memoized per url (see classify)
         """
+        self.hcycle += 1
+        return url_hinter.classify(recvd_url)
 
-        cmi_debug = __name__+"::uhinter.eng#"+str(self.yti)+"_cyc#"+str(hcycle)
-        input_url = recvd_url
-
-        # INFO: U code only - This metainfo does NOT define locality. You cant inferr locality truth from it.
-        uhint_code = {
-                    'news': ('Local News', 0),
-                    'm': ('Fake local micro news', 1),
-                    'live': ('Fake local micro news', 1),
-                    'video': ('Video story', 2),
-                    'rabs': ('External publication', 3),
-                    'research': ('Research report', 4),
-                    'about': ('Premium subscription add', 5),
-                    'udef': ('Not yet defined', 9),
-                    'err': ('Error mangled url', 10),
-                    'bad': ('ERROR_unknown_state', 99)
-                    }
-
-        logging.info ( f"%s  - IN Recvd article url: {type(input_url)}" % cmi_debug )
-        t_check = isinstance(input_url, str)            # check is url is not a GOOD class:urllib.parse.ParseResult
-        # DEBUG : logging.info ( f"%s - Hint url: {input_url}" % cmi_debug )    # {{}} handles urls with %
+    @staticmethod
+    def build_trie(routes):
+        """
+        Prefix trie over host + path segments. routes : {(host, seg, ...): uhint_code key}
+        Each node is a dict of segment -> child node. A node's hint lives under the None key
+        """
+        trie = {}
+        for segs, key in routes.items():
+            node = trie
+            for seg in segs:
+                node = node.setdefault(seg, {})
+            node[None] = url_hinter.uhint_code[key]
+        return trie
 
-        if t_check:
-            a_url = urlparse(input_url)                 # conv url string into apparsed named tuple object
-            if a_url.netloc == "finance.yahoo.com":
-                urlp_attr = a_url.path.split('/', 2)    # work on path=object ONLY
-                uhint = uhint_code.get(urlp_attr[1])    # retrieve uhint code/descr tuple from split section #1
-                logging.info ( f"%s - Logic +0 Decoded url: [{a_url.netloc}] / Type: [{urlp_attr[1]}] / u:{uhint[1]} / {uhint[0]}" % cmi_debug )
-                return uhint[1], uhint[0]
-            else:
-                a_url = urlparse(input_url)
-                uhint = uhint_code.get('rabs')            # get our encodings for absolute URL
-                logging.info ( f"%s - Logic +1 Extract abs url: [{a_url.netloc}] u:{uhint[1]} / {uhint[0]}" % cmi_debug )
-                if a_url.path == "finance.yahoo.com":     # paranoid check b/c urls are nortotiously junky
-                    logging.info ( f"%s - Logic +2 / ERROR mangled url: [{a_url.netloc}] / Type: [{a_url.netloc}] / u:{uhint[1]} / {uhint[0]}" % cmi_debug )
-                    error_state = uhint_code.get('err')
-                    return error_state[1], error_state[0]
-                else:
-                    logging.info ( f"%s - Logic +3 Decoded url: [{a_url.netloc}] / Type: [{a_url.netloc}] / u:{uhint[1]} / {uhint[0]}" % cmi_debug )
-                    return uhint[1], uhint[0]
-        else:     # URL recvd as <class 'urllib.parse.ParseResult'>
-            logging.info ( f"%s  - Logic +4 Recvd encoded url" % cmi_debug )
-            if input_url.netloc == "finance.yahoo.com":        # scheme='https', netloc='finance.yahoo.com', path='/m/49c60293...
-                urlp_attr = input_url.path.split('/', 2)                        # work on path=object ONLY
-                logging.info ( f"%s  - Logic +4 extracted url hint [1]: [{urlp_attr[1]}]" % cmi_debug )
-                uhint = uhint_code.get(urlp_attr[1])                            # retrieve uhint code/descr tuple
-                logging.info ( f"%s  - Logic +4 Decoded url: [{input_url.netloc}] / Type: [{urlp_attr[1]}] / u:{uhint[1]} / {uhint[0]}" % cmi_debug )
-                return uhint[1], uhint[0]    # u code / description
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def classify(url):
+        """
+        Classify 1 url (string or urlparse() named tuple) by walking the host/path trie
+        The deepest node with a hint wins. Known host + unknown path = 'udef'. Unknown host = 'rabs'
+        return : (u code, description)
+        """
+        a_url = urlparse(url) if isinstance(url, str) else url
+        node = url_hinter.trie.get(a_url.netloc)
+        if node is None:
+            if isinstance(url, str) and a_url.path == "finance.yahoo.com":     # scheme-less junk url. urls are nortotiously junky
+                uhint = url_hinter.uhint_code['err']
             else:
-                uhint = uhint_code.get('rabs')            # get our encodings for absolute URL
-                logging.info ( f"%s - Logic +6 / Decoded url: [{input_url.netloc}] / u:{uhint[1]} / {uhint[0]}" % cmi_debug )
-                error_state = uhint_code.get('rabs')
-                return error_state[1], error_state[0]
+                uhint = url_hinter.uhint_code['rabs']
+            return uhint[1], uhint[0]
+        uhint = node.get(None, url_hinter.uhint_code['udef'])
+        for seg in a_url.path.split('/')[1:]:
+            node = node.get(seg)
+            if node is None:
+                break
+            uhint = node.get(None, uhint)
+        logging.info( f"%s - Decoded url: [{a_url.netloc}] / u:{uhint[1]} / {uhint[0]}" % url_hinter.cmi_classify )
+        return uhint[1], uhint[0]
+
+    def classify_many(self, urls):
+        """
+        Batch classify a whole feed of urls (strings or urlparse() named tuples)
+        return : list of (u code, description), in the same order as urls
+        """
+        cmi_debug = __name__+"::"+self.classify_many.__name__+".eng#"+str(self.yti)
+        hints = [url_hinter.classify(u) for u in urls]
+        self.hcycle += len(hints)
+        logging.info( f"%s - classified {len(hints)} urls / memo: {url_hinter.classify.cache_info()}" % cmi_debug )
+        return hints
 
 # method #2
     def hstatus(self):
@@ -103,7 +149,7 @@ class url_hinter:
         """
         cmi_debug = __name__+"::"+self.hstatus.__name__+".eng#"+str(self.yti)+"_cyc#"+str(self.hcycle)
         logging.info('%s - CALLED' % cmi_debug )
-        logging.info ( f"%s - STATUS / Url hinter engine #{self.yti} / cycle #{self.hcycle}" % cmi_debug )
+        logging.info ( f"%s - STATUS / Url hinter engine #{self.yti} / cycle #{self.hcycle} / memo: {url_hinter.classify.cache_info()}" % cmi_debug )
         return self.yti, self.hcycle
 
 
@@ -124,28 +170,8 @@ class url_hinter:
               They do not match/align with the URL Hint code. Since that could be a 'fake out'
         """
         cmi_debug = __name__+"::"+"confidence_lvl.#1"
-        tcode = {
-                0.0: ('Full Local article page', 0),
-                1.0: ('Fake local micro-stub', 0),
-                1.1: ('External publication link', 1),
-                2.0: ('OP-Ed page', 0),
-                2.1: ('OP-Ed stub', 1),
-                3.0: ('Curated report page', 0),
-                3.1: ('Curated report stub', 1),
-                4.0: ('Video story page', 0),
-                4.1: ('Video story stub', 1),
-                5.0: ('Micro-ad insert', 1),
-                5.1: ('Micro-ad insert', 3),
-                6.0: ('Premium subscription add', 0),
-                6.1: ('Bulk ad junk', 1),
-                7.0: ('Research report page', 0),
-                7.1: ('Research report stub', 1),
-                8.0: ('Unknown thint 8.0', 9),
-                9.0: ('Unknown thint 9.0', 9),
-                9.9: ('Unknown page structure', 9),
-                10.0: ('ERROR unknown state', 9),
-                99.9: ('Default NO-YET-SET', 9),
-                }
         logging.info ( f"%s    - Inferr localty hint: [{thint}]" % cmi_debug )
-        thint_descr = tcode.get(thint)    # tuple : page type description / locality code 0=local/1=remote
+        thint_descr = url_hinter.tcode.get(thint)    # tuple : page type description / locality code 0=local/1=remote
         return thint_descr
+
+url_hinter.trie = url_hinter.build_trie(url_hinter.routes)
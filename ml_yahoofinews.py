@@ -3,6 +3,7 @@ from requests_html import HTMLSession
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
+from collections import OrderedDict
 from datetime import datetime, date
 import hashlib
 import re
@@ -12,7 +13,12 @@ import numpy as np
 import argparse
 import time
 from rich import print
-from rich.markup import escape
+from http_pool import http_pool
+from yfn_pagecache import page_cache
+from render_pool import render_pool
+from yf_embedded import yf_embedded
+from yf_selectors import yf_selectors
+from article_stream import article_stream
 
 # logging setup
 logging.basicConfig(level=logging.INFO)
@@ -33,7 +39,7 @@ class yfnews_reader:
     yfn_all_data = None     # JSON dataset contains ALL data
     yfn_htmldata = None     # Page in HTML
     yfn_jsdata = None       # Page in JavaScript-HTML
-    yfn_jsdb = {}           # database to hold response handles from multiple js.session_get() ops
+    yfn_jsdb = page_cache() # urlhash -> page cache (in-memory + persistent disk tier). Raises KeyError on miss
     ml_brief = []           # ML TXT matrix for Naieve Bayes Classifier pre Count Vectorizer
     ml_ingest = {}          # ML ingested NLP candidate articles
     ml_sent = None
@@ -46,6 +52,7 @@ class yfnews_reader:
     ext_req = ""            # HTMLSession request handle
     sen_stats_df = None     # Aggregated sentiment stats for this 1 article
     nsoup = None            # BS4 shared handle between UP & DOWN (1 URL, 2 embeded data sets in HTML doc)
+    dom_max = 32            # max parsed docs held in yfn_domdb (pages that never reach extract_article_data)
     args = []               # class dict to hold global args being passed in from main() methods
     yfn_uh = None           # global url hinter class
     url_netloc = None
@@ -74,6 +81,9 @@ class yfnews_reader:
         self.symbol = symbol
         self.nlp_x = 0
         self.cycle = 1
+        self.json_stories = None      # news feed stories from the page's embedded JSON (None = DOM path)
+        self.yfn_domdb = OrderedDict()  # urlhash -> parsed BS4 doc. Parse once, shared by every depth stage
+        self.dom_stats = {'parsed': 0, 'reused': 0, 'evicted': 0}
         self.sent_df0 = pd.DataFrame(columns=[ 'Row', 'Symbol', 'Co_name', 'Cur_price', 'Prc_change', 'Pct_change', 'Mkt_cap', 'M_B', 'Time'] )
         
         return
@@ -81,7 +91,7 @@ class yfnews_reader:
 ###################################### 1 ###########################################
 # method 6
     def init_dummy_session(self):
-        self.dummy_resp0 = requests.get(self.dummy_url, stream=True, headers=self.yahoo_headers, cookies=self.yahoo_headers, timeout=5 )
+        self.dummy_resp0 = http_pool.get_session(self.dummy_url).get(self.dummy_url, stream=True, headers=self.yahoo_headers, cookies=self.yahoo_headers, timeout=5 )
         #hot_cookies = requests.utils.dict_from_cookiejar(self.dummy_resp0.cookies)
         return
 
@@ -94,7 +104,7 @@ class yfnews_reader:
         But, we dont need the response object, so we dont store it
         Thats allready been captured at stored in: self.ext_req object
         '''
-        self.live_resp0 = requests.get(id_url, stream=True, headers=self.yahoo_headers, cookies=self.yahoo_headers, timeout=5 )
+        self.live_resp0 = http_pool.get_session(id_url).get(id_url, stream=True, headers=self.yahoo_headers, cookies=self.yahoo_headers, timeout=5 )
         return
 
 ##################################### 3 ############################################
@@ -165,14 +175,14 @@ class yfnews_reader:
             
         logging.info( f'ml_yahoofinews::ext_do_js_get.#{self.yti}.{idx_x} - %s', self.yfqnews_url )
         r = self.ext_req
-        r.html.render(timeout=10)
+        render_pool.get_shared().render_response(r, timeout=10)    # warm shared Chromium pool, not a fresh browser
         
         logging.info( f'%s - JS rendered for Idx: [ {idx_x} ]' % cmi_debug )
         self.yfn_jsdata = r.html.text           # store Full JAVAScript response TEXT page
         self.yfn_htmldata = r.html.text
         auh = hashlib.sha256(self.yfqnews_url.encode())     # hash the url
         aurl_hash = auh.hexdigest()
-        self.yfn_jsdb[aurl_hash] = r            # create CACHE entry in jsdb, response, not full page TEXT data !!
+        self.yfn_jsdb[aurl_hash] = r            # create CACHE entry in jsdb. Cache strips Response down to rendered body TEXT only
         logging.info( f'%s - CREATED cache entry: [ {aurl_hash} ]' % cmi_debug )
 
         #print (f"r.html.html: {escape(r.html.html)}...")  # Print first 100 characters of the HTML content for debugging 
@@ -189,7 +199,7 @@ class yfnews_reader:
         cmi_debug = __name__+"::"+self.do_simple_get.__name__+".#"+str(self.yti)
         logging.info( f'%s  - CYCLE: {self.get_counter}' % cmi_debug )
 
-        js_session = HTMLSession()                  # Create a new session        
+        js_session = http_pool.get_session(url)     # shared keep-alive session for this site
         with js_session.get(url) as self.js_resp0:  # must do a get() - NO setting cookeis/headers)
             logging.info(f'%s  - Simple HTML Request get()...' % cmi_debug )
 
@@ -213,7 +223,7 @@ class yfnews_reader:
         auh = hashlib.sha256(url.encode())          # hash the url
         aurl_hash = auh.hexdigest()
         logging.info( f'%s  - CREATE cache entry: [ {aurl_hash} ]' % cmi_debug )
-        self.yfn_jsdb[aurl_hash] = self.js_resp0    # create CACHE entry in jsdb !!response, not full page TEXT data !!
+        self.yfn_jsdb[aurl_hash] = self.js_resp0    # create CACHE entry in jsdb. Cache strips Response down to body TEXT only
 
         # Xray DEBUG
         if self.args['bool_xray'] is True:
@@ -246,31 +256,35 @@ class yfnews_reader:
             self.yfn_jsdb[hash_state]       # check if the URL hash is in the cache
             logging.info( f'%s - URL EXISTS in cache: {hash_state}' % cmi_debug )
             cx_soup = self.yfn_jsdb[hash_state]
-            self.nsoup = BeautifulSoup(cx_soup.html.html, "html.parser")   # !!!! this was soup = but I have no idea where "soup" gets set
+            if self.json_news_feed(cx_soup.html.html) is True:     # fast path. No BS4 parse of the news feed page
+                return
+            self.nsoup = self.page_soup(hash_state, cx_soup.text)     # parsed once per run
             logging.info( f'%s - set BS4 data objects' % cmi_debug )
             
             # Major area that gets BROKEN by Yahoo Finance changes
-            self.ul_tag_dataset = self.nsoup.find_all("section", class_="yf-1ce4p3e")        # produces : list iterator
+            self.ul_tag_dataset = yf_selectors.many(self.nsoup, 'feed', 'container')        # produces : list
             # self.ul_tag_dataset.div.div.div.div.ul.find_all()  # find the first article in the list}
 
             container_node = self.ul_tag_dataset[0]
-            self.li_superclass = container_node.find_all('li')
+            self.li_superclass = yf_selectors.many(container_node, 'feed', 'stories')
 
         except KeyError as error:
             logging.info( f'%s - MISSING in cache: Must read JS page' % cmi_debug )
             logging.info( f'%s - Force read news url: {self.yfqnews_url}' % cmi_debug )
             hx = self.do_js_get(bs4_obj_idx)
             logging.info( f'%s - FRESH JS page in use: [ {bs4_obj_idx} ]' % cmi_debug )
+            if self.json_news_feed(self.yfn_jsdata.text) is True:
+                return
             nsoup = BeautifulSoup(self.yfn_jsdata.text, "html.parser")    # store gloabl. dont use cache object 
             logging.info( f'%s - set BS4 data objects' % cmi_debug )
 
-            self.ul_tag_dataset = self.nsoup.find(attrs={"class": "container yf-1ce4p3e"} )        # produces : list iterator
+            self.ul_tag_dataset = yf_selectors.many(self.nsoup, 'feed', 'container')        # produces : list
             #print ( f"########################### 3 ######################################" )
             #print ( f"### DEBUG: {self.ul_tag_dataset[0]}" )
             #print ( f"########################### 4 ######################################" )
             #self.li_superclass = self.ul_tag_dataset.find_all(attrs={"stream-item story-item yf-1usaaz9"} )
             xxx = self.ul_tag_dataset[0]
-            self.li_superclass = xxx.find_all('li')
+            self.li_superclass = yf_selectors.many(xxx, 'feed', 'stories')
 
   
         logging.info( f'%s - Depth: 0 / Found News containers: {len(self.ul_tag_dataset[0])}' % cmi_debug )
@@ -302,6 +316,25 @@ class yfnews_reader:
     
         return
 
+    def json_news_feed(self, html):
+        """
+        Fast path for scan_news_feed(). Pull the news stream out of the page's embedded JSON data
+        Sets self.json_stories, which eval_news_feed_stories() reads instead of walking the <li> DOM
+        return : True = served from JSON / False = no usable JSON, caller must use the DOM path
+        """
+        cmi_debug = __name__+"::"+self.json_news_feed.__name__+".#"+str(self.yti)
+        self.json_stories = yf_embedded.news_stream(html)
+        if self.json_stories is None:
+            yf_embedded.tally('newsfeed', 'dom')
+            logging.info( f'%s - No embedded JSON news stream. Use DOM path' % cmi_debug )
+            return False
+        yf_embedded.tally('newsfeed', 'json')
+        logging.info( f'%s - Depth: 0 / Found News Articles:   {len(self.json_stories)} (embedded JSON)' % cmi_debug )
+        if self.args['bool_xray'] is True:
+            for y, story in enumerate(self.json_stories, start=1):
+                print ( f"Item: {y}: {story['title']} / (potential News article)" )
+        return True
+
 ###################################### 10 ###########################################
 
     def eval_news_feed_stories(self, symbol):
@@ -324,9 +357,6 @@ class yfnews_reader:
         logging.info('%s - IN \n' % cmi_debug )
         time_now = time.strftime("%H:%M:%S", time.localtime() )
         symbol = symbol.upper()
-        li_superclass_all = self.ul_tag_dataset[0].find_all(attrs={"class": "js-stream-content Pos(r)"} )
-        mini_headline_all = self.ul_tag_dataset[0].div.find_all(attrs={'class': 'C(#959595)'})
-        li_subset_all = self.ul_tag_dataset[0].find_all('li')
 
         h3_counter = a_counter = 0
         x = 1
@@ -341,26 +371,35 @@ class yfnews_reader:
         ## GENERATOR: Scan & find critical tags
         def atag_gen():                         #  extract <h3>, agency, author, publish date
             a_counter = 0
+            if self.json_stories is not None:   # embedded JSON fast path. Same yield sequence as the DOM walk
+                for story in self.json_stories:
+                    self.nlp_x += 1
+                    a_counter += 1
+                    yield ( f"{a_counter}" )
+                    yield ( f"{story['title']}" )
+                    yield ( f"{story['url']}" )
+                    yield ( f"{story['agency']}" )
+                return
             for li_tag in self.li_superclass:   # BS4 object set from scan_news_feed()
                 self.nlp_x += 1
-                for element in li_tag.descendants:
-                    if element.name == "a":
-                        a_counter += 1
-                        if element.h3 is not None:
-                            yield ( f"{a_counter}")
-                            yield ( f"{element.h3.text}" )
-                            if element.has_attr('href') is True:
-                                #yield ( f'ZONE : {a_counter} : H3URL : {element.get("href")}' )
-                                yield ( f'{element.get("href")}' )
-                                news_ag = li_tag.find(attrs={'class': 'publishing yf-1weyqlp'}) 
-                                if news_ag is not None:
-                                    news_ag = news_ag.text.split("•")
-                                    yield ( f"{news_ag[0]}")
-                                else:
-                                    yield ( f"Failed to extract News Agency" )
+                news_ag = yf_selectors.one(li_tag, 'feed', 'agency')
+                for element in yf_selectors.many(li_tag, 'feed', 'headline_link'):     # direct selection. No descendant walk
+                    a_counter += 1
+                    yield ( f"{a_counter}")
+                    yield ( f"{element.h3.text}" )
+                    yield ( f'{element.get("href")}' )
+                    if news_ag is not None:
+                        yield ( f'{news_ag.text.split("•")[0]}' )
+                    else:
+                        yield ( f"Failed to extract News Agency" )
 
         ########## end Generatior
 
+        json_hints = None
+        if self.json_stories is not None:      # whole feed is known up front. Classify it in 1 batch, indexed by story position
+            json_hints = self.yfn_uh.classify_many( [s['url'] if urlparse(s['url']).scheme in ("https", "http") \
+                                                     else urlparse(f"https://finance.yahoo.com{s['url']}") for s in self.json_stories] )
+
         scan_a_zone = atag_gen()
         try:
             cg = 1
@@ -377,7 +416,10 @@ class yfnews_reader:
 
                 for safety_cycle in range(1):    # ABUSE for/loop BREAK as logic control exit (poor mans switch/case)
                     if self.a_urlp.scheme == "https" or self.a_urlp.scheme == "http":    # check URL scheme specifier
-                        uhint, uhdescr = self.yfn_uh.uhinter(hcycle, self.article_url)       # raw url string
+                        if json_hints is not None:
+                            uhint, uhdescr = json_hints[int(li_a_zone) - 1]                  # batch hint of this story
+                        else:
+                            uhint, uhdescr = self.yfn_uh.uhinter(hcycle, self.article_url)   # raw url string
                         logging.info( f'%s - Source url [{self.a_urlp.netloc}] / u:{uhint} / {uhdescr}' % (cmi_debug) )
                         pure_url = 1                    # explicit pure URL to remote entity
                         if uhint == 0: thint = 0.0      # Fake news / remote-stub @ YFN stub
@@ -396,7 +438,10 @@ class yfnews_reader:
                         self.a_urlp = urlparse(self.a_url)
                         self.url_netloc = self.a_urlp.netloc      # get FQDN netloc
                         logging.info( f'%s - Source url: {self.a_urlp.netloc}' % (cmi_debug) )
-                        uhint, uhdescr = self.yfn_uh.uhinter(hcycle, self.a_urlp)          # urlparse named tuple
+                        if json_hints is not None:
+                            uhint, uhdescr = json_hints[int(li_a_zone) - 1]                  # batch hint of this story
+                        else:
+                            uhint, uhdescr = self.yfn_uh.uhinter(hcycle, self.a_urlp)        # urlparse named tuple
                         if uhint == 0: thint = 0.0      # real news / remote-stub @ YFN stub
                         if uhint == 1: thint = 1.0      # real news / local page
                         if uhint == 2: thint = 4.0      # video (currently / FOR NOW, assume all videos are locally hosted on finanice.yahoo.com
@@ -418,7 +463,8 @@ class yfnews_reader:
                 print ( f"Article teaser:   {self.article_teaser}" )
 
                 self.ml_brief.append(self.article_teaser)           # add Article teaser long TXT into ML pre count vectorizer matrix
-                auh = hashlib.sha256(self.article_url.encode())     # hash the url
+                a_url_norm = self.a_urlp.scheme+"://"+self.a_urlp.netloc+self.a_urlp.path
+                auh = hashlib.sha256(a_url_norm.encode())           # hash the SAME url that later get()'s use, so page cache keys line up
                 aurl_hash = auh.hexdigest()
                 print ( f"Unique url hash:  {aurl_hash}" )
                 print ( f" " )
@@ -432,7 +478,7 @@ class yfnews_reader:
                     "type" : ml_atype,
                     "thint" : thint,
                     "uhint" : uhint,
-                    "url" : self.a_urlp.scheme+"://"+self.a_urlp.netloc+self.a_urlp.path,
+                    "url" : a_url_norm,
                     "teaser" : self.article_teaser
                 }
                 logging.info( f'%s - Add to ML Ingest DB: [ {cg} ]' % (cmi_debug) )
@@ -479,8 +525,8 @@ class yfnews_reader:
             self.yfn_jsdb[cached_state]
             cx_soup = self.yfn_jsdb[cached_state]
             logging.info( f'%s - Cached object FOUND: {cached_state}' % cmi_debug )
-            dataset_1 = self.yfn_jsdata     # 1
-            self.nsoup = BeautifulSoup(escape(dataset_1), "html.parser")
+            dataset_1 = cx_soup.text        # 1 : page body from cache (may be a disk hit from a previous run)
+            self.nsoup = self.page_soup(cached_state, dataset_1)    # reuses the depth 0/2 parse if this page was already seen
             logging.info( f'%s - Cache BS4 object:   {type(cx_soup)}' % cmi_debug )
             logging.info( f'%s - Dataset object    : {type(dataset_1)}' % cmi_debug )
             logging.info( f'%s - Cache URL object  : {type(durl)}' % cmi_debug )
@@ -518,7 +564,7 @@ class yfnews_reader:
                 logging.info ( f'%s - cache url:     {type(durl)}' % cmi_debug )
                 logging.info ( f'%s - cache request: {type(cy_soup)}' % cmi_debug )
                 logging.info ( f'%s - Cache dataset: {type(self.yfn_jsdata)}' % cmi_debug )
-                self.nsoup = BeautifulSoup(escape(dataset_2), "html.parser")
+                self.nsoup = self.page_soup(cached_state, dataset_2)
             except KeyError:
                 logging.info( f'%s - CORRUPT cache state' % cmi_debug )
                 logging.info( f'%s - Cache URL object  : {type(durl)}' % cmi_debug )
@@ -526,15 +572,8 @@ class yfnews_reader:
                 return 10, 10.0, "ERROR_unknown_state!"
         
         logging.info( f'%s - set BS4 data zones for Article: [ {idx} ]' % cmi_debug )
-        local_news = self.nsoup.find(attrs={"class": "body yf-1ir6o1g"})   # full news article - locally hosted
-        #local_news = self.nsoup.find(attrs={"class": "body yf-tsvcyu"})   # full news article - locally hosted
-        # local_news_meta = self.nsoup.find(attrs={"class": "main yf-cfn520"})   # comes above/before article
-        local_news_meta = self.nsoup.find(attrs={"class": "byline yf-1k5w6kz"})   # comes above/before article
-        local_stub_news = self.nsoup.find_all(attrs={"class": "article yf-l7apfj"})
-        local_story = self.nsoup.find(attrs={"class": "body yf-tsvcyu"})  # Op-Ed article - locally hosted
-        local_video = self.nsoup.find(attrs={"class": "body yf-tsvcyu"})  # Video story (minimal supporting text) stub - locally hosted
-        full_page = self.nsoup()  # full news article - locally hosted
-        #rem_news = nsoup.find(attrs={"class": "caas-readmore"} )           # stub news article - remotely hosted
+        # zones are selected per page type below, from the yf_selectors profile for that layout. Only the zones
+        # the matching branch reads get selected (no whole doc lookups for layouts this page is not)
 
 
         # Depth 2.0 :Local news article / Hosted in YFN
@@ -543,8 +582,10 @@ class yfnews_reader:
                 logging.info ( f'%s - Depth: 2.0 / BS4 processed doc length: {len(self.nsoup)}' % cmi_debug )
                 logging.info ( f'%s - Depth: 2.0 / nsoup type is: {type(self.nsoup)}' % cmi_debug )
                 
-                author_zone = local_news_meta.find("div", attrs={"class": "byline-attr-author yf-1k5w6kz"} )                    
-                pubdate_zone = local_news_meta.find("div", attrs={"class": "byline-attr-time-style"} )
+                local_news = yf_selectors.one(self.nsoup, 'article', 'body')           # full news article - locally hosted
+                local_news_meta = yf_selectors.one(self.nsoup, 'article', 'byline')    # comes above/before article
+                author_zone = yf_selectors.one(local_news_meta, 'article', 'author')
+                pubdate_zone = yf_selectors.one(local_news_meta, 'article', 'pubdate')
                 try:
                     author = author_zone.a.string
                 except AttributeError:
@@ -558,7 +599,7 @@ class yfnews_reader:
                 pubdate = pubdate_zone.time.string
 
                 print( f"Publish INFO:  [ Author: {author} / Published: {pubdate} ]" )
-                if local_news.find_all("p" ) is not None:
+                if yf_selectors.many(local_news, 'article', 'paragraphs'):
                 #if article_zone is not None:
                     #article = article_zone
                     logging.info ( f"%s - Depth: 2.0 / GOOD <p> zone / Local full TEXT article" % cmi_debug )
@@ -577,16 +618,11 @@ class yfnews_reader:
             logging.info ( f'%s - Depth: 2.1 / BS4 processed doc length: {len(self.nsoup)}' % cmi_debug )
             logging.info ( f'%s - Depth: 2.1 / nsoup type is: {type(self.nsoup)}' % cmi_debug )
 
-            local_news_meta = self.nsoup.find("head")
-            local_news_body = self.nsoup.find("body")
-            local_news_bmain = local_news_body.find("main")
-            local_news_bmart = local_news_bmain.find("article")
-            local_news_bmart_divs = local_news_bmart.find_all("div")
-
-            local_news_meta_desc = self.nsoup.find("meta", attrs={"name": "description"})
+            local_news_bmain = yf_selectors.one(self.nsoup, 'stub', 'main')
+            local_news_bmart = yf_selectors.one(local_news_bmain, 'stub', 'article')
 
             #local_news_bmart_cap = local_news_bmart.find("div", attrs={"class": "caas-title-wrapper"})
-            local_news_bmart_cap = local_news_bmart.find("h1", attrs={"class": "cover-title yf-1rjrr1"})
+            local_news_bmart_cap = yf_selectors.one(local_news_bmart, 'stub', 'caption')
             #local_news_bmart_cap = local_news_bmart.find("div", attrs={"class": "atoms-wrapper"})
             caption_pct_cl = re.sub(r'[\%]', "PCT", local_news_bmart_cap.text)  # cant have % in text. Problematic !!
             logging.info ( f'%s - COVER CAPTION: {caption_pct_cl}' % cmi_debug )
@@ -594,13 +630,13 @@ class yfnews_reader:
             #local_news_bmart_ath = local_news_bmart.find("div", attrs={"class": "caas-attr-item-author"})
             #local_news_bmart_dte = local_news_bmart.find("div", attrs={"class": "caas-attr-time-style"})
 
-            local_news_bmart_ath = local_news_bmart.find("div", attrs={"class": "byline-attr-author yf-1k5w6kz"})
+            local_news_bmart_ath = yf_selectors.one(local_news_bmart, 'stub', 'author')
             logging.info ( f'%s - AUTHOR: {local_news_bmart_ath.text}' % cmi_debug )
 
-            local_news_bmart_dte = local_news_bmart.find("time", attrs={"class": "byline-attr-meta-time"})
+            local_news_bmart_dte = yf_selectors.one(local_news_bmart, 'stub', 'pubdate')
             logging.info ( f'%s - PUB TIME: {local_news_bmart_dte.text}' % cmi_debug )
 
-            local_news_bmain_azone = local_news_bmain.find("a")
+            local_news_bmain_azone = yf_selectors.one(local_news_bmain, 'stub', 'ext_link')
 
             """
             print ( f"### DEBUG - Meta tle: {local_news_meta.title.string}" )
@@ -637,6 +673,8 @@ class yfnews_reader:
             logging.info ( f"%s - Depth: 2.1 / External link: {local_news_bmain_azone['href']}" % cmi_debug )
 
             thint = 1.1
+            local_stub_news = yf_selectors.one(self.nsoup, 'stub', 'continues')
+            local_story = yf_selectors.one(self.nsoup, 'stub', 'story')     # Op-Ed article - locally hosted
             if local_news_bmart is not None:                         # article has some content
                 logging.info ( f"%s - Depth: 2.1 / Good article stub / External location @: {local_news_bmain_azone['href']}" % cmi_debug )
                 ext_url_item =  local_news_bmain_azone['href']       # build a new dict entry (external; absolute url)
@@ -648,13 +686,13 @@ class yfnews_reader:
                 self.ml_ingest[idx] = data_row                       # now PERMENTALY update the ml_ingest record @ index = id
                 logging.info ( f"%s - Depth: 2.1 / NLP candidate is ready [ u: {uhint} h: {thint} ]" % cmi_debug )
                 return uhint, thint, ext_url_item
-            elif local_stub_news.text == "Story continues":          # local articles have a [story continues...] button
+            elif local_stub_news is not None and local_stub_news.text == "Story continues":          # local articles have a [story continues...] button
                 logging.info ( f"%s - Depth: 2.1 / GOOD [story continues...] stub" % cmi_debug )
                 logging.info ( f"%s - Depth: 2.1 / confidence level / u: {uhint} h: {thint}" % cmi_debug )
                 data_row.update({"viable": 0})                       # cab not extra text data from this article
                 self.ml_ingest[idx] = data_row                       # now PERMENTALY update the ml_ingest record @ index = id
                 return uhint, thint, self.this_article_url           # REAL local news
-            elif local_story.button.text == "Read full article":     # test to make 100% sure its a low quality story
+            elif local_story is not None and local_story.button is not None and local_story.button.text == "Read full article":     # test to make 100% sure its a low quality story
                 logging.info ( f"%s - Depth: 2.1 / GOOD [Read full article] stub" % cmi_debug )
                 logging.info ( f"%s - Depth: 2.1 / confidence level / u: {uhint} h: {thint}" % cmi_debug )
                 data_row.update({"viable": 0})                       # cab not extra text data from this article
@@ -667,7 +705,8 @@ class yfnews_reader:
                 return uhint, 9.9, self.this_article_url
         
         if uhint == 2:
-            if local_video.find('p'):          # video page only has a small <p> zone. NOT much TEXT (all the news is in the video)
+            local_video = yf_selectors.one(self.nsoup, 'video', 'body')     # Video story (minimal supporting text) stub - locally hosted
+            if yf_selectors.one(local_video, 'video', 'text') is not None:          # video page only has a small <p> zone. NOT much TEXT (all the news is in the video)
                 logging.info ( f'%s - Depth: 2.2 / BS4 processed doc length: {len(self.nsoup)}' % cmi_debug )
                 logging.info ( f"%s - Depth: 2.2 / GOOD [Video report] minimal text" % cmi_debug )
                 logging.info ( f"%s - Depth: 2.2 / confidence level / u: {uhint} h: {thint}" % cmi_debug )
@@ -690,6 +729,7 @@ class yfnews_reader:
 
         if uhint == 4:
             logging.info ( f"%s - Depth: 2.2 / POSSIBLE Research report " % cmi_debug )
+            logging.info ( f"%s - Depth: 2.2 / Research body zone found: {yf_selectors.one(self.nsoup, 'research', 'body') is not None}" % cmi_debug )
             logging.info ( f"%s - Depth: 2.2 / confidence level / u: {uhint} h: {thint}" % cmi_debug )
             data_row.update({"viable": 0})                       # cab not extra text data from this article
             self.ml_ingest[idx] = data_row                       # now PERMENTALY update the ml_ingest record @ index = id
@@ -702,7 +742,7 @@ class yfnews_reader:
 
 ###################################### 12 ###########################################
 
-    def extract_article_data(self, item_idx, sentiment_ai):
+    def article_paragraphs(self, item_idx):
         """
         Depth 3:
         Only do this once the article has been evaluated and we knonw exactly where/what each article is
@@ -712,9 +752,10 @@ class yfnews_reader:
         Store it in a Database
         Associate it to themetadata info for this article
         Its now available for the LLM to read and process
+        return : (symbol, urlhash, <p> paragraphs) or None if the article can't be read / is a micro stub
         """
 
-        cmi_debug = __name__+"::"+self.extract_article_data.__name__+".#"+str(self.yti)
+        cmi_debug = __name__+"::"+self.article_paragraphs.__name__+".#"+str(self.yti)
         logging.info( f'%s - IN / Work on item... [ {item_idx} ]' % cmi_debug )
 
         
@@ -735,9 +776,9 @@ class yfnews_reader:
         # shoud make this a method and call it when needed
         # it would retrun self.nsoup and set self.yfn_jsdata
         logging.info( f'%s - urlhash cache lookup: {cached_state}' % cmi_debug )
-        cmi_debug = __name__+"::"+self.extract_article_data.__name__+".#"+str(item_idx)+" - URL: "+durl
+        cmi_debug = __name__+"::"+self.article_paragraphs.__name__+".#"+str(item_idx)+" - URL: "+durl
         logging.info( f'%s' % cmi_debug )     # hack fix for urls containg "%" break logging module (NO FIX
-        cmi_debug = __name__+"::"+self.extract_article_data.__name__+".#"+str(item_idx)
+        cmi_debug = __name__+"::"+self.article_paragraphs.__name__+".#"+str(item_idx)
 
         logging.info( f'%s - CHECKING cache... {cached_state}' % cmi_debug )
         try:
@@ -751,28 +792,29 @@ class yfnews_reader:
             logging.info( f'%s - Cache req/get    : {type(cx_soup)}' % cmi_debug )
             logging.info( f'%s - Cahce Dataset    : {type(dataset_1)}' % cmi_debug )
             logging.info( f'%s - Cache URL object : {cx_soup.url}' % cmi_debug )
-            self.nsoup = BeautifulSoup(escape(dataset_1), "html.parser")
+            self.nsoup = self.page_soup(cached_state, None)     # the doc interpret_page() already parsed. None = stream it
+            article_text = dataset_1
         except KeyError:
             logging.info( f'%s - MISSING from cache / must read page' % cmi_debug )
             logging.info( f'%s - Cache URL object  : {type(durl)}' % cmi_debug )
  
-            cmi_debug = __name__+"::"+self.extract_article_data.__name__+".#"+str(item_idx)+" - "+durl
+            cmi_debug = __name__+"::"+self.article_paragraphs.__name__+".#"+str(item_idx)+" - "+durl
             logging.info( f'%s' % cmi_debug )     # hack fix for urls containg "%" break logging module (NO FIX
-            cmi_debug = __name__+"::"+self.extract_article_data.__name__+".#"+str(item_idx)
+            cmi_debug = __name__+"::"+self.article_paragraphs.__name__+".#"+str(item_idx)
  
             self.yfqnews_url = durl
             ip_urlp = urlparse(durl)
             ip_headers = ip_urlp.path
-            self.init_dummy_session(durl)
+            self.init_live_session(durl)
             self.update_headers(ip_headers)
 
             #xhash = self.do_js_get(item_idx)
-            cy_soup = self.yfn_jsdb[cached_state]     # get() response 
             xhash = self.do_simple_get(durl)          # for testing non JS Basic HTML get()
             #self.yfqnews_url = url                   # ""   ""
 
             logging.info( f'%s - Retry cache lookup for: {cached_state}' % cmi_debug )
-            if self.yfn_jsdb[cached_state]:
+            if cached_state in self.yfn_jsdb:
+                cy_soup = self.yfn_jsdb[cached_state]     # get() response
                 logging.info( f'%s - Found cache entry: {cached_state}' % cmi_debug )
                 #cy_soup.html.render()                  # disbale JS render()
                 self.yfn_jsdata = cy_soup.text
@@ -781,55 +823,73 @@ class yfnews_reader:
                 logging.info ( f'%s - Cache url:     {cy_soup.url}' % cmi_debug )
                 logging.info ( f'%s - Cache req/get: {type(cy_soup)}' % cmi_debug )
                 logging.info ( f'%s - Cache Dataset: {type(self.yfn_jsdata)}' % cmi_debug )
-                self.nsoup = BeautifulSoup(escape(dataset_2), "html.parser")
+                self.nsoup = self.page_soup(cached_state, None)
+                article_text = dataset_2
             else:
                 logging.info( f'%s - FAIL to set BS4 data !' % cmi_debug )
-                return 10, 10.0, "ERROR_unknown_state!"
+                return None
 
+        self.evict_soup(cached_state)       # last depth stage. self.nsoup keeps the doc alive only until the next article
         logging.info( f'%s - Extract ML TEXT dataset: {durl}' % (cmi_debug) )
         if external is True:    # page is Micro stub Fake news article
             logging.info( f'%s - Skipping Micro article stub... [ {item_idx} ]' % cmi_debug )
-            return
+            return None
             # Do not do deep data extraction
             # just use the CAPTION Teaser text from the YFN local url
             # we extracted that in interpret_page()
         else:
             logging.info( f'%s - set BS4 data zones for article: [ {item_idx} ]' % cmi_debug )
-            #local_news = self.nsoup.find(attrs={"class": "body yf-tsvcyu"})             # full news article - locally hosted
-            local_news = self.nsoup.find(attrs={"class": "body yf-1ir6o1g"})             # full news article - locally hosted
-            local_news_meta = self.nsoup.find(attrs={"class": "main yf-cfn520"})        # comes above/before article
-            # local_stub_news = self.nsoup.find_all(attrs={"class": "article yf-l7apfj"})
-            local_stub_news = self.nsoup.find_all(attrs={"class": "body yf-3qln1o"})   # full news article - locally hosted
-            local_stub_news_p = local_news.find_all("p")    # BS4 all <p> zones (not just 1)
-
-            ####################################################################
-            ##### M/L Gen AI NLP starts here !!!                         #######
-            ##### Heavy CPU utilization / local LLM Model & no GPU       #######
-            ####################################################################
-            #
-            hs = cached_state    # the URL hash (passing it to sentiment_ai for us in DF)
-            logging.info( f'%s - Init M/L NLP Tokenizor sentiment-analyzer pipeline...' % cmi_debug )
-            total_tokens, total_words, total_scent = sentiment_ai.compute_sentiment(symbol, item_idx, local_stub_news_p, hs)
-
-            print ( f"Total tokens generated: {total_tokens} / Neutral: {sentiment_ai.sentiment_count['neutral']} / Postive: {sentiment_ai.sentiment_count['positive']} / Negative: {sentiment_ai.sentiment_count['negative']}")
-
-            # set up a dataframe to hold the aggregated sentiment for this article in columns.
-            # This is helpful for merging the info with other dataframes later on
-            self.sen_data = [[ \
-                        item_idx, \
-                        hs, \
-                        sentiment_ai.sentiment_count['positive'], \
-                        sentiment_ai.sentiment_count['neutral'], \
-                        sentiment_ai.sentiment_count['negative'] ]]
-
-            sen_df_row = pd.DataFrame(self.sen_data, columns=[ 'art', 'urlhash', 'positive', 'neutral', 'negative'] )
-            self.sen_stats_df = pd.concat([self.sen_stats_df, sen_df_row])
-            
-            # create emtries in the Neo4j Graph database
-            # - check if KG has existing node entry for this symbol+news_article
-            # if not... create one
-            print ( f"======================================== End: {item_idx} ===============================================")
+            if self.nsoup is not None:
+                local_news = yf_selectors.one(self.nsoup, 'article', 'body')                 # full news article - locally hosted
+                local_stub_news_p = yf_selectors.many(local_news, 'article', 'paragraphs')   # BS4 all <p> zones (not just 1)
+            else:
+                # never parsed. Stream only the article body. Generator, so sentiment starts on the 1st <p>
+                local_stub_news_p = article_stream.paragraphs(article_text)
+
+            return symbol, cached_state, local_stub_news_p
+
+    def article_stats(self, item_idx, hs, sentiment_count):
+        """
+        Add the aggregated pos/neu/neg paragraph counts of 1 article to sen_stats_df
+        Helpful for merging the info with other dataframes later on
+        """
+        self.sen_data = [[ \
+                    item_idx, \
+                    hs, \
+                    sentiment_count['positive'], \
+                    sentiment_count['neutral'], \
+                    sentiment_count['negative'] ]]
+
+        sen_df_row = pd.DataFrame(self.sen_data, columns=[ 'art', 'urlhash', 'positive', 'neutral', 'negative'] )
+        self.sen_stats_df = pd.concat([self.sen_stats_df, sen_df_row])
+        return
+
+    def extract_article_data(self, item_idx, sentiment_ai):
+        """
+        Depth 3: read 1 article & compute its sentiment right away (1 article per model call)
+        The news loop batches across articles instead. See article_paragraphs() + ml_sentbatch
+        """
+        cmi_debug = __name__+"::"+self.extract_article_data.__name__+".#"+str(item_idx)
+        art = self.article_paragraphs(item_idx)
+        if art is None:
+            return 10, 10.0, "ERROR_unknown_state!"
+        symbol, hs, local_stub_news_p = art
+
+        ####################################################################
+        ##### M/L Gen AI NLP starts here !!!                         #######
+        ##### Heavy CPU utilization / local LLM Model & no GPU       #######
+        ####################################################################
+        #
+        logging.info( f'%s - Init M/L NLP Tokenizor sentiment-analyzer pipeline...' % cmi_debug )
+        total_tokens, total_words, total_scent = sentiment_ai.compute_sentiment(symbol, item_idx, local_stub_news_p, hs)
 
+        print ( f"Total tokens generated: {total_tokens} / Neutral: {sentiment_ai.sentiment_count['neutral']} / Postive: {sentiment_ai.sentiment_count['positive']} / Negative: {sentiment_ai.sentiment_count['negative']}")
+        self.article_stats(item_idx, hs, sentiment_ai.sentiment_count)
+
+        # create emtries in the Neo4j Graph database
+        # - check if KG has existing node entry for this symbol+news_article
+        # if not... create one
+        print ( f"======================================== End: {item_idx} ===============================================")
         return total_tokens, total_words, total_scent
 
 ###################################### 13 ###########################################
@@ -850,3 +910,36 @@ class yfnews_reader:
                 print ( f"          Local:    {d['url']}" )
 
         return
+
+###################################### 14 ###########################################
+
+    def page_soup(self, urlhash, markup):
+        """
+        Parse once DOM cache shared by all depth stages (scan_news_feed, interpret_page, extract_article_data)
+        A page is decoded & parsed into BS4 exactly once per run. Later stages get the same doc back.
+        markup : page text. Only parsed on a DOM cache miss. None = lookup only (returns None on a miss)
+        """
+        cmi_debug = __name__+"::"+self.page_soup.__name__+".#"+str(self.yti)
+        try:
+            doc = self.yfn_domdb[urlhash]
+            self.yfn_domdb.move_to_end(urlhash)
+            self.dom_stats['reused'] += 1
+            logging.info( f'%s - DOM cache HIT: {urlhash}' % cmi_debug )
+            return doc
+        except KeyError:
+            if markup is None:
+                return None
+        doc = BeautifulSoup(markup, "html.parser")
+        self.dom_stats['parsed'] += 1
+        self.yfn_domdb[urlhash] = doc
+        while len(self.yfn_domdb) > self.dom_max:       # bound peak memory if pages never reach depth 3
+            self.yfn_domdb.popitem(last=False)
+            self.dom_stats['evicted'] += 1
+        logging.info( f'%s - DOM cache MISS / parsed: {urlhash}' % cmi_debug )
+        return doc
+
+    def evict_soup(self, urlhash):
+        """Drop a parsed doc once the final depth stage has it. No-op if not cached"""
+        if self.yfn_domdb.pop(urlhash, None) is not None:
+            self.dom_stats['evicted'] += 1
+        return
@@ -0,0 +1,152 @@
+#! python3
+import sqlite3
+import threading
+import logging
+import argparse
+import time
+import os
+from rich import print
+from net_capture import net_capture
+
+# logging setup
+logging.basicConfig(level=logging.INFO)
+
+#####################################################
+
+class aclass_cache:
+    """
+    Persistent symbol -> nasdaq.com asset_class cache (SQLite).
+    A symbols asset class (stocks / etf) almost never changes, so learning it once saves 2-3
+    api.nasdaq.com round trips per symbol, every run.
+    Symbols that nasdaq.com does not know are stored as a NEGATIVE entry with a much shorter TTL.
+    """
+
+    # global accessors
+    db_path = os.path.expanduser("~/.cache/aop/nq_aclass.sqlite")
+    pos_ttl = 30 * 86400    # secs - known asset class
+    neg_ttl = 1 * 86400     # secs - NEGATIVE entry (symbol unknown to nasdaq.com)
+    NEG = "none"            # asset_class value stored for a NEGATIVE entry
+    db = None               # shared sqlite3 connection
+    db_lock = threading.Lock()
+    hits = 0
+    misses = 0
+
+    def __init__(self, yti, db_path=None):
+        cmi_debug = __name__+"::"+self.__init__.__name__
+        logging.info( f'%s - Instantiate.#{yti}' % cmi_debug )
+        self.yti = yti
+        if db_path is not None:
+            self.db_path = db_path
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self.db_lock:
+            self.db.execute("CREATE TABLE IF NOT EXISTS aclass (symbol TEXT PRIMARY KEY, asset_class TEXT NOT NULL, learned REAL NOT NULL)")
+            self.db.commit()
+        return
+
+######################################################################
+# method 1
+    def get(self, symbol):
+        """
+        Counted lookup (hits / misses feed stats())
+        return : cached asset_class for symbol ('stocks', 'etf' or NEG), or None if missing/expired
+        """
+        cmi_debug = __name__+"::"+self.get.__name__+".#"+str(self.yti)
+        asset_class = self.peek(symbol)
+        with self.db_lock:
+            if asset_class is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if asset_class is not None:
+            logging.info( f"%s - HIT {symbol} : {asset_class}" % cmi_debug )
+        return asset_class
+
+    def peek(self, symbol):
+        """
+        Same lookup as get() without touching the hit / miss counters. For reporting & pre-checks
+        return : cached asset_class for symbol ('stocks', 'etf' or NEG), or None if missing/expired
+        """
+        cmi_debug = __name__+"::"+self.peek.__name__+".#"+str(self.yti)
+        symbol = symbol.rstrip().upper()
+        if net_capture.active():
+            return None         # record/replay : asset class probes must hit the fetch layer
+        with self.db_lock:
+            row = self.db.execute("SELECT asset_class, learned FROM aclass WHERE symbol = ?", (symbol,)).fetchone()
+        if row is None:
+            return None
+        ttl = self.neg_ttl if row[0] == self.NEG else self.pos_ttl
+        if time.time() - row[1] < ttl:
+            return row[0]
+        logging.info( f"%s - EXPIRED {symbol} : {row[0]}" % cmi_debug )
+        return None
+
+######################################################################
+# method 2
+    def put(self, symbol, asset_class):
+        """Store a learned asset_class (use NEG for a symbol nasdaq.com doesnt know)"""
+        cmi_debug = __name__+"::"+self.put.__name__+".#"+str(self.yti)
+        symbol = symbol.rstrip().upper()
+        logging.info( f"%s - STORE {symbol} : {asset_class}" % cmi_debug )
+        with self.db_lock:
+            self.db.execute("INSERT OR REPLACE INTO aclass (symbol, asset_class, learned) VALUES (?, ?, ?)", (symbol, asset_class, time.time()))
+            self.db.commit()
+        return
+
+######################################################################
+# method 3
+    def purge_expired(self):
+        """Drop all expired entries. return : num of rows removed"""
+        now = time.time()
+        with self.db_lock:
+            cur = self.db.execute("DELETE FROM aclass WHERE (asset_class = ? AND learned < ?) OR (asset_class != ? AND learned < ?)", \
+                                  (self.NEG, now - self.neg_ttl, self.NEG, now - self.pos_ttl))
+            self.db.commit()
+        return cur.rowcount
+
+######################################################################
+# method 4
+    def prewarm(self, symbols, nq):
+        """
+        Bulk pre-warm the cache for a list of symbols.
+        nq : an nquote instance. Only symbols that are missing/expired are probed (concurrently)
+        return : dict of symbol -> asset_class for every symbol
+        """
+        cmi_debug = __name__+"::"+self.prewarm.__name__+".#"+str(self.yti)
+        symbols = [ s.rstrip().upper() for s in symbols ]
+        cold = [ s for s in symbols if self.get(s) is None ]
+        logging.info( f"%s - {len(symbols)} symbols / {len(cold)} cold" % cmi_debug )
+        nq.probe_many(cold)            # probe_aclass() writes every result back into this cache
+        return { s: self.peek(s) for s in symbols }
+
+######################################################################
+# method 5
+    def stats(self):
+        with self.db_lock:
+            rows = self.db.execute("SELECT asset_class, COUNT(*) FROM aclass GROUP BY asset_class").fetchall()
+            return {'hits': self.hits, 'misses': self.misses, 'entries': dict(rows)}
+
+#####################################################
+# bulk pre-warm command
+#   python nasdaq_aclass.py IBM SPY QQQ ...
+#   python nasdaq_aclass.py -f symbols.txt
+
+if __name__ == '__main__':
+    from nasdaq_quotes import nquote
+    parser = argparse.ArgumentParser(description="Pre-warm nasdaq.com asset class cache")
+    parser.add_argument('symbols', nargs='*', help='ticker symbols')
+    parser.add_argument('-f','--file', help='file of ticker symbols (1 per line)', action='store', dest='sym_file', required=False, default=None)
+    parser.add_argument('-v','--verbose', help='verbose error logging', action='store_true', dest='bool_verbose', required=False, default=False)
+    cargs = vars(parser.parse_args())
+    if cargs['bool_verbose'] is False:
+        logging.disable(20)
+    warm_syms = list(cargs['symbols'])
+    if cargs['sym_file'] is not None:
+        with open(cargs['sym_file']) as f:
+            warm_syms += [ l.strip() for l in f if l.strip() ]
+
+    nq = nquote(1, {'bool_xray': False})
+    nq.init_dummy_session()
+    for k, v in nq.aclass_db.prewarm(warm_syms, nq).items():
+        print ( f"{k:8} : {v}" )
+    print ( f"{nq.aclass_db.stats()}" )
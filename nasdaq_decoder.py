@@ -0,0 +1,159 @@
+#! python3
+import time
+import logging
+import numpy as np
+import pandas as pd
+from md_clean import md_clean
+
+# logging setup
+logging.basicConfig(level=logging.INFO)
+
+#####################################################
+
+class nq_decoder:
+    """
+    Schema driven, multi symbol batch decoder for nasdaq.com quote JSON.
+    Replaces the per symbol nq_wrangler flow (setup_zones -> do_wrangle -> clean_cast -> build_data_sets).
+    Every field is declared once in schema (zone, JSON path, kind). decode() digs the raw values of ALL
+    symbols out of their 3 data zones, then cleans & casts each column in 1 vectorized md_clean pass.
+    Input is the nquote.get_nquotes() batch dict. Output is 1 typed DataFrame (same columns as
+    nq_wrangler.quote_df0) + the per symbol qd_quote dicts (same keys as nq_wrangler.qd_quote).
+    """
+
+    # global accessors
+    zones = ('summary', 'watchlist', 'premarket')     # order of the get_nquotes() 'zones' tuple
+    # name               zone           JSON path                                             kind      stocks only
+    schema = [ ('co_sym',          'watchlist', ('data', 0, 'symbol'),                          'str',    False), \
+               ('co_name',         'watchlist', ('data', 0, 'companyName'),                     'str',    False), \
+               ('price',           'watchlist', ('data', 0, 'lastSalePrice'),                   'money',  False), \
+               ('price_net',       'watchlist', ('data', 0, 'netChange'),                       'money',  False), \
+               ('price_pct',       'watchlist', ('data', 0, 'percentageChange'),                'pct',    False), \
+               ('arrow_updown',    'watchlist', ('data', 0, 'deltaIndicator'),                  'str',    False), \
+               ('price_timestamp', 'watchlist', ('data', 0, 'lastTradeTimestampDateTime'),      'str',    False), \
+               ('vol_abs',         'watchlist', ('data', 0, 'volume'),                          'money',  False), \
+               ('open_price',      'premarket', ('data', 'infoTable', 'rows', 0, 'consolidated'), 'open3', False), \
+               ('prev_close',      'summary',   ('data', 'summaryData', 'PreviousClose', 'value'), 'money', False), \
+               ('mkt_cap',         'summary',   ('data', 'summaryData', 'MarketCap', 'value'),  'mcap',   False), \
+               ('avg_vol',         'summary',   ('data', 'summaryData', 'AverageVolume', 'value'), 'money', True), \
+               ('oneyear_target',  'summary',   ('data', 'summaryData', 'OneYrTarget', 'value'), 'money', True) ]
+    df_columns = [ 'Symbol', 'Co_name', 'arrow_updown', 'Cur_price', 'Prc_change', 'Pct_change', 'Open_price', 'Prev_close', 'Vol', 'Mkt_cap', 'Exch_timestamp', 'Time' ]
+
+######################################################################
+# method 1
+    @staticmethod
+    def dig(doc, path):
+        """Walk a JSON path. Any missing key / index / null along the way -> None"""
+        for step in path:
+            try:
+                doc = doc[step]
+            except (KeyError, IndexError, TypeError):
+                return None
+        return doc
+
+    @staticmethod
+    def extract(nq_batch):
+        """
+        Raw (uncleaned) field values of every decodable symbol, straight from the schema paths
+        A symbol with no watchlist zone (bad symbol / not a regular asset) or a failed get() is dropped
+        return : DataFrame of raw values, 1 row per symbol + asset_class & req_sym (the batch key) columns
+        """
+        cmi_debug = __name__+"::"+nq_decoder.extract.__name__
+        rows = []
+        for sym, nqb in nq_batch.items():
+            if nqb is None or nq_decoder.dig(nqb['zones'][1], ('data', 0)) is None:
+                logging.info( f"%s - {sym} has no watchlist data / dropped" % cmi_debug )
+                continue
+            zd = dict(zip(nq_decoder.zones, nqb['zones']))
+            row = {'req_sym': sym, 'asset_class': nqb['asset_class']}
+            for name, zone, path, kind, stocks_only in nq_decoder.schema:
+                row[name] = None if (stocks_only and nqb['asset_class'] != 'stocks') else nq_decoder.dig(zd[zone], path)
+            rows.append(row)
+        return pd.DataFrame(rows, columns=['req_sym', 'asset_class'] + [f[0] for f in nq_decoder.schema])
+
+######################################################################
+# method 2
+    @staticmethod
+    def cast(raw):
+        """
+        Vectorized clean & cast of every schema column (1 md_clean call per column, all symbols at once)
+        Sentinels (N/A, UNCH, '', null) -> 0.0 & are counted per symbol in the 'errors' column
+        return : DataFrame of clean typed values
+        """
+        out = pd.DataFrame(index=raw.index)
+        errors = pd.Series(0, index=raw.index, dtype=np.int64)
+        for name, zone, path, kind, stocks_only in nq_decoder.schema:
+            col = raw[name]
+            if kind == 'str':
+                out[name] = md_clean.series(col).values
+                continue
+            if kind == 'money':
+                val = md_clean.to_float(col)
+            elif kind == 'pct':
+                val = md_clean.percent(col, unsigned=True)          # magnitude only (sign is in arrow_updown)
+            elif kind == 'mcap':
+                val = (md_clean.to_float(col) / 1000000).round(3)   # nasdaq.com gives the full number. Resize to $M
+                val = val.mask(val == 0)
+            elif kind == 'open3':
+                # 3 fields in 1 string. e.g. "$140.8 +1.87 (+1.35%)" -> open price / net / pct
+                parts = md_clean.sentinel_nan(col).str.split(n=2, expand=True).reindex(columns=range(3))
+                val = md_clean.to_float(parts[0])
+                out['open_price_net'] = md_clean.to_float(parts[1]).fillna(0.0).values
+                out['open_price_pct'] = md_clean.percent(parts[2]).fillna(0.0).values
+            bad = val.isna().values
+            if not stocks_only:
+                errors += bad
+            else:
+                errors += bad & (raw['asset_class'] == 'stocks').values
+            out[name] = val.fillna(0.0).values
+        out['price'] = out['price'].round(2)
+        out['errors'] = errors.values
+        out['req_sym'] = raw['req_sym'].values
+        return out
+
+######################################################################
+# method 3
+    @staticmethod
+    def decode(nq_batch, time_now=None):
+        """
+        Decode a whole nquote.get_nquotes() batch
+        return : (quote DataFrame, dict of symbol -> qd_quote). DataFrame.attrs['errors'] = symbol -> bad field count
+                 Both are keyed by the nq_batch key (the symbol asked for), not nasdaq's co_sym
+        """
+        cmi_debug = __name__+"::"+nq_decoder.decode.__name__
+        time_now = time.strftime("%H:%M:%S", time.localtime() ) if time_now is None else time_now
+        raw = nq_decoder.extract(nq_batch)
+        c = nq_decoder.cast(raw)
+        n = len(c)
+        quote_df = pd.DataFrame( { 'Symbol': c['co_sym'].values, \
+                                   'Co_name': md_clean.pad_name(c['co_name'], 25).values, \
+                                   'arrow_updown': c['arrow_updown'].values, \
+                                   'Cur_price': c['price'].values, \
+                                   'Prc_change': c['price_net'].values, \
+                                   'Pct_change': c['price_pct'].values, \
+                                   'Open_price': c['open_price'].values, \
+                                   'Prev_close': c['prev_close'].values, \
+                                   'Vol': c['vol_abs'].values, \
+                                   'Mkt_cap': c['mkt_cap'].values, \
+                                   'Exch_timestamp': c['price_timestamp'].values, \
+                                   'Time': [time_now] * n }, columns=nq_decoder.df_columns )
+        quote_df.attrs['errors'] = dict(zip(c['req_sym'], c['errors'].tolist()))
+
+        qd_quotes = {}
+        for r in c.to_dict('records'):
+            qd_quotes[r['req_sym']] = dict( \
+                symbol=r['co_sym'], \
+                name=r['co_name'], \
+                updown=r['arrow_updown'], \
+                cur_price=r['price'], \
+                prc_change=r['price_net'], \
+                pct_change=r['price_pct'], \
+                open_price=r['open_price'], \
+                open_price_net=r['open_price_net'], \
+                open_price_pct=r['open_price_pct'], \
+                prev_close=r['prev_close'], \
+                vol=r['vol_abs'], \
+                avg_vol=r['avg_vol'], \
+                one_year_target=r['oneyear_target'], \
+                mkt_cap=r['mkt_cap'] )
+        logging.info( f"%s - decoded {n} of {len(nq_batch)} symbols / {int(c['errors'].sum())} bad fields" % cmi_debug )
+        return quote_df, qd_quotes
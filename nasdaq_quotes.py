@@ -1,9 +1,14 @@
 #! python3
 from requests_html import HTMLSession
+from http_pool import http_pool
+from rate_limiter import rate_limiter
+from nasdaq_aclass import aclass_cache
+from render_pool import render_pool
 from bs4 import BeautifulSoup
 import logging
 import argparse
 import json
+import concurrent.futures
 
 # logging setup
 logging.basicConfig(level=logging.INFO)
@@ -35,6 +40,9 @@ class nquote:
     summary_url = ""
     watchlist_url = ""
     premarket_url = ""
+    zone_pool = concurrent.futures.ThreadPoolExecutor(max_workers=3, thread_name_prefix='nq_zone')   # shared by all instances
+    batch_workers = 8       # default size of get_nquotes() bounded worker pool
+    aclass_db = None        # persistent symbol -> asset_class cache. Shared by all instances
 
 # #####################################################################################
 # REFACTOR notes
@@ -72,8 +80,10 @@ class nquote:
         self.args = global_args                                # Only set once per INIT. all methods are set globally
         #self.quote_df0 = pd.DataFrame(columns=[ 'Symbol', 'Co_name', 'arrow_updown', 'Cur_price', 'Prc_change', 'Pct_change', 'Open_price', 'Prev_close', 'Vol', 'Mkt_cap', 'Exch_timestamp', 'Time' ] )
         self.yti = yti
-        self.js_session = HTMLSession()                        # init JAVAScript processor early
+        self.js_session = http_pool.get_session('api.nasdaq.com')    # shared pooled session (nasdaq.com cookie jar)
         self.js_session.cookies.update(self.nasdaq_headers)    # load DEFAULT cookie/header hack package into session
+        if nquote.aclass_db is None:
+            nquote.aclass_db = aclass_cache(yti)               # open persistent asset class cache once per process
         return
 
 ######################################################################
@@ -115,12 +125,13 @@ class nquote:
         cmi_debug = __name__+"::"+self.form_api_endpoint.__name__+".#"+str(self.yti)
         logging.info('%s - form API endpoint URL' % cmi_debug )
         self.symbol = symbol.upper()
+        cached_ac = self.aclass_db.get(self.symbol)           # trust a previously learned asset class over the callers guess
+        if cached_ac is not None and cached_ac != aclass_cache.NEG and cached_ac != asset_class:
+            logging.info( f"%s - asset class cache override: {asset_class} -> {cached_ac}" % cmi_debug )
+            asset_class = cached_ac
         self.quote_url = "https://api.nasdaq.com/api/quote/" + self.symbol + "/info?assetclass=" + asset_class
         self.info_url = "https://api.nasdaq.com/api/quote/" + self.symbol + "/info?assetclass=" + asset_class
-        self.summary_url = "https://api.nasdaq.com/api/quote/" + self.symbol + "/summary?assetclass=" + asset_class
-        self.premarket_url = "https://api.nasdaq.com/api/quote/" + self.symbol + "/extended-trading?assetclass=" + asset_class + "&markettype=pre"
-        #
-        self.watchlist_url = "https://api.nasdaq.com/api/quote/watchlist?symbol=" + self.symbol + "%7c" + asset_class
+        self.summary_url, self.watchlist_url, self.premarket_url = self.zone_urls(self.symbol, asset_class)
         wurl_log1 = "https://api.nasdaq.com/api/quote/watchlist?symbol=" + self.symbol    # hack f-strings doesnt like "%" inside {}
         wurl_log2 = f"7c{asset_class}"         # hack f-strings doesnt like "%" inside {}
         #
@@ -187,6 +198,12 @@ class nquote:
         return : the asset identifier (stocks or etf)
         """
         cmi_debug = __name__+"::"+self.learn_aclass.__name__+".#"+str(self.yti)
+        cached_ac = self.aclass_db.get(symbol)
+        if cached_ac is not None:
+            logging.info( f"%s - Asset_class cache HIT: [ {cached_ac} ] / no network probe" % cmi_debug )
+            self.asset_class = -1 if cached_ac == aclass_cache.NEG else cached_ac
+            return 'etf' if cached_ac == aclass_cache.NEG else cached_ac     # NEG keeps the old fall-thru result
+
         logging.info( f"%s - Learn asset class @ API: {self.info_url}" % cmi_debug )
         with self.js_session.get(self.info_url, stream=True, headers=self.nasdaq_headers, cookies=self.nasdaq_headers, timeout=5 ) as self.js_resp1:
             logging.info( f"%s - Extract default guess data..." % cmi_debug )
@@ -207,6 +224,7 @@ class nquote:
                         logging.info( f'%s - Asset_class is NOT: [ {i} ] !' % cmi_debug )
                         test_info_url = ""
 
+        self.aclass_db.put(symbol, aclass_cache.NEG if self.asset_class == -1 else self.asset_class)
         logging.info( f"%s - Done" % cmi_debug )
         return i    # asset_class identifier  (stocks or etf)
 
@@ -225,23 +243,16 @@ class nquote:
         logging.info('%s - IN' % cmi_debug )
         self.qs = symbol
 
-        with self.js_session.get(self.summary_url, stream=True, headers=self.nasdaq_headers, cookies=self.nasdaq_headers, timeout=5 ) as self.js_resp1:
-            logging.info( f"%s - Stage #1 / Summary / get() data / storing..." % cmi_debug )
-            logging.info( f"%s - API: {self.summary_url}" % cmi_debug )
-            self.quote_json1 = json.loads(self.js_resp1.text)
-            logging.info( f"%s - Stage #1 - Done" % cmi_debug )
-
-        with self.js_session.get(self.watchlist_url, stream=True, headers=self.nasdaq_headers, cookies=self.nasdaq_headers, timeout=5 ) as self.js_resp2:
-            logging.info( f"%s - Stage #2 / Watchlist / get() data / storing..." % cmi_debug )
-            # cant do logging.info on self.watchlist_url b/c it has '%7c' in url as a specla seperator for nasdaq.com API
-            self.quote_json2 = json.loads(self.js_resp2.text)
-            logging.info( f"%s - Stage #2 - Done" % cmi_debug )
-
-        with self.js_session.get(self.premarket_url, stream=True, headers=self.nasdaq_headers, cookies=self.nasdaq_headers, timeout=5 ) as self.js_resp3:
-            logging.info( f"%s - Stage #3 / premarket / get() data / storing..." % cmi_debug )
-            logging.info( f"%s - API: {self.premarket_url}" % cmi_debug )
-            self.quote_json3 = json.loads(self.js_resp3.text)
-            logging.info( f"%s - Stage #3 - Done" % cmi_debug )
+        # fire all 3 zone endpoints concurrently. Wall time = slowest zone, not the sum of all 3
+        logging.info( f"%s - Zone #1/#2/#3 / Summary + Watchlist + premarket / concurrent get()..." % cmi_debug )
+        logging.info( f"%s - API: {self.summary_url}" % cmi_debug )
+        logging.info( f"%s - API: {self.premarket_url}" % cmi_debug )
+        # cant do logging.info on self.watchlist_url b/c it has '%7c' in url as a specla seperator for nasdaq.com API
+        z1, z2, z3 = self.zone_pool.map(rate_limiter.carry(self.zone_get), (self.summary_url, self.watchlist_url, self.premarket_url))
+        self.js_resp1, self.quote_json1 = z1
+        self.js_resp2, self.quote_json2 = z2
+        self.js_resp3, self.quote_json3 = z3
+        logging.info( f"%s - Zone #1/#2/#3 - Done" % cmi_debug )
 
         # Xray DEBUG
         if self.args['bool_xray'] is True:
@@ -267,7 +278,7 @@ class nquote:
         with self.js_session.get(self.quote_url, stream=True, headers=self.nasdaq_headers, cookies=self.nasdaq_headers, timeout=5 ) as self.js_resp1:
             # read the webpage with our Javascript engine processor
             logging.info('%s - Javascript engine processing...' % cmi_debug )
-            self.js_resp1.html.render()    # this isn't needed for this URL becuase is a RAW JSON output page. NOT Javascript
+            render_pool.get_shared().render_response(self.js_resp1)    # this isn't needed for this URL becuase is a RAW JSON output page. NOT Javascript
             logging.info('%s - Javascript engine completed!' % cmi_debug )
             logging.info('%s - summary json quote data package extracted / storing...' % cmi_debug )
             self.quote_json1 = json.loads(self.js_resp1.text)
@@ -279,3 +290,111 @@ class nquote:
                 print ( f"{i}" )
             print ( f"========================== {self.yti} - get_js_nquote::session cookies ================================" )
         return
+
+#######################################################################
+# method 8
+    def zone_urls(self, symbol, asset_class):
+        """
+        return : the 3 quote data zone API endpoints (summary, watchlist, premarket) for symbol
+        NOTE: pure helper. Does NOT touch any class global accessors, so its safe to call from worker threads
+        """
+        summary_url = "https://api.nasdaq.com/api/quote/" + symbol + "/summary?assetclass=" + asset_class
+        watchlist_url = "https://api.nasdaq.com/api/quote/watchlist?symbol=" + symbol + "%7c" + asset_class
+        premarket_url = "https://api.nasdaq.com/api/quote/" + symbol + "/extended-trading?assetclass=" + asset_class + "&markettype=pre"
+        return summary_url, watchlist_url, premarket_url
+
+#######################################################################
+# method 9
+    def zone_get(self, url):
+        """
+        get() 1 nasdaq.com API endpoint over the shared pooled session
+        return : (response handle, decoded JSON dataset)
+        """
+        with self.js_session.get(url, stream=True, headers=self.nasdaq_headers, cookies=self.nasdaq_headers, timeout=5 ) as zresp:
+            return zresp, json.loads(zresp.text)
+
+#######################################################################
+# method 10
+    def probe_aclass(self, symbol):
+        """
+        Thread safe version of learn_aclass(). Consults the asset class cache, then
+        probes stocks then etf info endpoints & records the result (or a NEGATIVE entry).
+        return : the asset identifier (stocks or etf)
+        """
+        cached_ac = self.aclass_db.get(symbol)
+        if cached_ac is not None:
+            return 'etf' if cached_ac == aclass_cache.NEG else cached_ac
+        t_info_url = "https://api.nasdaq.com/api/quote/" + symbol + "/info?assetclass="
+        found = aclass_cache.NEG
+        for i in ['stocks', 'etf']:
+            zresp, zjson = self.zone_get(t_info_url + i)
+            if zjson['status']['rCode'] == 200:
+                found = i
+                break
+        self.aclass_db.put(symbol, found)
+        return i    # same semantics as learn_aclass(). Falls thru to last probed class
+
+#######################################################################
+# method 11
+    def probe_many(self, symbols, workers=None):
+        """
+        Learn the asset class of many symbols concurrently (cache first)
+        return : dict of symbol -> asset_class. A failed probe maps to None
+        """
+        workers = self.batch_workers if workers is None else workers
+        ac_many = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='nq_aclass') as apool:
+            probe = rate_limiter.carry(self.probe_aclass)          # workers fetch in the callers lane
+            aclass_jobs = { apool.submit(probe, sym): sym for sym in symbols }
+            for job in concurrent.futures.as_completed(aclass_jobs):
+                try:
+                    ac_many[aclass_jobs[job]] = job.result()
+                except Exception as e:
+                    logging.info( f"{__name__}::probe_many - {aclass_jobs[job]} asset class probe FAILED: {e}" )
+                    ac_many[aclass_jobs[job]] = None
+        return ac_many
+
+#######################################################################
+# method 12
+    def get_nquotes(self, symbols, workers=None):
+        """
+        Multi-symbol BATCH quote get. Fans out over a bounded worker pool.
+        Phase 1 : learn asset class of every symbol (concurrently)
+        Phase 2 : get all 3 data zones for every symbol (concurrently)
+        return : dict keyed by symbol -> {'asset_class': ac, 'zones': (quote_json1, quote_json2, quote_json3)}
+                 zones tuple is ready for nq_wrangler.setup_zones(yti, *zones)
+                 A symbol whose get() failed maps to None
+        """
+        cmi_debug = __name__+"::"+self.get_nquotes.__name__+".#"+str(self.yti)
+        workers = self.batch_workers if workers is None else workers
+        symbols = [ s.rstrip().upper() for s in symbols ]
+        logging.info( f"%s - Batch get {len(symbols)} symbols / workers: {workers}" % cmi_debug )
+        nq_batch = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='nq_batch') as bpool:
+            # Phase 1 : asset class
+            probe = rate_limiter.carry(self.probe_aclass)          # workers fetch in the callers lane
+            zone_get = rate_limiter.carry(self.zone_get)
+            aclass_jobs = { bpool.submit(probe, sym): sym for sym in symbols }
+            zone_jobs = {}
+            for job in concurrent.futures.as_completed(aclass_jobs):
+                sym = aclass_jobs[job]
+                try:
+                    ac = job.result()
+                except Exception as e:
+                    logging.info( f"%s - {sym} asset class probe FAILED: {e}" % cmi_debug )
+                    nq_batch[sym] = None
+                    continue
+                # Phase 2 : submit all 3 data zones as soon as asset class is known
+                zone_jobs[sym] = (ac, [ bpool.submit(zone_get, u) for u in self.zone_urls(sym, ac) ])
+
+            for sym, (ac, zjobs) in zone_jobs.items():
+                try:
+                    zones = tuple( zj.result()[1] for zj in zjobs )
+                except Exception as e:
+                    logging.info( f"%s - {sym} zone get() FAILED: {e}" % cmi_debug )
+                    nq_batch[sym] = None
+                    continue
+                nq_batch[sym] = {'asset_class': ac, 'zones': zones}
+
+        logging.info( f"%s - Batch done / {sum(v is not None for v in nq_batch.values())} of {len(symbols)} OK" % cmi_debug )
+        return nq_batch
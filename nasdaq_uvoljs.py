@@ -1,5 +1,7 @@
 #! python3
 from requests_html import HTMLSession
+from http_pool import http_pool
+from md_clean import md_clean
 import pandas as pd
 import numpy as np
 import re
@@ -52,7 +54,7 @@ class un_volumes:
         self.down_df1 = pd.DataFrame(columns=[ 'Row', 'Symbol', 'Co_name', 'Cur_price', 'Prc_change', 'Pct_change', "Vol", 'Vol_pct', 'Time' ] )
         self.df2 = pd.DataFrame(columns=[ 'ERank', 'Symbol', 'Co_name', 'Cur_price', 'Prc_change', 'Pct_change', "Vol", 'Vol_pct', 'Time' ] )
         self.yti = yti
-        self.js_session = HTMLSession()                        # init JAVAScript processor early
+        self.js_session = http_pool.get_session('api.nasdaq.com')    # shared pooled session (nasdaq.com cookie jar)
         self.js_session.cookies.update(self.nasdaq_headers)    # load cookie/header hack data set into session
         return
 
@@ -129,65 +131,36 @@ class un_volumes:
         time_now = time.strftime("%H:%M:%S", time.localtime() )
         logging.info('%s - Drop all rows from DF' % cmi_debug )
         this_df.drop(this_df.index, inplace=True)
-        x = 1    # row counter Also leveraged for unique dataframe key
-        for json_data_row in dataset:
-            co_sym = json_data_row['symbol']
-            co_name = json_data_row['company']
-            price = json_data_row['lastSale']
-            price_net = json_data_row['netChange']
-            arrow_updown = json_data_row['deltaIndicator']
-            price_pct = json_data_row['percentChange']
-            vol_abs = json_data_row['shareVolume']
-            vol_pct = json_data_row['volumePctChange']
-
-            # COL NAME     variable       final varable cleansed
-            # ==================================================
-            # Row           = x              x
-            # Symbol        = co_sym         co_sym_lj
-            # Co_name       = co_name        co_name_lj
-            # Cur_price     = price          price_cl
-            # Prc_change    = price_net      price_net_cl
-            # Pct_change    = price_pct      price_pct_cl
-            # vol           = vol_abs        vol_abs_cl
-            # vol_pct       = vol_pct        vol_pct_cl
-            # Time          = time_now       time_now
-
-            # wrangle, clean, cast & prepare the data
-            co_sym_lj = np.array2string(np.char.ljust(co_sym, 6) )         # left justify TXT in DF & convert to raw string
-            co_name_lj = (re.sub('[\'\"]', '', co_name) )                  # remove " ' and strip leading/trailing spaces
-            co_name_lj = np.array2string(np.char.ljust(co_name_lj, 60) )   # left justify TXT in DF & convert to raw string
-            co_name_lj = (re.sub('[\']', '', co_name_lj) )                 # remove " ' and strip leading/trailing spaces
-
-            price_cl = (re.sub('[ $,]', '', price))                        # remove $ sign
-            price_net_cl = (re.sub('[\-+]', '', price_net))                # remove - + signs
-            price_pct_cl = (re.sub('[\-+%]', '', price_pct))               # remove - + % signs
-            vol_abs_cl = (re.sub('[,]', '', vol_abs))                      # remove ,
-            vol_pct_cl = (re.sub('[%]', '', vol_pct))                      # remover %
-
-            self.list_data = [[ \
-                       x, \
-                       re.sub('\'', '', co_sym_lj), \
-                       co_name_lj, \
-                       round(float(price_cl), 2), \
-                       round(float(price_net_cl), 2), \
-                       round(float(price_pct_cl), 2), \
-                       round(float(vol_abs_cl)), \
-                       round(float(vol_pct_cl), 1), \
-                       time_now ]]
-
-
-            self.df_1_row = pd.DataFrame(self.list_data, columns=[ 'Row', 'Symbol', 'Co_name', 'Cur_price', 'Prc_change', 'Pct_change', "Vol", 'Vol_pct', 'Time' ], index=[x] )
-            if ud == 0:
-                logging.info( '%s - append UP Volume data into DataFrame' % cmi_debug )
-                self.up_df0 = pd.concat([self.up_df0, self.df_1_row])    # append this ROW of data into the REAL DataFrame
-            else:
-                logging.info('%s - append DOWN Volume data into DataFrame' % cmi_debug )
-                self.down_df1 = pd.concat([self.down_df1, self.df_1_row])    # append this ROW of data into the REAL DataFrame
-
-            x += 1
-
-        if ud == 0: self.up_df0.reset_index(inplace=True, drop=True)           # reset index each time so its guaranteed sequential
-        if ud == 1: self.down_df1.reset_index(inplace=True, drop=True)         # reset index each time so its guaranteed sequential
+        # COL NAME     JSON field         cleansed (1 vectorized md_clean call per column)
+        # ==========================================================================
+        # Row           = row counter      1..n
+        # Symbol        = symbol           left justified 6
+        # Co_name       = company          quotes removed, left justified 60
+        # Cur_price     = lastSale         $ , removed
+        # Prc_change    = netChange        +/- sign removed
+        # Pct_change    = percentChange    +/- % removed
+        # Vol           = shareVolume      , removed
+        # Vol_pct       = volumePctChange  % removed
+        # Time          = time_now
+        raw = pd.DataFrame(list(dataset), columns=['symbol', 'company', 'lastSale', 'netChange', 'deltaIndicator', 'percentChange', 'shareVolume', 'volumePctChange'])
+        x = len(raw) + 1    # row counter (next free row). Also leveraged for unique dataframe key
+        new_df = pd.DataFrame( { 'Row': np.arange(1, x, dtype=np.int64), \
+                                 'Symbol': md_clean.series(raw['symbol']).str.ljust(6).values, \
+                                 'Co_name': md_clean.pad_name(raw['company'], 60).values, \
+                                 'Cur_price': md_clean.to_float(raw['lastSale']).round(2).values, \
+                                 'Prc_change': md_clean.to_float(raw['netChange'], strip="", unsigned=True).round(2).values, \
+                                 'Pct_change': md_clean.percent(raw['percentChange'], unsigned=True).round(2).values, \
+                                 'Vol': md_clean.to_float(raw['shareVolume']).fillna(0).round().astype(np.int64).values, \
+                                 'Vol_pct': md_clean.percent(raw['volumePctChange']).round(1).values, \
+                                 'Time': [time_now] * len(raw) } )
+
+        if ud == 0:
+            logging.info( '%s - UP Volume data DataFrame built' % cmi_debug )
+            self.up_df0 = new_df
+        else:
+            logging.info('%s - DOWN Volume data DataFrame built' % cmi_debug )
+            self.down_df1 = new_df
+
         logging.info('%s - populated new DF' % cmi_debug )
         return x        # number of rows inserted into DataFrame (0 = some kind of #FAIL)
                         # sucess = lobal class accessor (y_toplosers.df0) populated & updated
@@ -7,6 +7,7 @@ import time
 import numpy as np
 
 from bigcharts_md import bc_quote
+from md_clean import md_clean
 
 # logging setup
 logging.basicConfig(level=logging.INFO)
@@ -16,6 +17,7 @@ logging.basicConfig(level=logging.INFO)
 class nq_wrangler:
     """
     Class to wrangle, clean, manipulate & prepare Nasdaq JSNON  Market QUote Data
+    NOTE: 1 symbol at a time. For many symbols use nasdaq_decoder.nq_decoder (schema driven, vectorized batch decode)
     This class can only be instatiated after the JSON data has been pulled off the network.
     You can only wrangle data after you've read itoff the network. Never before!   
     """
@@ -370,56 +372,28 @@ class nq_wrangler:
         # >>> DEBUG Xray <<<
         if self.args['bool_xray'] is True:
             print ( f"\n================= Nasdaq quote data : raw uncleansed =================" )
-            work_on = ['self.co_sym', 'self.co_name', 'self.price', 'self.price_net', 'self.price_pct', 'self.arrow_updown', \
-                    'self.price_timestamp', 'self.vol_abs', 'self.open_price', 'self.open_volume', 'self.open_updown', \
-                    'self.prev_close', 'self.mkt_cap', 'self.today_hilo', 'self.avg_vol', 'self.oneyear_target', 'self.prev_close']
-            xx = iter(work_on)
+            work_on = ['co_sym', 'co_name', 'price', 'price_net', 'price_pct', 'arrow_updown', \
+                    'price_timestamp', 'vol_abs', 'open_price', 'open_volume', 'open_updown', \
+                    'prev_close', 'mkt_cap', 'today_hilo', 'avg_vol', 'oneyear_target']
             for name in work_on:
-                print ( f"{next(xx)} / {eval(name)}" )
+                print ( f"self.{name} / {getattr(self, name, None)}" )
         # >>> DEBUG Xray <<<
         cc_errors = 0
         #################################### Begin Deep clean ##########################################
         self.co_sym_lj = self.co_sym.strip()
         #co_sym_lj = np.array2string(np.char.ljust(co_sym, 6) )          # left justify TXT & convert to raw string
-        self.co_name_lj = (re.sub('[\'\"]', '', self.co_name) )                    # remove " ' and strip leading/trailing spaces
-        self.co_name_lj = np.array2string(np.char.ljust(self.co_name_lj, 25) )     # left justify & convert to raw string
-        self.co_name_lj = (re.sub('[\']', '', self.co_name_lj) )                   # remove " ' and strip leading/trailing spaces
+        self.co_name_lj = md_clean.pad_name([self.co_name], 25)[0]             # remove " ' & left justify
 
-        if self.price == "N/A":
-            self.price_cl = float(0)
-            logging.info('%s - Price is bad, found N/A data' % cmi_debug )
-            cc_errors += 1
-        else:
-            self.price_cl = (re.sub('[ $,]', '', self.price))                      # remove $ sign
-            self.price_cl = round(float(self.price_cl), 2)
-
-        if self.price_net == "N/A":
-            self.price_net_cl = float(0)
-            logging.info('%s - Price NET is bad, found N/A data' % cmi_debug )
-            cc_errors += 1
-        elif self.price_net == 'UNCH':
-            self.price_net_cl = float(0)
-            logging.info('%s - Price NET is unchanged' % cmi_debug )
-            cc_errors += 1
-        else:
-            self.price_net_cl = (re.sub('[\-+]', '', self.price_net))              # remove - + signs
-            self.price_net_cl = float(self.price_net)
-
-        if self.price_pct == "N/A":
-            self.price_pct_cl = float(0)
-            logging.info('%s - Price pct is bad, found N/A data' % cmi_debug )
-            cc_errors += 1
-        elif self.price_pct == "UNCH":
-            self.price_pct_cl = float(0)
-            logging.info('%s - Price pct is unchanged' % cmi_debug )
-            cc_errors += 1
-        elif self.price_pct == '':
-            self.price_pct_cl = float(0)
-            logging.info('%s - Price pct is bad, field is Null/empty' % cmi_debug )
-            cc_errors += 1
-        else:
-            self.price_pct = (re.sub('[\-+%]', '', self.price_pct))                # remove - + % signs
-            self.price_pct_cl = float(self.price_pct)
+        # price / net change / pct change in 1 vectorized pass. N/A, UNCH & '' sentinels -> NaN -> 0.0 + counted as errors
+        p3 = md_clean.to_float([self.price, self.price_net, self.price_pct], strip=" $,%")
+        for field, bad in zip(('Price', 'Price NET', 'Price pct'), p3.isna()):
+            if bad:
+                logging.info( f'%s - {field} is bad / unchanged, found N/A, UNCH or Null data' % cmi_debug )
+                cc_errors += 1
+        p3 = p3.fillna(0.0)
+        self.price_cl = round(p3[0], 2)
+        self.price_net_cl = p3[1]                   # keeps its +/- sign
+        self.price_pct_cl = abs(p3[2])              # magnitude only (sign is in arrow_updown)
 
         # ################# open price(s) need extra treatment & care...
         """
@@ -0,0 +1,143 @@
+#! python3
+import os
+import io
+import gzip
+import json
+import time
+import base64
+import hashlib
+import logging
+import threading
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# logging setup
+logging.basicConfig(level=logging.INFO)
+
+#####################################################
+
+class net_capture:
+    """
+    Record / Replay of every raw network payload that flows through the shared fetch layer (http_pool + render_pool).
+    record : each response (url, status, headers, body, capture time) is saved to <dir>/<key>.<seq>.json.gz
+    replay : responses are served back from <dir> with NO network access, in the same per-url order they were captured.
+             The last capture of a url is repeated if a run asks for it more often than it was recorded.
+    key = sha256(METHOD + " " + full url). Rendered JS pages are captured under METHOD = RENDER
+    """
+
+    # global accessors
+    mode = None             # None (live) | 'record' | 'replay'
+    cap_dir = None
+    seq = {}                # key -> next sequence num (per run)
+    seq_lock = threading.Lock()
+    captured = 0
+    replayed = 0
+
+######################################################################
+# method 1
+    @staticmethod
+    def set_mode(mode, cap_dir):
+        cmi_debug = __name__+"::"+net_capture.set_mode.__name__
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"unknown capture mode: {mode}")
+        if mode == 'replay' and not os.path.isdir(cap_dir):
+            raise FileNotFoundError(f"replay dir not found: {cap_dir}")
+        os.makedirs(cap_dir, exist_ok=True)
+        net_capture.mode = mode
+        net_capture.cap_dir = cap_dir
+        net_capture.seq = {}
+        logging.info( f"%s - network capture mode: {mode} @ {cap_dir}" % cmi_debug )
+        return
+
+    @staticmethod
+    def active():
+        """True when recording or replaying. Persistent caches step aside so every payload hits the fetch layer"""
+        return net_capture.mode is not None
+
+######################################################################
+# method 2
+    @staticmethod
+    def key_of(method, url):
+        return hashlib.sha256(f"{method} {url}".encode()).hexdigest()
+
+    @staticmethod
+    def next_seq(key):
+        with net_capture.seq_lock:
+            n = net_capture.seq.get(key, 0)
+            net_capture.seq[key] = n + 1
+        return n
+
+    @staticmethod
+    def path_of(key, n):
+        return os.path.join(net_capture.cap_dir, f"{key}.{n:04d}.json.gz")
+
+######################################################################
+# method 3
+    @staticmethod
+    def save(method, url, status, headers, body):
+        """Write 1 captured payload to disk"""
+        key = net_capture.key_of(method, url)
+        rec = { 'method': method, \
+                'url': url, \
+                'status': status, \
+                'headers': dict(headers), \
+                'captured': time.time(), \
+                'body': base64.b64encode(body).decode('ascii') }
+        with gzip.open(net_capture.path_of(key, net_capture.next_seq(key)), "wt") as f:
+            json.dump(rec, f)
+        with net_capture.seq_lock:
+            net_capture.captured += 1
+        return
+
+    @staticmethod
+    def load(method, url):
+        """return : the next captured record for method + url. Raises ConnectionError if never captured"""
+        key = net_capture.key_of(method, url)
+        n = net_capture.next_seq(key)
+        while n > 0 and not os.path.exists(net_capture.path_of(key, n)):
+            n -= 1          # ran past the end of the recorded sequence. Repeat the last capture
+        try:
+            with gzip.open(net_capture.path_of(key, n), "rt") as f:
+                rec = json.load(f)
+        except FileNotFoundError:
+            raise requests.exceptions.ConnectionError(f"replay: no capture for {method} {url}")
+        with net_capture.seq_lock:
+            net_capture.replayed += 1
+        rec['body'] = base64.b64decode(rec['body'])
+        return rec
+
+######################################################################
+# method 4
+    @staticmethod
+    def record_response(request, resp):
+        net_capture.save(request.method, request.url, resp.status_code, resp.headers, resp.content)
+        return
+
+    @staticmethod
+    def replay_response(request, adapter):
+        """Rebuild a requests.Response from a capture (hooks like HTMLSession's still run on top of it)"""
+        rec = net_capture.load(request.method, request.url)
+        resp = requests.Response()
+        resp.status_code = rec['status']
+        resp.headers = CaseInsensitiveDict(rec['headers'])
+        resp.encoding = get_encoding_from_headers(resp.headers)
+        resp._content = rec['body']
+        resp._content_consumed = True
+        resp.raw = io.BytesIO(rec['body'])
+        resp.url = request.url
+        resp.reason = "Replayed"
+        resp.request = request
+        resp.connection = adapter
+        return resp
+
+######################################################################
+# method 5
+    @staticmethod
+    def record_render(url, content):
+        net_capture.save("RENDER", url, 200, {}, content.encode('utf-8'))
+        return
+
+    @staticmethod
+    def replay_render(url):
+        return net_capture.load("RENDER", url)['body'].decode('utf-8')
@@ -0,0 +1,82 @@
+import sys
+import gzip
+import json
+import time
+import base64
+import argparse
+import logging
+from fast_parse import fast_parse
+
+# Parse mode benchmark harness : classic (html.parser, whole page) vs fast (lxml + SoupStrainer)
+# for every page target the scrapers use (see fast_parse.targets)
+#   python profile_parse.py                                  # synthetic ~300KB pages, all targets
+#   python profile_parse.py -t screener -p page.html         # a saved page for 1 target
+#   python profile_parse.py -t bc_basic -c <capture>.json.gz # a page recorded by aop.py --record DIR
+
+# what each scraper reads out of its parsed doc. Used for the classic vs fast parity check
+PROBES = { 'screener': lambda d: d.find('tbody'), \
+           'bc_basic': lambda d: d.find(attrs={"id": "quote"}), \
+           'bc_quick': lambda d: (d.find("h1", attrs={"class": "quote"}), d.find("table", attrs={"id": "quote"}), d.find("table", attrs={"class": "financials"})), \
+           'mw_quote': lambda d: d.find(attrs={"id": "quote"}) }
+
+def junk(kb):
+    """Rich media padding, roughly kb KB of nav / script / div soup"""
+    block = "<div class='nav'><ul>" + "".join(f"<li><a href='/x/{i}'>link {i}</a></li>" for i in range(20)) + "</ul></div>" \
+            "<script>var cfg = {" + ",".join(f"k{i}: {i}" for i in range(40)) + "};</script>"
+    return block * max(1, (kb * 1024) // len(block))
+
+def synth_page(target):
+    rows = "".join( f"<tr><td>SY{i}</td><td>Co {i}</td><td><canvas></canvas></td><td>{i}.25</td><td>+0.{i}</td><td>+{i}%</td>"
+                    f"<td>1.2M</td><td>3.4M</td><td>5.6B</td><td>N/A</td></tr>" for i in range(100) )
+    quote = "<table id='quote'>" + "".join(f"<tr><td>Label {i}:</td><td>{i}.5</td></tr>" for i in range(6)) + "</table>"
+    if target == 'screener':
+        body = f"<table><thead><tr><th>Symbol</th></tr></thead><tbody>{rows}</tbody></table>"
+    elif target == 'bc_quick':
+        body = "<h1 class='quote'><div>Co</div><div>x</div><div>y</div><div>1.0 +0.1</div></h1>" + quote + \
+               "<table class='financials'>" + "".join(f"<tr><td>Fin {i}:</td><td>{i}</td></tr>" for i in range(10)) + "</table>"
+    else:
+        body = quote
+    return f"<html><head><title>t</title></head><body>{junk(150)}{body}{junk(150)}</body></html>"
+
+def tree_text(node):
+    if isinstance(node, tuple):
+        return "|".join(tree_text(n) for n in node)
+    return " ".join(node.stripped_strings) if node is not None else ""
+
+def bench(target, html, loops):
+    texts = {m: tree_text(PROBES[target](fast_parse.soup(html, target, mode=m))) for m in fast_parse.modes}
+    parity = "OK" if texts['classic'] == texts['fast'] else "MISMATCH"
+    secs = {}
+    for m in fast_parse.modes:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fast_parse.soup(html, target, mode=m)
+        secs[m] = (time.perf_counter() - t0) / loops
+    print ( f"{target:10} {len(html) // 1024:5} KB  classic: {secs['classic'] * 1000:8.2f} ms  fast: {secs['fast'] * 1000:8.2f} ms  "
+            f"speedup: {secs['classic'] / secs['fast']:5.1f}x  parity: {parity}" )
+    return parity == "OK"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="classic vs fast parse mode benchmark")
+    parser.add_argument('-t','--target', help='page target', action='store', dest='target', choices=list(fast_parse.targets), required=False, default=None)
+    parser.add_argument('-p','--page', help='saved html page', action='store', dest='page', required=False, default=None)
+    parser.add_argument('-c','--capture', help='aop --record capture file (.json.gz)', action='store', dest='capture', required=False, default=None)
+    parser.add_argument('-n','--loops', help='timed loops', action='store', type=int, dest='loops', required=False, default=10)
+    cargs = vars(parser.parse_args())
+    logging.disable(20)
+
+    if cargs['capture'] is not None or cargs['page'] is not None:
+        if cargs['target'] is None:
+            parser.error("-t TARGET is required with -p / -c")
+        if cargs['capture'] is not None:
+            with gzip.open(cargs['capture'], "rt") as f:
+                html = base64.b64decode(json.load(f)['body']).decode('utf-8', 'replace')
+        else:
+            with open(cargs['page'], encoding='utf-8') as f:
+                html = f.read()
+        pages = {cargs['target']: html}
+    else:
+        pages = {t: synth_page(t) for t in ([cargs['target']] if cargs['target'] else fast_parse.targets)}
+
+    ok = all([bench(t, html, cargs['loops']) for t, html in pages.items()])
+    sys.exit(0 if ok else 1)
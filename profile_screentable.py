@@ -0,0 +1,109 @@
+import re
+import sys
+import gzip
+import json
+import time
+import base64
+import argparse
+import logging
+import numpy as np
+import pandas as pd
+from bs4 import BeautifulSoup
+from y_screentable import screen_table
+
+# Micro-benchmark : legacy row-by-row screener DF0 build vs the shared columnar screen_table extractor
+#   python profile_screentable.py                        # synthetic 100 row /markets/stocks/ page
+#   python profile_screentable.py -p page.html           # a saved yahoo page
+#   python profile_screentable.py -c <capture>.json.gz   # a page recorded by aop.py --record DIR
+
+COLS = [ 'Row', 'Symbol', 'Co_name', 'Cur_price', 'Prc_change', 'Pct_change', 'Mkt_cap', 'M_B', 'Time' ]
+
+def synth_page(rows=100):
+    """A /markets/stocks/most-active/ shaped table with rows <tr>"""
+    scales = ["1.204T", "15.753B", "812.4M", "N/A"]
+    trs = []
+    for i in range(rows):
+        sign = "+" if i % 3 else "-"
+        trs.append( f"<tr><td><a>SY{i:03d}</a></td><td><div>Company {i}, Inc.</div></td><td><canvas></canvas></td>"
+                    f"<td><fin-streamer>{1000 + i * 1.37:,.2f}</fin-streamer></td>"
+                    f"<td><span>{sign}{i * 0.11:.2f}</span></td><td><span>{sign}{i * 0.07:.2f}%</span></td>"
+                    f"<td>{i * 3.1:.3f}M</td><td>{i * 2.9:.3f}M</td><td>{scales[i % 4]}</td><td>N/A</td><td><canvas></canvas></td></tr>" )
+    return "<html><body><table><tbody>" + "".join(trs) + "</tbody></table></body></html>"
+
+def legacy_build(tr_rows, time_now):
+    """The pre-screen_table build_tg_df0() loop (logging removed), kept as the benchmark baseline"""
+    df0 = pd.DataFrame()
+    x = 0
+    for datarow in tr_rows:
+        def extr_gen():
+            for i in datarow.find_all("td"):
+                if i.canvas is not None:
+                    yield ( f"canvas" )
+                else:
+                    yield ( f"{next(i.stripped_strings)}" )
+        extr_strs = extr_gen()
+        co_sym = next(extr_strs)
+        co_name = next(extr_strs)
+        mini_chart = next(extr_strs)
+        price = next(extr_strs)
+        change_sign = next(extr_strs)
+        change_val = next(extr_strs) if change_sign in ("+", "-") else change_sign
+        pct_sign = next(extr_strs)
+        pct_val = next(extr_strs) if pct_sign in ("+", "-") else pct_sign
+        vol = next(extr_strs)
+        avg_vol = next(extr_strs)
+        mktcap = next(extr_strs)
+        co_sym_lj = f"{co_sym:<6}"
+        co_name_lj = np.array2string(np.char.ljust(co_name, 60) )
+        co_name_lj = (re.sub(r'[\'\"]', '', co_name_lj) )
+        price_clean = float(re.sub(r'\,', '', price))
+        change_clean = float(change_val)
+        pct_clean = 0.0 if pct_val == "N/A" else float(re.sub(r'[\%\+\-,]', "", pct_val ))
+        mktcap = (re.sub(r'[N\/A]', '0', mktcap))
+        mktcap_clean, mb = 0, "LZ"
+        for scale in ("T", "B", "M"):
+            if re.search(scale, mktcap):
+                mktcap_clean, mb = float(re.sub(scale, '', mktcap)), "L" + scale
+        list_data = [[ x, re.sub(r'\'', '', co_sym_lj), co_name_lj, price_clean, change_clean, pct_clean, mktcap_clean, mb, time_now ]]
+        df0 = pd.concat([df0, pd.DataFrame(list_data, columns=COLS, index=[x])])
+        x += 1
+    return df0
+
+def bench(label, fn, rows, loops):
+    fn()                            # warm up
+    t0 = time.perf_counter()
+    for _ in range(loops):
+        fn()
+    secs = (time.perf_counter() - t0) / loops
+    print ( f"{label:24} {secs * 1000:9.3f} ms/page   {rows / secs:12,.0f} rows/sec" )
+    return secs
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Screener table extractor micro-benchmark")
+    parser.add_argument('-p','--page', help='saved html page', action='store', dest='page', required=False, default=None)
+    parser.add_argument('-c','--capture', help='aop --record capture file (.json.gz)', action='store', dest='capture', required=False, default=None)
+    parser.add_argument('-n','--loops', help='timed loops', action='store', type=int, dest='loops', required=False, default=20)
+    cargs = vars(parser.parse_args())
+    logging.disable(20)
+
+    if cargs['capture'] is not None:
+        with gzip.open(cargs['capture'], "rt") as f:
+            html = base64.b64decode(json.load(f)['body']).decode('utf-8', 'replace')
+    elif cargs['page'] is not None:
+        with open(cargs['page'], encoding='utf-8') as f:
+            html = f.read()
+    else:
+        html = synth_page(100)
+
+    tr_rows = BeautifulSoup(html, 'html.parser').find('tbody').find_all("tr")
+    rows = len(tr_rows)
+    st = screen_table(1)
+    old_df = legacy_build(tr_rows, "00:00:00")
+    new_df = st.build_df(tr_rows, "00:00:00")
+    pd.testing.assert_frame_equal(old_df.reset_index(drop=True), new_df, check_dtype=False)
+    print ( f"Parity OK : {rows} rows" )
+
+    t_old = bench("legacy row-by-row", lambda: legacy_build(tr_rows, "00:00:00"), rows, cargs['loops'])
+    t_new = bench("screen_table columnar", lambda: st.build_df(tr_rows, "00:00:00"), rows, cargs['loops'])
+    print ( f"Speedup : {t_old / t_new:.1f}x" )
+    sys.exit(0)
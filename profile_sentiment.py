@@ -1,6 +1,7 @@
 import time
 import torch
-from ml_sentiment import SentimentAnalysisModel
+from ml_backends import BACKENDS, PARITY_CORPUS
+from ml_registry import ModelRegistry
 
 def profile_bulk_predict_sentiment(model, texts):
     """
@@ -18,10 +19,34 @@ def profile_bulk_predict_sentiment(model, texts):
     print(f"Throughput: {texts_per_second:.2f} texts/second.")
     return duration, texts_per_second
 
+def profile_backends(model, texts):
+    """
+    Profiles every inference backend on the same texts and checks its labels against fp32.
+    Backends that can't be built here (e.g. onnxruntime not installed) are reported and skipped.
+    """
+    report = {}
+    for backend in BACKENDS:
+        try:
+            model.set_backend(backend)
+        except (ImportError, ValueError) as e:
+            print(f"[{backend}] skipped: {e}")
+            continue
+        model.bulk_predict_sentiment(texts[:10])            # warm-up
+        parity = model.parity_check()
+        print(f"[{backend}] fp32 label agreement: {parity['agreement']:.2%} on {len(PARITY_CORPUS)} texts")
+        _, texts_per_second = profile_bulk_predict_sentiment(model, texts)
+        report[backend] = texts_per_second
+    model.set_backend('torch')
+
+    print("\nBackend      texts/sec   vs torch")
+    for backend, texts_per_second in report.items():
+        print(f"{backend:<10} {texts_per_second:>10.2f}   {texts_per_second / report.get('torch', texts_per_second):>7.2f}x")
+    return report
+
 if __name__ == "__main__":
     print("Initializing model...")
-    # Initialize the model
-    sentiment_model = SentimentAnalysisModel()
+    # Initialize the model (shared process-wide instance)
+    sentiment_model = ModelRegistry.get()
     
     # Generate a list of sample texts for profiling
     sample_texts = [
@@ -40,4 +65,9 @@ if __name__ == "__main__":
         sentiment_model.bulk_predict_sentiment(sample_texts[:10])
 
     # Profile the function
-    profile_bulk_predict_sentiment(sentiment_model, sample_texts)
\ No newline at end of file
+    profile_bulk_predict_sentiment(sentiment_model, sample_texts)
+
+    # Profile each CPU inference backend
+    if sentiment_model.device == "cpu":
+        print("\nProfiling inference backends...")
+        profile_backends(sentiment_model, sample_texts)
@@ -0,0 +1,184 @@
+#! python3
+import time
+import heapq
+import itertools
+import threading
+import logging
+from contextlib import contextmanager
+from urllib.parse import urlparse
+from rich import print
+
+# logging setup
+logging.basicConfig(level=logging.INFO)
+
+#####################################################
+
+class token_bucket:
+    """
+    1 host's token bucket. rate = tokens refilled per sec, burst = bucket depth.
+    Waiters queue in priority order (lower lane num 1st, then FIFO), so an interactive
+    request always takes the next free token ahead of queued bulk requests.
+    """
+
+    def __init__(self, host, rate, burst):
+        self.host = host
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)          # start full
+        self.stamp = time.monotonic()
+        self.cond = threading.Condition()
+        self.waiters = []                   # heap of (lane_num, seq) tickets
+        self.seq = itertools.count()
+        self.granted = 0
+        self.waited = 0.0                   # total secs callers spent blocked
+        return
+
+    def refill(self):
+        """Caller holds self.cond"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+        return
+
+    def take(self, lane_num):
+        """Block until this caller owns 1 token. return : secs spent waiting"""
+        t0 = time.monotonic()
+        with self.cond:
+            ticket = (lane_num, next(self.seq))
+            heapq.heappush(self.waiters, ticket)
+            self.cond.notify_all()          # a new head of queue may have just arrived
+            while True:
+                self.refill()
+                if self.waiters[0] == ticket:
+                    if self.tokens >= 1.0:
+                        heapq.heappop(self.waiters)
+                        self.tokens -= 1.0
+                        self.granted += 1
+                        self.cond.notify_all()      # wake the next in line
+                        break
+                    self.cond.wait((1.0 - self.tokens) / self.rate)
+                else:
+                    self.cond.wait()                # not my turn. Woken when the head moves
+            waited = time.monotonic() - t0
+            self.waited += waited
+        return waited
+
+#####################################################
+
+class rate_limiter:
+    """
+    Central per-host fetch scheduler. Every outbound request takes a token from its hosts bucket
+    1st, so parallel scrapers cant stampede yahoo/nasdaq into throttling us.
+    Hooked into http_pool's adapter (all scraper sessions) + the data_ingestion API clients.
+    Priority lanes are per thread : rate_limiter.set_lane('interactive') or  with rate_limiter.lane('bulk'): ...
+    Work handed to a worker pool must be wrapped with rate_limiter.carry(fn) so it runs in the submitters lane
+    """
+
+    # global accessors
+    # host -> (rate tokens/sec, burst). Matched on host suffix, so www. / query1. etc share 1 bucket
+    host_rates = { \
+                   'finance.yahoo.com': (4.0, 8), \
+                   'api.nasdaq.com': (4.0, 8), \
+                   'bigcharts.marketwatch.com': (2.0, 4), \
+                   'alphavantage.co': (5 / 60, 5), \
+                   'api.twitter.com': (0.5, 5) }       # 450 req / 15 mins
+    default_rate = (8.0, 16)
+    lanes = {'interactive': 0, 'normal': 1, 'bulk': 2}
+    buckets = {}            # bucket key -> token_bucket
+    reg_lock = threading.Lock()
+    tls = threading.local() # per thread priority lane
+    enabled = True
+
+######################################################################
+# method 1
+    @staticmethod
+    def configure(host, rate, burst):
+        """Set (or change) a hosts rate + burst. Drops any existing bucket so the new limits apply now"""
+        with rate_limiter.reg_lock:
+            rate_limiter.host_rates[host] = (rate, burst)
+            rate_limiter.buckets.pop(host, None)
+        return
+
+    @staticmethod
+    def bucket_key(host):
+        """Map a hostname to its configured bucket. Unknown hosts get their own default sized bucket"""
+        host = (host or "").lower()
+        for h in rate_limiter.host_rates:
+            if host == h or host.endswith("." + h):
+                return h
+        return host
+
+######################################################################
+# method 2
+    @staticmethod
+    def set_lane(lane):
+        if lane not in rate_limiter.lanes:
+            raise ValueError(f"unknown priority lane: {lane}")
+        rate_limiter.tls.lane = lane
+        return
+
+    @staticmethod
+    def get_lane():
+        return getattr(rate_limiter.tls, 'lane', 'normal')
+
+    @staticmethod
+    @contextmanager
+    def lane(lane):
+        """Run a block of fetches in a priority lane, then restore the previous lane"""
+        prev = rate_limiter.get_lane()
+        rate_limiter.set_lane(lane)
+        try:
+            yield
+        finally:
+            rate_limiter.set_lane(prev)
+
+    @staticmethod
+    def carry(fn):
+        """
+        Wrap fn so it runs in the lane of the thread calling carry() (i.e. the thread submitting the job)
+        Pool worker threads have no lane of their own. Use on every executor submit() / map()
+        """
+        lane = rate_limiter.get_lane()
+        def in_lane(*args, **kwargs):
+            with rate_limiter.lane(lane):
+                return fn(*args, **kwargs)
+        return in_lane
+
+######################################################################
+# method 3
+    @staticmethod
+    def acquire(target, lane=None):
+        """
+        Block until a request to target (URL or bare host) is allowed to go out.
+        lane : priority lane name. Default = this threads current lane
+        return : secs spent waiting
+        """
+        cmi_debug = __name__+"::"+rate_limiter.acquire.__name__
+        if rate_limiter.enabled is False:
+            return 0.0
+        host = urlparse(target).hostname if '//' in target else target.split('/')[0]
+        key = rate_limiter.bucket_key(host)
+        with rate_limiter.reg_lock:
+            b = rate_limiter.buckets.get(key)
+            if b is None:
+                rate, burst = rate_limiter.host_rates.get(key, rate_limiter.default_rate)
+                b = rate_limiter.buckets[key] = token_bucket(key, rate, burst)
+        lane = rate_limiter.get_lane() if lane is None else lane
+        waited = b.take(rate_limiter.lanes[lane])
+        if waited > 0.05:
+            logging.info( f"%s - {key} [{lane}] paced: {waited:.2f} secs" % cmi_debug )
+        return waited
+
+######################################################################
+# method 4
+    @staticmethod
+    def stats():
+        with rate_limiter.reg_lock:
+            return { k: {'granted': b.granted, 'waited_secs': round(b.waited, 3)} for k, b in rate_limiter.buckets.items() }
+
+    @staticmethod
+    def print_stats():
+        print ( f"========== Fetch scheduler : per host pacing ==========" )
+        for h, v in sorted(rate_limiter.stats().items()):
+            print ( f"{h:32} granted: {v['granted']:4}  waited: {v['waited_secs']:8.3f} secs" )
+        return
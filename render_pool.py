@@ -0,0 +1,226 @@
+#! python3
+import asyncio
+import concurrent.futures
+import threading
+import logging
+import time
+from collections import deque
+from requests_html import HTML
+from net_capture import net_capture
+
+# logging setup
+logging.basicConfig(level=logging.INFO)
+
+#####################################################
+
+class render_pool:
+    """
+    Long-lived headless Chromium render pool (pyppeteer), shared by every JS render call site.
+    Replaces per-call resp.html.render(), which launches a brand new Chromium each time.
+    - max_browsers Chromium processes (hard cap), each with pages_per_browser warm tabs
+    - idle tabs wait in an asyncio.Queue. A render borrows 1 tab & hands it back when done
+    - a tab is closed + re-opened after recycle_after renders (bounds Chromium memory creep)
+    - a tab that errored is recycled. If its browser cant open a new tab (crashed), the browser is relaunched
+    - every borrowed tab is handed back, even when its recycle fails (it is retried on next use)
+    - the last stat_window per-render wall times are kept for stats()
+    The pool runs on its own private event loop thread, so sync callers just use render_sync()
+    """
+
+    # global accessors
+    max_browsers = 1        # cap on concurrent Chromium processes
+    pages_per_browser = 3   # N warm pages (tabs) per browser
+    recycle_after = 20      # K renders per page before it is recycled
+    stat_window = 1000      # render wall times kept for stats()
+    sync_grace = 5          # secs render_sync() waits past the render timeout before it gives up & cancels
+    shared = None           # process-wide singleton (see get_shared)
+    shared_lock = threading.Lock()
+    launch_args = ['--no-sandbox', '--disable-gpu', '--disable-dev-shm-usage']
+
+    def __init__(self, yti, browsers=None, pages=None, recycle=None):
+        cmi_debug = __name__+"::"+self.__init__.__name__
+        logging.info( f'%s - Instantiate.#{yti}' % cmi_debug )
+        self.yti = yti
+        self.max_browsers = self.max_browsers if browsers is None else browsers
+        self.pages_per_browser = self.pages_per_browser if pages is None else pages
+        self.recycle_after = self.recycle_after if recycle is None else recycle
+        self.loop = None            # private event loop (runs in self.loop_thread)
+        self.loop_thread = None
+        self.browsers = []
+        self.idle = None            # asyncio.Queue of idle [browser_idx, page, renders] slots. page None = recycle pending
+        self.browser_locks = []     # 1 asyncio.Lock per browser. Serializes relaunches
+        self.start_lock = threading.Lock()
+        self.render_times = deque(maxlen=self.stat_window)     # wall secs of the last successful renders
+        self.renders = 0
+        self.render_fails = 0
+        self.recycles = 0
+        self.recycle_fails = 0
+        self.relaunches = 0
+        return
+
+######################################################################
+# method 1
+    @staticmethod
+    def get_shared():
+        """return : the process-wide render pool, created on 1st use"""
+        with render_pool.shared_lock:
+            if render_pool.shared is None:
+                render_pool.shared = render_pool(1)
+        return render_pool.shared
+
+######################################################################
+# method 2
+    def start(self):
+        """Spin up the private event loop thread, launch the browsers & warm all pages. Idempotent"""
+        cmi_debug = __name__+"::"+self.start.__name__+".#"+str(self.yti)
+        with self.start_lock:
+            if self.loop is not None:
+                return
+            self.loop = asyncio.new_event_loop()
+            self.loop_thread = threading.Thread(target=self.loop.run_forever, name='render_pool', daemon=True)
+            self.loop_thread.start()
+            logging.info( f"%s - warm {self.max_browsers} browser(s) x {self.pages_per_browser} page(s)" % cmi_debug )
+            asyncio.run_coroutine_threadsafe(self.warm(), self.loop).result()
+        return
+
+    async def launch_browser(self):
+        from pyppeteer import launch     # lazy: only pay for pyppeteer when something really renders
+        # signal handlers can only be installed from the main thread. This loop is not
+        return await launch(headless=True, args=self.launch_args, handleSIGINT=False, handleSIGTERM=False, handleSIGHUP=False)
+
+    async def warm(self):
+        self.idle = asyncio.Queue()
+        for b in range(self.max_browsers):
+            browser = await self.launch_browser()
+            self.browsers.append(browser)
+            self.browser_locks.append(asyncio.Lock())
+            for p in range(self.pages_per_browser):
+                page = await browser.newPage()
+                self.idle.put_nowait([b, page, 0])
+        return
+
+######################################################################
+# method 3
+    async def render(self, url, timeout=10):
+        """
+        Render url in a warm pool page (queues if all pages are busy)
+        return : fully rendered page markup (str)
+        """
+        cmi_debug = __name__+"::"+self.render.__name__+".#"+str(self.yti)
+        slot = await self.idle.get()
+        t0 = time.perf_counter()
+        try:
+            if slot[1] is None:                 # an earlier recycle failed. Retry before use
+                await self.recycle(slot)
+            await slot[1].goto(url, timeout=int(timeout * 1000), waitUntil='load')
+            content = await slot[1].content()
+        except Exception:
+            self.render_fails += 1
+            slot[2] = self.recycle_after        # a page that errored is always recycled
+            raise
+        else:
+            self.renders += 1
+            self.render_times.append(time.perf_counter() - t0)
+            logging.info( f"%s - rendered in {self.render_times[-1]:.3f} secs" % cmi_debug )
+            slot[2] += 1
+            return content
+        finally:
+            if slot[2] >= self.recycle_after:
+                try:
+                    await self.recycle(slot)
+                except Exception as e:
+                    self.recycle_fails += 1
+                    logging.warning( f"%s - page recycle failed : {e!r} / retry on next use" % cmi_debug )
+            self.idle.put_nowait(slot)          # always hand the slot back
+
+    async def recycle(self, slot):
+        """Close a worn page & open a fresh one in the same browser. Relaunch the browser if it cant open a page"""
+        page, slot[1] = slot[1], None
+        if page is not None:
+            try:
+                await page.close()
+            except Exception:
+                pass
+        browser = self.browsers[slot[0]]
+        try:
+            slot[1] = await browser.newPage()
+        except Exception:
+            async with self.browser_locks[slot[0]]:
+                if self.browsers[slot[0]] is browser:       # not already relaunched by another slot
+                    await self.relaunch(slot[0])
+            slot[1] = await self.browsers[slot[0]].newPage()
+        slot[2] = 0
+        self.recycles += 1
+        return
+
+    async def relaunch(self, b):
+        """Replace browser b (crashed / unresponsive) with a fresh Chromium"""
+        cmi_debug = __name__+"::"+self.relaunch.__name__+".#"+str(self.yti)
+        logging.warning( f"%s - relaunch browser {b}" % cmi_debug )
+        try:
+            await self.browsers[b].close()
+        except Exception:
+            pass
+        self.browsers[b] = await self.launch_browser()
+        self.relaunches += 1
+        return
+
+######################################################################
+# method 4
+    def render_sync(self, url, timeout=10):
+        """Blocking wrapper around render() for the (sync) scraper classes. Thread safe"""
+        self.start()
+        fut = asyncio.run_coroutine_threadsafe(self.render(url, timeout), self.loop)
+        try:
+            return fut.result(timeout + self.sync_grace)
+        except concurrent.futures.TimeoutError:
+            fut.cancel()            # dont leave render() parked on the queue / page. Its slot is handed back
+            raise
+
+######################################################################
+# method 5
+    def render_response(self, resp, timeout=10):
+        """
+        Drop-in replacement for resp.html.render(timeout=...)
+        Renders resp.url in the pool & swaps the rendered markup into resp.html (same as requests_html does)
+        """
+        if net_capture.mode == 'replay':
+            content = net_capture.replay_render(resp.url)     # no Chromium at all when replaying
+        else:
+            content = self.render_sync(resp.url, timeout)
+            if net_capture.mode == 'record':
+                net_capture.record_render(resp.url, content)
+        rendered = HTML(url=resp.url, html=content.encode('utf-8'), default_encoding='utf-8')
+        resp.html.__dict__.update(rendered.__dict__)
+        return resp
+
+######################################################################
+# method 6
+    def stats(self):
+        rt = sorted(self.render_times)
+        n = len(rt)
+        return { 'renders': self.renders, \
+                 'fails': self.render_fails, \
+                 'recycles': self.recycles, \
+                 'recycle_fails': self.recycle_fails, \
+                 'relaunches': self.relaunches, \
+                 'browsers': len(self.browsers), \
+                 'mean_secs': round(sum(rt) / n, 3) if n else 0.0, \
+                 'p50_secs': round(rt[n // 2], 3) if n else 0.0, \
+                 'max_secs': round(rt[-1], 3) if n else 0.0 }
+
+######################################################################
+# method 7
+    def close(self):
+        """Shut down all browsers & stop the private event loop"""
+        if self.loop is None:
+            return
+        async def close_all():
+            for browser in self.browsers:
+                await browser.close()
+        asyncio.run_coroutine_threadsafe(close_all(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.loop_thread.join()
+        self.browsers = []
+        self.browser_locks = []
+        self.loop = None
+        return
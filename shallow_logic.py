@@ -9,7 +9,7 @@ logging.basicConfig(level=logging.INFO)
 
 # my private classes & methods
 from nasdaq_quotes import nquote
-from nasdaq_wrangler import nq_wrangler
+from nasdaq_decoder import nq_decoder
 
 #####################################################
 # CLASS
@@ -102,42 +102,33 @@ class combo_logic:
 
         ############################### get quote Setup #################################
         # Get missing data from nasdaq.com. Rewrite in into combo_df.
-        # This is network expensive - do a live network quote get for each stock
+        # This is network expensive. So get ALL symbols in 1 concurrent batch, then wrangle each one
         logging.info( f"%s  - Get quote data from nasdaq.com for:  {len(uvol_badsymbols)} symbols" % cmi_debug )
         print ( f"========== ask nasdaq.com for missing quote data =====================================================" )
+        ac_known = sum( nq.aclass_db.peek(sym) is not None for sym in uvol_badsymbols )    # uncounted. get_nquotes() does the real lookups
+        logging.info( f"%s  - asset class cache: {ac_known} of {len(uvol_badsymbols)} symbols already known" % cmi_debug )
+        nq_batch = nq.get_nquotes(uvol_badsymbols)      # symbol -> {asset_class, zones} for every bad symbol
+        nq_df, nq_quotes = nq_decoder.decode(nq_batch)  # decode ALL symbols in 1 vectorized pass -> symbol -> qd_quote
         for qsymbol in uvol_badsymbols:
             xsymbol = qsymbol
             qsymbol = qsymbol.rstrip()                   # cleand/striped of trailing spaces
             logging.info( f"%s  - get quote:  {qsymbol} : {self.loop_count}" % cmi_debug )
-            nq.update_headers(qsymbol, "stocks")         # nasdaq.com session - set path: header object
-            nq.form_api_endpoint(qsymbol, "stocks")      # nasdaq.com set API endpoint - default GUESS asset_class=stocks
-            ac = nq.learn_aclass(qsymbol)                # nasdaq.com lead what the real asset class is
-
-            if ac != "stocks":
-                logging.info( f"%s  - re-shape asset class endpoint to: {ac}" % cmi_debug )
-                nq.form_api_endpoint(qsymbol, ac)        # re-form API endpoint if default asset_class guess was wrong
-                nq.get_nquote(qsymbol.upper())          # get a live quote
-                wq = nq_wrangler(4, self.args)           # instantiate a class for Quote Data Wrangeling
-                wq.asset_class = ac
-                wq.setup_zones(4, nq.quote_json1, nq.quote_json2, nq.quote_json3)
-                wq.do_wrangle()
-                wq.clean_cast()
-                wq.build_data_sets() 
-                print ( f"{qsymbol:5}...", end="", flush=True )         # >> pretty printer <<
-            else:
-                nq.get_nquote(qsymbol.upper())           # get a live quote
-                wq = nq_wrangler(3, self.args)           # instantiate a class for Quote Data Wrangeling
-                wq.asset_class = ac
-                wq.setup_zones(3, nq.quote_json1, nq.quote_json2, nq.quote_json3)
-                wq.do_wrangle()
-                wq.clean_cast()
-                wq.build_data_sets()     
-                print ( f"{qsymbol:5}...", end="", flush=True )         # >> pretty printer <<
+            nqb = nq_batch.get(qsymbol.upper())
+            qd_quote = nq_quotes.get(qsymbol.upper())
+            if nqb is None or qd_quote is None:          # batch get() failed or no decodable quote data for this symbol
+                logging.info( f"%s  - NO quote data for: {qsymbol} / skipping" % cmi_debug )
+                print ( f"{qsymbol:5}...X   / ", end="", flush=True )     # >> pretty printer <<
+                self.unfixable_errors += 1
+                self.loop_count += 1
+                continue
+
+            asset_class = nqb['asset_class']
+            print ( f"{qsymbol:5}...", end="", flush=True )             # >> pretty printer <<
             
         ############################### Phase 1 ###########################################
         # Evaluate Asset Class = an Exchnage Traded Fund (ETF)
-            logging.info( f"{cmi_debug} - Begin market cap/scale logic cycle... {nq.asset_class}")
-            if wq.asset_class == "etf":                                 # Global attribute - Cant get STOCK-type data for 'etf'
+            logging.info( f"{cmi_debug} - Begin market cap/scale logic cycle... {asset_class}")
+            if asset_class == "etf":                                 # Global attribute - Cant get STOCK-type data for 'etf'
                 logging.info( f"{cmi_debug} - {qsymbol} asset class is ETF" )
                 self.wrangle_errors += 1
                 self.unfixable_errors += 1
@@ -155,20 +146,20 @@ class combo_logic:
                 row_index = self.combo_df.loc[self.combo_df['Symbol'] == xsymbol].index[0]
                 self.combo_df.at[row_index, 'M_B'] = 'EF'
             else:
-                logging.info( f"{cmi_debug} - {qsymbol} asset class is {wq.asset_class}" )
+                logging.info( f"{cmi_debug} - {qsymbol} asset class is {asset_class}" )
                 pass
 
         ############################### Phase 2 ###########################################
         # Evaluate Market Cap data field - quality of data
-            logging.info( f"{cmi_debug} - Test {wq.asset_class} Mkt_cap for BAD data..." )
+            logging.info( f"{cmi_debug} - Test {asset_class} Mkt_cap for BAD data..." )
             z_float = round(float(0), 3)                  # 0.000
             try:
-                null_tester = wq.qd_quote['mkt_cap']                    # some ETF/Funds have a market cap - but data is inconsistent
+                null_tester = qd_quote['mkt_cap']                    # some ETF/Funds have a market cap - but data is inconsistent
             except TypeError:
-                logging.info( f"{cmi_debug} - {wq.asset_class} Mkt_cap data is NULL / setting to: 0" )
+                logging.info( f"{cmi_debug} - {asset_class} Mkt_cap data is NULL / setting to: 0" )
                 if self.args['bool_xray'] is True:
                     print ( f"=xray=TypeError================= {self.inst_uid} ================================begin=" )
-                    print ( f"quote: {wq.qd_quote.items()}" )
+                    print ( f"quote: {qd_quote.items()}" )
                     print ( f"combo_df: {self.combo_df}" )
                     print ( f"=xray=========================== {self.inst_uid} ==================================end=" )
                 self.combo_df.at[self.combo_df[self.combo_df['Symbol'] == xsymbol].index, 'Mkt_cap'] = 'UZ'    # make is a real number = 0
@@ -177,10 +168,10 @@ class combo_logic:
                 self.fixchars += 2
                 y = 0
             except KeyError:
-                logging.info( f"{cmi_debug} - {wq.asset_class} Mkt_cap key is NULL / setting to: 0" )
+                logging.info( f"{cmi_debug} - {asset_class} Mkt_cap key is NULL / setting to: 0" )
                 if self.args['bool_xray'] is True:
                     print ( f"=xray=KeyError================== {self.inst_uid} ================================begin=" )
-                    print ( f"quote: {wq.qd_quote.items()}" )
+                    print ( f"quote: {qd_quote.items()}" )
                     print ( f"combo_df: {self.combo_df}" )
                     print ( f"=xray=========================== {self.inst_uid} ==================================end=" )
                 self.combo_df.at[self.combo_df[self.combo_df['Symbol'] == xsymbol].index, 'Mkt_cap'] = 'UZ'    # make is a real number = 0 
@@ -189,8 +180,8 @@ class combo_logic:
                 self.fixchars += 1
                 y = 0
             else:
-                logging.info( f"{cmi_debug} - Set {wq.asset_class} Mkt_cap to: {wq.qd_quote['mkt_cap']}" )
-                z_float = (float(wq.qd_quote['mkt_cap']))                
+                logging.info( f"{cmi_debug} - Set {asset_class} Mkt_cap to: {qd_quote['mkt_cap']}" )
+                z_float = (float(qd_quote['mkt_cap']))                
                 row_index = self.combo_df.loc[self.combo_df['Symbol'] == xsymbol].index[0]
                 self.combo_df.at[row_index, 'Mkt_cap'] = round(z_float, 3)      # set Market cap to real/live num from nasdaq.com
                 print ( f"$", end="" )                                  # >> pretty printer <<
@@ -199,22 +190,22 @@ class combo_logic:
 
         ############################### Phase 3 ###########################################
         # Set the Market Cap scale tag (M_B col)
-                if wq.asset_class == "stocks":
-                    logging.info( f"{cmi_debug} - Compute Mkt_cap scale tag: [ {wq.qd_quote['mkt_cap']} ]..." )
+                if asset_class == "stocks":
+                    logging.info( f"{cmi_debug} - Compute Mkt_cap scale tag: [ {qd_quote['mkt_cap']} ]..." )
                     for i in (("MT", 999999), ("LB", 10000), ("SB", 2000), ("LM", 500), ("SM", 50), ("TM", 10), ("UZ", 0)):
-                        if wq.qd_quote['mkt_cap'] == float(0):
+                        if qd_quote['mkt_cap'] == float(0):
                             row_index = self.combo_df.loc[self.combo_df['Symbol'] == xsymbol].index[0]
                             self.combo_df.at[row_index, 'M_B'] = "UZ"
-                            logging.info( f"{cmi_debug} - Bad Market cap: [ {wq.qd_quote['mkt_cap']} ] scale set to: UZ" )
+                            logging.info( f"{cmi_debug} - Bad Market cap: [ {qd_quote['mkt_cap']} ] scale set to: UZ" )
                             print ( f"0", end="" )
                             self.fixchars += 1
                             break
-                        elif i[1] >= wq.qd_quote['mkt_cap']:
+                        elif i[1] >= qd_quote['mkt_cap']:
                             pass
                         else:
                             row_index = self.combo_df.loc[self.combo_df['Symbol'] == xsymbol].index[0]
                             self.combo_df.at[row_index, 'M_B'] = i[0]
-                            logging.info( f"{cmi_debug} - Market cap: [ {wq.qd_quote['mkt_cap']} ] scale set to: {i[0]}" )
+                            logging.info( f"{cmi_debug} - Market cap: [ {qd_quote['mkt_cap']} ] scale set to: {i[0]}" )
                             self.wrangle_errors += 1          # insert market cap scale into DF @ column M_B for this symbol
                             self.cleansed_errors += 1
                             print ( f"+", end="" )
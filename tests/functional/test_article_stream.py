@@ -0,0 +1,35 @@
+import unittest
+
+from article_stream import article_stream
+
+JUNK = "<div class='ad'><p>ad text</p><script>var x = '<p>no</p>';</script></div>"
+
+
+def page(tail_blocks=2000):
+    body = "<div class='body yf-1ir6o1g'><div><p>One <b>bold</b> para.</p></div><p>Two &amp; more</p><p> </p></div>"
+    return f"<html><body>{JUNK * 5}{body}{JUNK * tail_blocks}</body></html>"
+
+
+class TestArticleStream(unittest.TestCase):
+
+    def test_yields_only_article_body_paragraphs(self):
+        paras = list(article_stream.paragraphs(page()))
+        self.assertEqual(paras, ["One bold para.", "Two & more"])
+        self.assertEqual(paras[0].text, "One bold para.")
+
+    def test_stops_feeding_once_body_closes(self):
+        html = page()
+        before = article_stream.stats['fed_bytes']
+        list(article_stream.paragraphs(html, chunk=1024))
+        self.assertLess(article_stream.stats['fed_bytes'] - before, len(html) // 10)
+
+    def test_is_a_lazy_generator(self):
+        gen = article_stream.paragraphs(page())
+        self.assertEqual(next(gen), "One bold para.")
+
+    def test_missing_body_yields_nothing(self):
+        self.assertEqual(list(article_stream.paragraphs("<html><p>no body</p></html>")), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from bigcharts_md import bc_quote
+
+QQ_PAGE = """<html><body>
+<h1 class="quote"><div>{sym}</div><div>x</div><div>y</div><div><span>12.50</span><span>+0.25</span></div></h1>
+<table id="quote"><tr><td>h</td><td>Last:</td><td>12.50</td><td>Change:</td><td>+0.25</td>
+<td>Volume:</td><td>1,234,567</td><td>Market Cap:</td><td>{mkt_cap}</td></tr></table>
+<table class="financials"><tr><td>52 Week Range:</td><td>5.90 to 13.26</td>
+<td>52-Week High:</td><td>13.26 on 01/04/21</td><td>52-Week Low:</td><td>5.90 on 03/23/20</td>
+<td>Short Interest:</td><td>106,614,436 (1.22%)</td>
+<td>Average Price:</td><td>10.719 (50-day) 10.2152 (200-day)</td>
+<td>Average Volume:</td><td>84,447,810 (50-day) 65,450,970 (200-day)</td></tr></table>
+</body></html>"""
+
+BQ_PAGE = """<html><body><table id="quote"><tr><td>h</td></tr><tr><td>h</td></tr>
+<tr><td><span>Last:</span><div>12.50</div></td><td><span>Change:</span><div>+0.25</div></td></tr>
+<tr><td><span>Volume:</span><div>1.2M</div></td><td><span>Open:</span><div>12.10</div></td></tr></table>
+</body></html>"""
+
+
+class TestBcQuoteExtract(unittest.TestCase):
+
+    def test_qq_extract_fills_the_given_dict_only(self):
+        bc = bc_quote(1, None)
+        q = {}
+        bc.qq_extract(QQ_PAGE.format(sym="ABC", mkt_cap="15.7B").encode(), q)
+        bc.q_polish(q)
+        self.assertEqual(q['symbol'], "ABC")
+        self.assertEqual((q['last'], q['change_s'], q['vol']), ("12.50", "+", 1234567))
+        self.assertEqual((q['mkt_cap'], q['mkt_cap_s']), (15.7, "B"))
+        self.assertEqual((q['range52w_l'], q['range52w_h'], q['avg200d_v']), (5.9, 13.26, 65450970))
+        self.assertNotIn('symbol', bc.quote)
+
+    def stub_session(self, pages):
+        """Stand-in for http_pool.get_session(): serves pages{} by symb=, raises for 'DOWN', 404 page otherwise"""
+        def get(url, timeout=None):
+            sym = parse_qs(urlparse(url).query)['symb'][0]
+            if sym == "DOWN":
+                raise requests.ConnectionError("connection reset")
+            r = requests.Response()
+            r.status_code = 200 if sym in pages else 404
+            r._content = pages.get(sym, "<html><body>Symbol not found</body></html>").encode()
+            return r
+        session = MagicMock()
+        session.get.side_effect = get
+        return patch('bigcharts_md.http_pool.get_session', return_value=session)
+
+    def test_get_quotes_batch_dataframe(self):
+        pages = {"ABC": QQ_PAGE.format(sym="ABC", mkt_cap="15.7B"), "XYZ": QQ_PAGE.format(sym="XYZ", mkt_cap="n/a")}
+        bc = bc_quote(2, None)
+        with self.stub_session(pages), self.assertLogs(level='WARNING') as logs:
+            df = bc.get_quotes(["abc", "XYZ", "NOPE", "DOWN", "ABC"], workers=3)
+        self.assertEqual(df.index.tolist(), ["ABC", "XYZ"])
+        self.assertEqual(df.loc["XYZ", "mkt_cap_s"], "X")
+        self.assertEqual(df.loc["ABC", "vol"], 1234567)
+        self.assertTrue(any("NOPE page scrape failed" in m for m in logs.output))
+        self.assertTrue(any("DOWN fetch failed" in m for m in logs.output))
+
+    def test_get_quotes_basic_page(self):
+        bc = bc_quote(3, None)
+        with self.stub_session({"ABC": BQ_PAGE}):
+            df = bc.get_quotes(["ABC", "NOPE"], quick=False)
+        self.assertEqual(df.index.tolist(), ["ABC"])
+        self.assertEqual((df.loc["ABC", "last"], df.loc["ABC", "change_s"], df.loc["ABC", "vol"]), ("12.50", "+0.25", "1.2M"))
+
+    def test_fetch_quote_does_not_swallow_bugs(self):
+        bc = bc_quote(4, None)
+        with patch('bigcharts_md.http_pool.get_session', side_effect=RuntimeError("bug")):
+            with self.assertRaises(RuntimeError):
+                bc.fetch_quote("ABC")
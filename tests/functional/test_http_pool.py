@@ -0,0 +1,170 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import requests
+from urllib3.connectionpool import HTTPSConnectionPool
+
+from http_pool import http_pool, counted_adapter, counted_https_pool
+from y_topgainers import y_topgainers
+
+URL = "https://finance.yahoo.com/markets/stocks/most-active/"
+
+
+def response(status, body=b"", headers=None):
+    r = requests.Response()
+    r.status_code = status
+    r._content = body
+    r.headers.update(headers or {})
+    r.url = URL
+    return r
+
+
+class StubSession:
+    """Hands out queued responses and records the request headers of every get()"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.sent.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+def screener_page(price):
+    doc = {"finance": {"result": [{"quotes": [
+        {"symbol": "AAPL", "shortName": "Apple Inc.", "regularMarketPrice": price,
+         "regularMarketChange": 1.0, "regularMarketChangePercent": 0.5, "marketCap": 2.9e12}]}]}}
+    wrapper = json.dumps({"status": 200, "body": json.dumps(doc)})
+    return (f'<html><script type="application/json" data-sveltekit-fetched '
+            f'data-url="https://query1.finance.yahoo.com/v1/finance/screener?scrIds=most_actives">{wrapper}</script>'
+            f'</html>').encode()
+
+
+class TestCondGet(unittest.TestCase):
+
+    def setUp(self):
+        http_pool.validators.clear()
+
+    def tearDown(self):
+        http_pool.validators.clear()
+
+    def cond_get(self, session, have=None):
+        with patch.object(http_pool, 'get_session', return_value=session):
+            return http_pool.cond_get(URL, have=have)
+
+    def test_validators_sent_only_for_the_callers_copy(self):
+        """If-None-Match / If-Modified-Since go out only when the caller holds the recorded body."""
+        validators = {'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}
+        s = StubSession(*[response(200, b"page", validators) for _ in range(3)])
+        first = self.cond_get(s)
+        self.cond_get(s)
+        self.cond_get(s, have=first.body_digest)
+        self.assertEqual(s.sent[0], {})
+        self.assertEqual(s.sent[1], {})
+        self.assertEqual(s.sent[2], {'If-None-Match': '"v1"', 'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'})
+        self.assertFalse(first.unchanged)
+
+    def test_304_is_returned_as_is_and_marked_unchanged(self):
+        s = StubSession(response(200, b"page", {'ETag': '"v1"'}), response(304))
+        first = self.cond_get(s)
+        again = self.cond_get(s, have=first.body_digest)
+        self.assertIsNot(again, first)
+        self.assertEqual(again.status_code, 304)
+        self.assertTrue(again.unchanged)
+        self.assertEqual(again.body_digest, first.body_digest)
+        self.assertFalse(first.unchanged)
+
+    def test_only_2xx_validators_stored(self):
+        s = StubSession(response(503, b"busy", {'ETag': '"err"'}))
+        resp = self.cond_get(s)
+        self.assertFalse(resp.unchanged)
+        self.assertNotIn(URL, http_pool.validators)
+
+    def test_validators_hold_no_response_and_are_bounded(self):
+        with patch.object(http_pool, 'val_max', 3):
+            for i in range(5):
+                s = StubSession(response(200, f"page {i}".encode(), {'ETag': f'"{i}"'}))
+                with patch.object(http_pool, 'get_session', return_value=s):
+                    http_pool.cond_get(f"{URL}?p={i}")
+        self.assertEqual(list(http_pool.validators), [f"{URL}?p={i}" for i in (2, 3, 4)])
+        self.assertEqual(set(http_pool.validators[f"{URL}?p=4"]), {'etag', 'last_mod', 'digest', 'ts'})
+
+    def test_topgainers_skips_rebuild_on_unchanged_payload(self):
+        tg = y_topgainers(1)
+        s = StubSession(response(200, screener_page(190.5), {'ETag': '"v1"'}), response(304),
+                        response(200, screener_page(191.0), {'ETag': '"v2"'}))
+        tg.ext_req = self.cond_get(s, have=tg.last_digest)
+        tg.ext_get_data(1)
+        self.assertEqual(tg.build_tg_df0(), 1)
+
+        tg.ext_req = self.cond_get(s, have=tg.last_digest)
+        self.assertTrue(tg.payload_unchanged())
+        tg.ext_get_data(1)
+        tg.build_tg_df0()
+        self.assertEqual(tg.cycle_stats, {'built': 1, 'skipped': 1})
+        self.assertEqual(tg.tg_df0['Cur_price'].tolist(), [190.5])
+
+        tg.ext_req = self.cond_get(s, have=tg.last_digest)
+        self.assertFalse(tg.payload_unchanged())
+        tg.ext_get_data(1)
+        tg.build_tg_df0()
+        self.assertEqual(tg.cycle_stats, {'built': 2, 'skipped': 1})
+        self.assertEqual(tg.tg_df0['Cur_price'].tolist(), [191.0])
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"          # keep the socket open between requests
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeConn:
+
+    def __init__(self, sock):
+        self.sock = sock
+
+
+class TestConnStats(unittest.TestCase):
+
+    def setUp(self):
+        http_pool.conn_stats.clear()
+        self.addCleanup(http_pool.conn_stats.clear)
+
+    def test_counted_adapter_opens_once_then_reuses(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        s = requests.Session()
+        s.mount("http://", counted_adapter(pool_connections=1, pool_maxsize=1))
+        self.addCleanup(s.close)
+        url = f"http://127.0.0.1:{server.server_port}/quote"
+        for _ in range(2):
+            self.assertEqual(s.get(url, timeout=5).text, "ok")
+        self.assertEqual(http_pool.stats()['hosts']['127.0.0.1'], {'opened': 1, 'reused': 1})
+
+    def test_https_pool_tallies_live_socket_as_reused(self):
+        pool = counted_https_pool('stub.example.com')
+        conns = [FakeConn(None), FakeConn(object()), FakeConn(None)]      # fresh, keep-alive, dropped
+        with patch.object(HTTPSConnectionPool, '_get_conn', side_effect=conns):
+            for _ in conns:
+                pool._get_conn()
+        st = http_pool.stats()
+        self.assertEqual(st['hosts']['stub.example.com'], {'opened': 2, 'reused': 1})
+        self.assertEqual((st['opened'], st['reused']), (2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
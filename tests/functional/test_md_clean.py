@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from md_clean import md_clean
+
+
+class TestMdClean(unittest.TestCase):
+
+    def test_to_float_strips_currency_and_maps_sentinels_to_nan(self):
+        out = md_clean.to_float(["$1,234.50", "-0.25", "N/A", "UNCH", "", None])
+        self.assertEqual(out[:2].tolist(), [1234.5, -0.25])
+        self.assertTrue(out[2:].isna().all())
+
+    def test_to_float_unsigned_keeps_magnitude_only(self):
+        out = md_clean.to_float(["-1.5", "+2.25"], unsigned=True)
+        self.assertEqual(out.tolist(), [1.5, 2.25])
+
+    def test_percent_handles_parens_and_signs(self):
+        out = md_clean.percent(["+1.35%", "(-2.1%)", "3%"])
+        self.assertEqual(out.tolist(), [1.35, -2.1, 3.0])
+
+    def test_sign_extraction(self):
+        out = md_clean.sign(["-1.2", "+0.5", "7", "N/A"])
+        self.assertEqual(out.tolist(), [-1, 1, 1, 0])
+
+    def test_scale_suffix_splits_mantissa_and_scale(self):
+        mant, scale = md_clean.scale_suffix(["15.753B", "812.4M", "1,204.5T", "N/A", "1.2k"])
+        self.assertEqual(mant[:3].tolist(), [15.753, 812.4, 1204.5])
+        self.assertTrue(mant[3:].isna().all())
+        self.assertEqual(scale.tolist(), ["B", "M", "T", "", ""])
+
+    def test_scaled_returns_absolute_values(self):
+        out = md_clean.scaled(["70.25k", "1.2M", "61,447", "N/A"])
+        np.testing.assert_allclose(out[:3].values, [70250.0, 1200000.0, 61447.0])
+        self.assertTrue(np.isnan(out[3]))
+
+    def test_scale_down_picks_largest_scale(self):
+        mant, scale = md_clean.scale_down([2.95e12, 15753000000, 812400000, 5000, None])
+        self.assertEqual(mant[:3].tolist(), [2.95, 15.753, 812.4])
+        self.assertTrue(mant[3:].isna().all())
+        self.assertEqual(scale.tolist(), ["T", "B", "M", "", ""])
+
+    def test_pad_name_removes_quotes_and_left_justifies(self):
+        out = md_clean.pad_name(pd.Series(["Bob's \"Co\""]), 12)
+        self.assertEqual(out[0], "Bobs Co     ")
+
+
+if __name__ == '__main__':
+    unittest.main()
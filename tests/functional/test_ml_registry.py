@@ -0,0 +1,58 @@
+import sys
+import subprocess
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from ml_registry import ModelRegistry
+from ml_sentcache import InferenceCache
+
+
+@pytest.fixture
+def registry():
+    ModelRegistry.clear()
+    yield ModelRegistry
+    ModelRegistry.clear()
+
+
+def test_importing_registry_does_not_import_torch():
+    code = "import sys, ml_registry; sys.exit('torch' in sys.modules or 'transformers' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+@patch('ml_sentiment.AutoModelForSequenceClassification.from_pretrained')
+@patch('ml_sentiment.AutoTokenizer.from_pretrained')
+def test_model_loads_once_per_process(mock_tokenizer_fp, mock_model_fp, registry):
+    handles = []
+    threads = [threading.Thread(target=lambda: handles.append(registry.get())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert mock_model_fp.call_count == 1
+    assert mock_tokenizer_fp.call_count == 1
+    assert all(h is handles[0] for h in handles)
+    assert registry.loaded() == ['ProsusAI/finbert']
+    assert handles[0].backend == 'torch'
+
+
+@patch('ml_sentiment.AutoModelForSequenceClassification.from_pretrained')
+@patch('ml_sentiment.AutoTokenizer.from_pretrained')
+def test_threads_and_warmup(mock_tokenizer_fp, mock_model_fp, registry):
+    import torch
+    threads = torch.get_num_threads()
+    registry.configure(num_threads=2, warmup=True)
+    cache = InferenceCache(':memory:')
+    with patch('ml_sentiment.SentimentAnalysisModel._classify') as warm:
+        handle = registry.get(cache=cache)
+    try:
+        assert torch.get_num_threads() == 2
+        warm.assert_called_once()
+        handle._model.tokenizer.assert_called_once_with(registry.warmup_texts, return_tensors='pt',
+                                                        padding=True, truncation=True)
+        assert cache.stats() == {'hits': 0, 'misses': 0, 'hit_rate': 0.0, 'rows': 0, 'evictions': 0}
+    finally:
+        registry.num_threads, registry.warmup = None, False
+        torch.set_num_threads(threads)
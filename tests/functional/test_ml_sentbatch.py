@@ -0,0 +1,84 @@
+import unittest
+
+from ml_sentbatch import ml_sentbatch
+
+
+class CountingModel:
+    """Stand-in model: label by keyword, record every batch it is given"""
+
+    def __init__(self):
+        self.calls = []
+
+    def bulk_predict_sentiment(self, texts):
+        self.calls.append(len(texts))
+        return [{'label': 'positive' if 'up' in t else 'negative', 'score': 0.9} for t in texts]
+
+
+class StreamingModel(CountingModel):
+    """Stand-in streaming model: reports 1 token per word. Its tokenizer must never be called"""
+
+    def tokenizer(self, *args, **kwargs):
+        raise AssertionError("ml_sentbatch tokenized the texts itself")
+
+    def predict_stream(self, texts, with_tokens=False):
+        preds = self.bulk_predict_sentiment(list(texts))
+        for t, p in zip(texts, preds):
+            p['tokens'] = len(t.split()) if with_tokens else 0
+        return iter(preds)
+
+
+class TestMlSentbatch(unittest.TestCase):
+
+    def test_batches_across_articles_and_scatters_by_urlhash(self):
+        model = CountingModel()
+        sb = ml_sentbatch(1, None, model)
+        sb.batch_size = 4
+        sb.add("IBM", 1, ["shares up", "guidance up", "", "costs down"], "h1")
+        sb.add("IBM", 2, ["revenue up", "margin down", "debt down"], "h2")
+        self.assertEqual(model.calls, [])
+        self.assertEqual(sb.run(), 6)
+        self.assertEqual(model.calls, [4, 2])
+        self.assertEqual(sb.counts("h1"), {'positive': 2, 'neutral': 0, 'negative': 1})
+        self.assertEqual(sb.counts("h2"), {'positive': 1, 'neutral': 0, 'negative': 2})
+        self.assertEqual(sb.sen_df0.loc[sb.sen_df0['urlhash'] == "h2", 'para'].tolist(), [0, 1, 2])
+
+    def test_compute_sentiment_per_article(self):
+        sb = ml_sentbatch(2, None, CountingModel())
+        self.assertEqual(sb.compute_sentiment("IBM", 3, ["one up two"], "h3"), (0, 3, 1))
+        self.assertEqual(sb.sentiment_count['positive'], 1)
+
+    def test_token_counts_come_from_the_model(self):
+        model = StreamingModel()
+        sb = ml_sentbatch(3, None, model)
+        sb.add("IBM", 1, ["shares up today", "costs down"], "h1")
+        sb.add("IBM", 2, ["revenue up"], "h2")
+        self.assertEqual(sb.run(), 3)
+        self.assertEqual(model.calls, [3])
+        self.assertEqual((sb.articles["h1"]['tokens'], sb.articles["h2"]['tokens']), (5, 2))
+
+    def test_passes_through_to_final_sentiment(self):
+        """aop.py -n : queue (pass 1), 1 batched run (pass 2), per article scatter + totals (pass 3), final verdict"""
+        sb = ml_sentbatch(4, None, StreamingModel())
+        sb.add("IBM", 1, ["shares up", "guidance up", "costs down"], "h1")         # pass 1
+        sb.add("IBM", 2, ["revenue up", "margin up"], "h2")
+        sb.add("IBM", 3, [""], "h3")                                                # nothing to score
+        self.assertEqual(sb.run(), 5)                                               # pass 2
+        df_final = sb.final_df()                                                    # pass 3
+        self.assertEqual(df_final.index[-1], 'Totals')
+        self.assertEqual(df_final['urlhash'].tolist()[:3], ["h1", "h2", "h3"])
+        self.assertEqual(df_final.loc[0, ['positive', 'neutral', 'negative']].tolist(), [2, 0, 1])
+        self.assertEqual(df_final.loc[2, ['psnt', 'nsnt', 'zsnt']].tolist(), [0.0, 0.0, 0.0])
+        t = df_final.iloc[-1]
+        self.assertEqual((t['art'], t['positive'], t['negative'], t['neutral']), (3, 4, 1, 0))
+        res = sb.compute_precise_sentiment("IBM", df_final, t['positive'], t['negative'], t['psnt'], t['nsnt'], t['zsnt'])
+        self.assertEqual((res['Sentiment'], res['Ratio'], res['P_pct'], res['N_pct']), ('Bullish', 4.0, 80.0, 20.0))
+        self.assertEqual((res['P_cat'], res['P_score'], res['N_cat'], res['N_score']), ('Dominant', 5, 'Weak', 2))
+        self.assertEqual(list(sb.sen_df3.columns), ml_sentbatch.sen3_cols)
+        self.assertEqual(sb.sen_df3.iloc[0]['Symbol'], "IBM")
+        self.assertAlmostEqual(res['P_mean'], 0.9 * 2 / 3, places=4)                # mean over articles, h3 counts as 0.0
+
+    def test_final_sentiment_without_articles(self):
+        sb = ml_sentbatch(5, None, StreamingModel())
+        t = sb.final_df().iloc[-1]
+        res = sb.compute_precise_sentiment("IBM", sb.final_df(), t['positive'], t['negative'], t['psnt'], t['nsnt'], t['zsnt'])
+        self.assertEqual((res['Sentiment'], res['P_score'], res['N_score']), ('Neutral', 0, 0))
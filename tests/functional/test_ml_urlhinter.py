@@ -0,0 +1,40 @@
+import unittest
+from unittest.mock import patch
+from urllib.parse import urlparse
+
+from ml_urlhinter import url_hinter
+from ml_yahoofinews import yfnews_reader
+
+
+class TestUrlHinter(unittest.TestCase):
+
+    def setUp(self):
+        self.uh = url_hinter(1, None)
+
+    def test_codes(self):
+        self.assertEqual(self.uh.uhinter(1, "https://finance.yahoo.com/news/abc-123.html"), (0, 'Local News'))
+        self.assertEqual(self.uh.uhinter(2, "https://finance.yahoo.com/m/49c6/xyz.html"), (1, 'Fake local micro news'))
+        self.assertEqual(self.uh.uhinter(3, urlparse("https://finance.yahoo.com/video/clip.html")), (2, 'Video story'))
+        self.assertEqual(self.uh.uhinter(4, "https://www.independent.co.uk/news/story"), (3, 'External publication'))
+        self.assertEqual(self.uh.uhinter(5, "https://finance.yahoo.com/research/reports/r1"), (4, 'Research report'))
+        self.assertEqual(self.uh.uhinter(6, "finance.yahoo.com"), (10, 'Error mangled url'))
+        self.assertEqual(self.uh.uhinter(7, "https://finance.yahoo.com/quote/IBM"), (9, 'Not yet defined'))
+
+    def test_classify_many_is_memoized(self):
+        urls = ["https://finance.yahoo.com/news/memo-a.html", "https://example.com/memo-b"]
+        first = self.uh.classify_many(urls)
+        hits = url_hinter.classify.cache_info().hits
+        self.assertEqual(self.uh.classify_many(urls), first)
+        self.assertEqual(url_hinter.classify.cache_info().hits, hits + 2)
+        self.assertEqual(first, [(0, 'Local News'), (3, 'External publication')])
+
+    def test_json_feed_uses_batch_hints_by_story_position(self):
+        reader = yfnews_reader(1, "IBM", None)
+        reader.yfn_uh, reader.ml_ingest, reader.ml_brief = self.uh, {}, []
+        reader.json_stories = [
+            {'title': "Local", 'url': "https://finance.yahoo.com/news/pos-a.html", 'agency': "Reuters"},
+            {'title': "Video", 'url': "/video/pos-b.html", 'agency': "Yahoo"},
+            {'title': "Remote", 'url': "https://example.com/pos-c", 'agency': "AP"}]
+        with patch.object(url_hinter, 'uhinter', side_effect=AssertionError("per story uhinter")):
+            reader.eval_news_feed_stories("ibm")
+        self.assertEqual([nd['uhint'] for nd in reader.ml_ingest.values()], [0, 2, 3])
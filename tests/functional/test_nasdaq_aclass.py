@@ -0,0 +1,36 @@
+import threading
+import unittest
+
+from nasdaq_aclass import aclass_cache
+
+
+class TestAclassCache(unittest.TestCase):
+
+    def setUp(self):
+        self.ac = aclass_cache(1, db_path=":memory:")
+        self.ac.put("IBM", "stocks")
+        self.ac.put("NOPE", aclass_cache.NEG)
+
+    def test_peek_does_not_count(self):
+        self.assertEqual((self.ac.peek("ibm "), self.ac.peek("NOPE"), self.ac.peek("SPY")), ("stocks", "none", None))
+        self.assertEqual((self.ac.hits, self.ac.misses), (0, 0))
+        self.assertEqual((self.ac.get("IBM"), self.ac.get("SPY")), ("stocks", None))
+        self.assertEqual((self.ac.hits, self.ac.misses), (1, 1))
+
+    def test_counters_exact_under_threads(self):
+        def lookups():
+            for _ in range(200):
+                self.ac.get("IBM")
+                self.ac.get("SPY")
+        threads = [threading.Thread(target=lookups) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stats = self.ac.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1600, 1600))
+        self.assertEqual(stats['entries'], {'stocks': 1, 'none': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from nasdaq_decoder import nq_decoder
+
+
+def zones(sym, price="$143.32", premarket="$140.8 +1.87 (+1.35%)", mkt_cap="128,460,592,862"):
+    summary = {"data": {"summaryData": {"PreviousClose": {"value": "$138.93"}, "MarketCap": {"value": mkt_cap},
+                                        "AverageVolume": {"value": "4,811,121"}, "OneYrTarget": {"value": "$151.00"}}}}
+    watchlist = {"data": [{"symbol": sym, "companyName": "Intl Business Machines", "lastSalePrice": price,
+                           "netChange": "-4.39", "percentageChange": "-3.16%", "deltaIndicator": "down",
+                           "lastTradeTimestampDateTime": "2021-10-01T00:00:00", "volume": "6,604,064"}]}
+    pre = {"data": {"infoTable": {"rows": [{"consolidated": premarket}]}}} if premarket else {"data": None}
+    return (summary, watchlist, pre)
+
+
+class TestNqDecoder(unittest.TestCase):
+
+    def setUp(self):
+        batch = {"IBM": {"asset_class": "stocks", "zones": zones("IBM")},
+                 "SPY": {"asset_class": "etf", "zones": zones("SPY", price="N/A", premarket=None, mkt_cap="N/A")},
+                 "BRK.B": {"asset_class": "stocks", "zones": zones("BRK/B")},
+                 "BAD": {"asset_class": "stocks", "zones": ({"data": None}, {"data": None}, {"data": None})},
+                 "ERR": None}
+        self.df, self.quotes = nq_decoder.decode(batch, time_now="t")
+
+    def test_one_typed_dataframe_for_all_good_symbols(self):
+        self.assertEqual(list(self.df.columns), nq_decoder.df_columns)
+        self.assertEqual(self.df['Symbol'].tolist(), ["IBM", "SPY", "BRK/B"])
+        self.assertEqual(self.df['Cur_price'].tolist(), [143.32, 0.0, 143.32])
+        self.assertEqual(self.df['Mkt_cap'].tolist(), [128460.593, 0.0, 128460.593])
+        self.assertEqual(self.df.attrs['errors'], {"IBM": 0, "SPY": 3, "BRK.B": 0})
+
+    def test_qd_quote_dicts(self):
+        ibm = self.quotes["IBM"]
+        self.assertEqual((ibm['prc_change'], ibm['pct_change']), (-4.39, 3.16))
+        self.assertEqual((ibm['open_price'], ibm['open_price_net'], ibm['open_price_pct']), (140.8, 1.87, 1.35))
+        self.assertEqual((ibm['vol'], ibm['avg_vol'], ibm['one_year_target']), (6604064.0, 4811121.0, 151.0))
+        self.assertEqual((self.quotes["SPY"]['avg_vol'], self.quotes["SPY"]['open_price']), (0.0, 0.0))
+        self.assertEqual(self.quotes["BRK.B"]['symbol'], "BRK/B")       # keyed by the symbol asked for
+        self.assertNotIn("BAD", self.quotes)
+        self.assertNotIn("ERR", self.quotes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import threading
+import time
+import unittest
+import concurrent.futures
+from unittest.mock import patch
+
+from rate_limiter import rate_limiter, token_bucket
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_burst_is_granted_without_waiting(self):
+        """A full bucket hands out `burst` tokens immediately."""
+        b = token_bucket("example.com", rate=1.0, burst=3)
+        waits = [b.take(1) for _ in range(3)]
+        self.assertTrue(all(w < 0.05 for w in waits))
+        self.assertEqual(b.granted, 3)
+
+    def test_empty_bucket_paces_at_rate(self):
+        """Once the burst is spent, the next caller waits ~1/rate secs."""
+        b = token_bucket("example.com", rate=20.0, burst=1)
+        b.take(1)
+        waited = b.take(1)
+        self.assertGreaterEqual(waited, 0.03)
+
+    def test_interactive_lane_jumps_ahead_of_bulk(self):
+        """Queued bulk waiters yield the next free token to an interactive caller."""
+        b = token_bucket("example.com", rate=10.0, burst=1)
+        b.take(rate_limiter.lanes['bulk'])           # drain the bucket
+        order = []
+
+        def worker(name, lane):
+            b.take(rate_limiter.lanes[lane])
+            order.append(name)
+
+        bulk = [threading.Thread(target=worker, args=(f"bulk{i}", 'bulk')) for i in range(3)]
+        for t in bulk:
+            t.start()
+        time.sleep(0.02)                              # bulk callers are now queued
+        quick = threading.Thread(target=worker, args=("quote", 'interactive'))
+        quick.start()
+        for t in bulk + [quick]:
+            t.join(5)
+        self.assertEqual(order[0], "quote")
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_subdomains_share_configured_bucket(self):
+        self.assertEqual(rate_limiter.bucket_key("query1.finance.yahoo.com"), "finance.yahoo.com")
+        self.assertEqual(rate_limiter.bucket_key("www.alphavantage.co"), "alphavantage.co")
+        self.assertEqual(rate_limiter.bucket_key("unknown.example.org"), "unknown.example.org")
+
+    def test_lane_context_restores_previous_lane(self):
+        self.assertEqual(rate_limiter.get_lane(), 'normal')
+        with rate_limiter.lane('interactive'):
+            self.assertEqual(rate_limiter.get_lane(), 'interactive')
+        self.assertEqual(rate_limiter.get_lane(), 'normal')
+
+    def test_unknown_lane_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            rate_limiter.set_lane('urgent')
+
+    def test_pool_fetch_queues_in_submitters_lane(self):
+        """A job carried onto a pool thread takes its token in the lane of the thread that submitted it."""
+        with patch.object(token_bucket, 'take', autospec=True, return_value=0.0) as take:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+                with rate_limiter.lane('interactive'):
+                    carried = pool.submit(rate_limiter.carry(rate_limiter.acquire), "https://lane.example.com/q")
+                    bare = pool.submit(rate_limiter.acquire, "https://lane.example.com/q")
+                carried.result()
+                bare.result()
+                later = pool.submit(rate_limiter.carry(rate_limiter.acquire), "https://lane.example.com/q")
+                later.result()
+        lanes = sorted(c.args[1] for c in take.call_args_list)
+        self.assertEqual(lanes, [rate_limiter.lanes['interactive'], rate_limiter.lanes['normal'], rate_limiter.lanes['normal']])
+        self.assertEqual(rate_limiter.get_lane(), 'normal')
+
+
+if __name__ == '__main__':
+    unittest.main()
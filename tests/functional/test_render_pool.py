@@ -0,0 +1,154 @@
+import asyncio
+import concurrent.futures
+import unittest
+
+from render_pool import render_pool
+
+
+class FakePage:
+    """pyppeteer Page stand-in. goto() fails for urls containing 'boom' & never returns for 'hang'"""
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.url = None
+        self.closed = False
+
+    async def goto(self, url, timeout=None, waitUntil=None):
+        if self.browser.crashed or 'boom' in url:
+            raise RuntimeError("navigation failed")
+        self.browser.active += 1
+        self.browser.peak = max(self.browser.peak, self.browser.active)
+        try:
+            await asyncio.sleep(60 if 'hang' in url else 0.01)
+        finally:
+            self.browser.active -= 1
+        self.url = url
+
+    async def content(self):
+        return f"<html>{self.url}</html>"
+
+    async def close(self):
+        if self.browser.crashed:
+            raise RuntimeError("target closed")
+        self.closed = True
+
+
+class FakeBrowser:
+
+    def __init__(self):
+        self.pages = []
+        self.crashed = False
+        self.closed = False
+        self.active = 0
+        self.peak = 0
+
+    async def newPage(self):
+        if self.crashed:
+            raise RuntimeError("browser has disconnected")
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePool(render_pool):
+    """render_pool that launches FakeBrowsers. launch_fails > 0 makes that many launches raise"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.launched = []
+        self.launch_fails = 0
+
+    async def launch_browser(self):
+        if self.launch_fails:
+            self.launch_fails -= 1
+            raise RuntimeError("chromium failed to start")
+        browser = FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+
+class TestRenderPool(unittest.TestCase):
+
+    def make(self, pages=1, recycle=20):
+        pool = FakePool(1, browsers=1, pages=pages, recycle=recycle)
+        self.addCleanup(pool.close)
+        pool.start()
+        return pool
+
+    def test_renders_queue_for_a_free_page(self):
+        pool = self.make(pages=2)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=6) as ex:
+            out = list(ex.map(pool.render_sync, [f"https://x.test/{i}" for i in range(6)]))
+        self.assertEqual(out, [f"<html>https://x.test/{i}</html>" for i in range(6)])
+        self.assertEqual(pool.launched[0].peak, 2)
+        self.assertEqual(pool.stats()['renders'], 6)
+        self.assertEqual(pool.idle.qsize(), 2)
+
+    def test_page_recycled_after_k_renders(self):
+        pool = self.make(pages=1, recycle=2)
+        for i in range(5):
+            pool.render_sync(f"https://x.test/{i}")
+        browser = pool.launched[0]
+        self.assertEqual(pool.recycles, 2)
+        self.assertEqual(len(browser.pages), 3)
+        self.assertEqual([p.closed for p in browser.pages], [True, True, False])
+
+    def test_errored_page_is_recycled(self):
+        pool = self.make(pages=1)
+        with self.assertRaises(RuntimeError):
+            pool.render_sync("https://x.test/boom")
+        self.assertEqual((pool.render_fails, pool.recycles), (1, 1))
+        self.assertEqual(pool.render_sync("https://x.test/ok"), "<html>https://x.test/ok</html>")
+        self.assertTrue(pool.launched[0].pages[0].closed)
+
+    def test_crashed_browser_is_relaunched(self):
+        pool = self.make(pages=2)
+        pool.launched[0].crashed = True
+        with self.assertRaises(RuntimeError):
+            pool.render_sync("https://x.test/a")
+        self.assertEqual((pool.relaunches, len(pool.launched)), (1, 2))
+        self.assertTrue(pool.launched[0].closed)
+        # the other warm page still points at the dead browser. It errors once, then recycles onto the new one
+        results = []
+        for i in range(3):
+            try:
+                results.append(pool.render_sync(f"https://x.test/{i}"))
+            except RuntimeError:
+                results.append(None)
+        self.assertEqual(results.count(None), 1)
+        self.assertEqual(pool.relaunches, 1)
+        self.assertEqual(pool.idle.qsize(), 2)
+
+    def test_failed_recycle_still_returns_the_slot(self):
+        pool = self.make(pages=1)
+        pool.launched[0].crashed = True
+        pool.launch_fails = 2           # relaunch fails on the error recycle & on the pre-use retry of the next render
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                pool.render_sync("https://x.test/a", timeout=1)
+            self.assertEqual(pool.idle.qsize(), 1)
+        self.assertEqual((pool.recycle_fails, pool.render_fails, pool.relaunches), (1, 2, 1))
+        self.assertEqual(pool.render_sync("https://x.test/b", timeout=1), "<html>https://x.test/b</html>")
+
+    def test_timeout_cancels_the_render(self):
+        pool = self.make(pages=1)
+        pool.sync_grace = 0.2
+        with self.assertRaises(concurrent.futures.TimeoutError):
+            pool.render_sync("https://x.test/hang", timeout=0.1)
+        self.assertEqual(pool.render_sync("https://x.test/next", timeout=1), "<html>https://x.test/next</html>")
+        self.assertEqual(pool.launched[0].active, 0)
+
+    def test_render_times_are_bounded(self):
+        pool = self.make(pages=1)
+        pool.render_times = type(pool.render_times)(maxlen=3)
+        for i in range(5):
+            pool.render_sync(f"https://x.test/{i}")
+        self.assertEqual(len(pool.render_times), 3)
+        self.assertEqual(pool.stats()['renders'], 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -175,4 +175,134 @@ def test_bulk_predict_sentiment_too_many_texts(mocked_sentiment_model):
 
     # Act & Assert
     with pytest.raises(ValueError, match="Cannot process more than 1000 texts at a time."):
-        mocked_sentiment_model.bulk_predict_sentiment(texts)
\ No newline at end of file
+        mocked_sentiment_model.bulk_predict_sentiment(texts)
+
+class _LengthModel(torch.nn.Module):
+    """Scores each row by its real token count (odd = POSITIVE, even = NEGATIVE) & records batch shapes"""
+
+    def __init__(self):
+        super().__init__()
+        self.shapes = []
+        self.config = MagicMock()
+        self.config.id2label = {0: 'NEGATIVE', 1: 'POSITIVE', 2: 'NEUTRAL'}
+
+    def forward(self, input_ids, attention_mask, **kwargs):
+        self.shapes.append(tuple(input_ids.shape))
+        odd = (attention_mask.sum(dim=-1) % 2).float()
+        logits = torch.stack([1.0 - odd, odd, torch.zeros_like(odd)], dim=-1) * 3.0
+        return MagicMock(logits=logits)
+
+
+@pytest.fixture
+def streaming_model(tmp_path):
+    from transformers import BertTokenizerFast
+    vocab = tmp_path / "vocab.txt"
+    vocab.write_text("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", "up", "down", "w"]))
+    with patch('ml_sentiment.AutoModelForSequenceClassification.from_pretrained'), \
+         patch('ml_sentiment.AutoTokenizer.from_pretrained'):
+        model = SentimentAnalysisModel(model_name='ProsusAI/finbert')
+    model.tokenizer = BertTokenizerFast(vocab_file=str(vocab))
+    model.model = _LengthModel()
+    model.device = 'cpu'
+    return model
+
+
+# Test Case 8: Streaming, length bucketed inference (SAM-STREAM-001)
+def test_predict_stream_input_order_and_token_budget(streaming_model):
+    """
+    predict_stream() takes more than 1000 texts, keeps input order and never
+    builds a micro-batch over the padded token budget.
+    """
+    texts = [" ".join(["w"] * (i % 7)) for i in range(1500)]
+    results = list(streaming_model.predict_stream(iter(texts), token_budget=64, window=500))
+
+    assert len(results) == 1500
+    for text, result in zip(texts, results):
+        n_tokens = len(text.split()) + 2                    # [CLS] + [SEP]
+        assert result['label'] == ('POSITIVE' if n_tokens % 2 else 'NEGATIVE')
+    assert all(rows * width <= 64 for rows, width in streaming_model.model.shapes)
+    p = float(torch.softmax(torch.tensor([0.0, 3.0, 0.0]), dim=-1)[1])
+    assert streaming_model.predict([["w"], "w w"]) == pytest.approx([p, -p])
+
+
+# Test Case 9: Persistent inference cache (SAM-CACHE-001)
+def test_inference_cache_skips_seen_text(streaming_model, tmp_path):
+    """
+    Texts already scored (after whitespace normalization) are served from the
+    cache on every predict path and survive a reopen of the cache file.
+    """
+    from ml_sentcache import InferenceCache
+    path = str(tmp_path / "sent.sqlite")
+    streaming_model.cache = InferenceCache(path)
+    first = streaming_model.bulk_predict_sentiment(["w up", "down"])
+    calls = len(streaming_model.model.shapes)
+
+    streaming_model.cache = InferenceCache(path)
+    assert streaming_model.bulk_predict_sentiment(["w  up ", "down"]) == first
+    assert list(streaming_model.predict_stream(["down", "w up"])) == first[::-1]
+    assert streaming_model.predict_sentiment("down") == first[1]
+    assert len(streaming_model.model.shapes) == calls
+    assert streaming_model.cache.stats()['hit_rate'] == 1.0
+    tokens = [r['tokens'] for r in streaming_model.predict_stream(["down", "w w down"], with_tokens=True)]
+    assert tokens == [0, 5]                                 # cache hit is never tokenized
+
+
+def test_inference_cache_lru_eviction():
+    from ml_sentcache import InferenceCache
+    cache = InferenceCache(':memory:', max_rows=10)
+    for i in range(10):
+        cache.put_many('m', [f"t{i}"], [{'label': 'positive', 'score': 0.5, 'logits': [0.0, 1.0, 0.0]}])
+    cache.get_many('m', ["t0"])                                      # t0 is now most recently used
+    cache.put_many('m', ["t10"], [{'label': 'negative', 'score': 0.7, 'logits': None}])
+    assert cache.stats()['rows'] == 9
+    kept = cache.get_many('m', ["t0", "t10"])
+    assert kept[0]['logits'] == [0.0, 1.0, 0.0]
+    assert kept[1] == {'label': 'negative', 'score': 0.7, 'logits': None}
+    assert cache.get_many('m', [f"t{i}" for i in range(1, 10)]).count(None) == 2
+
+
+def _tiny_bert():
+    from transformers import BertConfig, BertForSequenceClassification
+    torch.manual_seed(0)
+    config = BertConfig(vocab_size=16, hidden_size=32, num_hidden_layers=2, num_attention_heads=2,
+                        intermediate_size=64, num_labels=3,
+                        id2label={0: 'positive', 1: 'negative', 2: 'neutral'})
+    return BertForSequenceClassification(config).eval()
+
+
+# Test Case 10: Pluggable CPU backends (SAM-BACKEND-001)
+@pytest.mark.parametrize("backend", ["int8", "onnx"])
+def test_backend_parity_with_fp32(streaming_model, backend, tmp_path, monkeypatch):
+    """
+    A non fp32 backend is selectable at runtime, keeps its own cache id and
+    reports label agreement with fp32 torch on the parity corpus.
+    """
+    if backend == "onnx":
+        pytest.importorskip("onnxruntime")
+        monkeypatch.setattr('ml_backends.OnnxBackend.default_path', str(tmp_path / "tiny.onnx"))
+    streaming_model.model = _tiny_bert()
+    streaming_model.set_backend(backend)
+
+    report = streaming_model.parity_check()
+    assert report['backend'] == backend
+    assert 0.0 <= report['agreement'] <= 1.0
+    assert len(report['mismatches']) == round((1.0 - report['agreement']) * 20)
+    assert streaming_model.model_id == f"ProsusAI/finbert#{backend}"
+    assert len(list(streaming_model.predict_stream(["w up", "down"]))) == 2
+
+
+def test_unknown_backend(streaming_model):
+    with pytest.raises(ValueError, match="Unknown sentiment backend"):
+        streaming_model.set_backend("tpu")
+
+
+def test_onnx_export_leaves_shared_model_alone(tmp_path, streaming_model):
+    """The export runs on a cpu copy, the caller's model is never moved or re-moded."""
+    from ml_backends import OnnxBackend
+    model = _tiny_bert().train()
+    with patch('torch.onnx.export') as export, patch.object(torch.nn.Module, 'to', side_effect=AssertionError("model.to()")):
+        OnnxBackend.export(model, streaming_model.tokenizer, str(tmp_path / "tiny.onnx"))
+    exported = export.call_args.args[0]
+    assert exported is not model
+    assert not exported.training
+    assert model.training
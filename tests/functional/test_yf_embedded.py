@@ -0,0 +1,82 @@
+import json
+import unittest
+
+from yf_embedded import yf_embedded
+from y_screentable import screen_table
+
+
+def page(doc, url="https://query1.finance.yahoo.com/v1/finance/screener?a=1&amp;b=2"):
+    """Yahoo style page : the API response is a JSON string inside sveltekit's fetch wrapper"""
+    return f'<html><body><div>x</div>{script(doc, url)}</body></html>'
+
+
+def script(doc, url):
+    wrapper = json.dumps({"status": 200, "body": json.dumps(doc)})
+    return f'<script type="application/json" data-sveltekit-fetched data-url="{url}">{wrapper}</script>'
+
+
+QUOTES = {"finance": {"result": [{"quotes": [
+    {"symbol": "AAPL", "shortName": "Apple Inc.", "regularMarketPrice": {"raw": 190.5, "fmt": "190.50"},
+     "regularMarketChange": -1.25, "regularMarketChangePercent": -0.65, "marketCap": 2.95e12},
+    {"symbol": "TINY", "shortName": "Tiny Co", "regularMarketPrice": 1.2,
+     "regularMarketChange": 0.1, "regularMarketChangePercent": 9.1}]}]}}
+
+DECOY = {"marketSummaryResponse": {"result": [
+    {"symbol": "^GSPC", "shortName": "S&P 500", "regularMarketPrice": {"raw": 5100.1, "fmt": "5,100.10"}},
+    {"symbol": "^DJI", "shortName": "Dow 30", "regularMarketPrice": {"raw": 38900.0, "fmt": "38,900.00"}},
+    {"symbol": "^IXIC", "shortName": "Nasdaq", "regularMarketPrice": {"raw": 16000.5, "fmt": "16,000.50"}}]}}
+
+SUMMARY_URL = "https://query1.finance.yahoo.com/v6/finance/quote/marketSummary?lang=en-US"
+SCREENER_URL = "https://query1.finance.yahoo.com/v1/finance/screener/predefined/saved?scrIds=day_gainers"
+
+
+def list_page(table_rows):
+    """Screener page : market summary strip payload 1st, then the table's screener payload, then the table"""
+    rows = "".join(f"<tr><td>{i}</td></tr>" for i in range(table_rows))
+    return (f'<html><body>{script(DECOY, SUMMARY_URL)}{script(QUOTES, SCREENER_URL)}'
+            f'<table><tbody>{rows}</tbody></table></body></html>')
+
+
+class TestYfEmbedded(unittest.TestCase):
+
+    def test_payloads_unwraps_body_and_data_url(self):
+        found = yf_embedded.payloads(page(QUOTES))
+        self.assertEqual(len(found), 1)
+        self.assertEqual(found[0][0], "https://query1.finance.yahoo.com/v1/finance/screener?a=1&b=2")
+        self.assertIn("finance", found[0][1])
+
+    def test_screener_quotes_builds_classic_df0(self):
+        df = screen_table(0).build_df_json(yf_embedded.screener_quotes(page(QUOTES)), time_now="t")
+        self.assertEqual(list(df.columns), screen_table.columns)
+        self.assertEqual(df['Symbol'].tolist(), ["AAPL  ", "TINY  "])
+        self.assertEqual(df['Cur_price'].tolist(), [190.5, 1.2])
+        self.assertEqual(df['Pct_change'].tolist(), [0.65, 9.1])
+        self.assertEqual(df['Mkt_cap'].tolist(), [2.95, 0.0])
+        self.assertEqual(df['M_B'].tolist(), ["LT", "LZ"])
+
+    def test_screener_quotes_skips_decoy_payload(self):
+        quotes = yf_embedded.screener_quotes(list_page(2))
+        self.assertEqual([q['symbol'] for q in quotes], ["AAPL", "TINY"])
+
+    def test_screener_quotes_needs_screener_data_url(self):
+        self.assertIsNone(yf_embedded.screener_quotes(page(DECOY, SUMMARY_URL)))
+
+    def test_screener_quotes_row_count_mismatch_falls_back(self):
+        self.assertEqual(yf_embedded.table_rows(list_page(3)), 3)
+        self.assertIsNone(yf_embedded.screener_quotes(list_page(3)))
+
+    def test_news_stream_skips_linkless_items(self):
+        doc = {"data": {"tickerStream": {"stream": [
+            {"content": {"title": "Story", "clickThroughUrl": {"url": "https://finance.yahoo.com/news/a.html"},
+                         "provider": {"displayName": "Reuters"}}},
+            {"content": {"title": "Ad", "clickThroughUrl": None}}]}}}
+        self.assertEqual(yf_embedded.news_stream(page(doc)),
+                         [{"title": "Story", "url": "https://finance.yahoo.com/news/a.html", "agency": "Reuters"}])
+
+    def test_no_payload_falls_back(self):
+        self.assertIsNone(yf_embedded.screener_quotes("<html><table><tbody></tbody></table></html>"))
+        self.assertIsNone(yf_embedded.news_stream('<script type="application/json">{not json</script>'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import copy
+import unittest
+
+from bs4 import BeautifulSoup
+
+from yf_selectors import yf_selectors
+
+FEED = '''<section class="container yf-1ce4p3e"><ul>
+<li><div><a href="/news/a.html"><h3>Head A</h3></a><a href="/x">no headline</a>
+<div class="publishing yf-1weyqlp">Reuters • 2h ago</div></div></li>
+<li><a><h3>no href</h3></a></li></ul></section>'''
+
+
+class TestYfSelectors(unittest.TestCase):
+
+    def setUp(self):
+        self.saved = (copy.deepcopy(yf_selectors.profiles), dict(yf_selectors.compiled))
+
+    def tearDown(self):
+        yf_selectors.profiles, yf_selectors.compiled = self.saved
+
+    def test_feed_profile_selects_headline_links_directly(self):
+        doc = BeautifulSoup(FEED, "html.parser")
+        container = yf_selectors.many(doc, 'feed', 'container')[0]
+        stories = yf_selectors.many(container, 'feed', 'stories')
+        self.assertEqual(len(stories), 2)
+        links = yf_selectors.many(stories[0], 'feed', 'headline_link')
+        self.assertEqual([(a.h3.text, a['href']) for a in links], [("Head A", "/news/a.html")])
+        self.assertEqual(yf_selectors.one(stories[0], 'feed', 'agency').text.split("•")[0], "Reuters ")
+        self.assertEqual(yf_selectors.many(stories[1], 'feed', 'headline_link'), [])
+
+    def test_set_profile_swaps_layout(self):
+        doc = BeautifulSoup('<div class="body yf-new"><p>x</p></div>', "html.parser")
+        self.assertIsNone(yf_selectors.one(doc, 'article', 'body'))
+        yf_selectors.set_profile('article', {'body': '.body.yf-new'})
+        self.assertEqual(yf_selectors.one(doc, 'article', 'body').p.text, "x")
+        self.assertIsNone(yf_selectors.one(None, 'article', 'body'))
+
+
+if __name__ == '__main__':
+    unittest.main()
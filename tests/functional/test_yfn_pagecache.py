@@ -0,0 +1,157 @@
+import os
+import time
+import unittest
+import tempfile
+
+from yfn_pagecache import page_cache, cached_page
+
+FEED = "https://finance.yahoo.com/quote/IBM/news/"
+ARTICLE = "https://finance.yahoo.com/news/ibm-beats-estimates-123.html"
+PAGE = "https://www.reuters.com/markets/ibm"
+
+
+def page(url, age=0, body="<html>body</html>"):
+    return cached_page(url, body, {'Content-Type': 'text/html'}, 200, time.time() - age)
+
+
+class TestPageCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache = page_cache(root=self.tmp.name)
+
+    def test_memory_tier_expires_feed(self):
+        h = self.cache.hash_url(FEED)
+        self.cache[h] = page(FEED, age=3600)
+        self.assertNotIn(h, self.cache)
+        with self.assertRaises(KeyError):
+            self.cache[h]
+        self.assertEqual(self.cache.stats()['expired'], 1)
+        self.assertEqual(self.cache.stats()['resident_bytes'], 0)
+
+    def test_memory_tier_keeps_fresh_feed_and_old_article(self):
+        hf, ha = self.cache.hash_url(FEED), self.cache.hash_url(ARTICLE)
+        self.cache[hf] = page(FEED, age=60)
+        self.cache[ha] = page(ARTICLE, age=30 * 86400)
+        self.assertEqual(self.cache[hf].url, FEED)
+        self.assertEqual(self.cache[ha].url, ARTICLE)
+        self.assertEqual(self.cache.stats()['mem_hits'], 2)
+
+    def reopen(self):
+        """Fresh process view of the same disk root (empty memory tier)"""
+        return page_cache(root=self.tmp.name)
+
+    def test_disk_tier_ttl_per_class(self):
+        ages = {FEED: 16 * 60, PAGE: 2 * 3600, ARTICLE: 365 * 86400}
+        for url, age in ages.items():
+            self.cache[self.cache.hash_url(url)] = page(url, age=age)
+        cold = self.reopen()
+        with self.assertRaises(KeyError):
+            cold[cold.hash_url(FEED)]
+        with self.assertRaises(KeyError):
+            cold[cold.hash_url(PAGE)]
+        self.assertEqual(cold[cold.hash_url(ARTICLE)].text, "<html>body</html>")
+        self.assertEqual(cold.stats()['expired'], 2)
+        self.assertFalse(os.path.exists(cold.path_of(cold.hash_url(FEED))))
+
+    def test_disk_round_trip_within_ttl(self):
+        h = self.cache.hash_url(PAGE)
+        self.cache[h] = page(PAGE, age=60, body="<html>héllo</html>")
+        got = self.reopen()[h]
+        self.assertEqual((got.url, got.text, got.status_code, got.uclass), (PAGE, "<html>héllo</html>", 200, 'page'))
+        self.assertEqual(got.headers, {'Content-Type': 'text/html'})
+
+    def test_corrupt_entry_dropped(self):
+        h = self.cache.hash_url(ARTICLE)
+        self.cache[h] = page(ARTICLE)
+        with open(self.cache.path_of(h), "wb") as f:
+            f.write(b"not zlib at all")
+        cold = self.reopen()
+        with self.assertRaises(KeyError):
+            cold[h]
+        self.assertFalse(os.path.exists(cold.path_of(h)))
+        self.assertEqual(cold.stats()['misses'], 1)
+
+    def test_miss_raises_key_error(self):
+        h = self.cache.hash_url("https://finance.yahoo.com/news/never-fetched.html")
+        with self.assertRaises(KeyError):
+            self.cache[h]
+        self.assertNotIn(h, self.cache)
+        self.assertEqual(self.cache.stats()['misses'], 2)
+
+    def test_non_200_not_persisted(self):
+        h = self.cache.hash_url(PAGE)
+        self.cache[h] = cached_page(PAGE, "gone", {}, 404, time.time())
+        self.assertFalse(os.path.exists(self.cache.path_of(h)))
+
+    def test_url_class(self):
+        self.assertEqual(self.cache.url_class(FEED), 'feed')
+        self.assertEqual(self.cache.url_class("https://finance.yahoo.com/quote/IBM/press-releases/"), 'feed')
+        self.assertEqual(self.cache.url_class(ARTICLE), 'article')
+        self.assertEqual(self.cache.url_class("https://finance.yahoo.com/m/49c6/story.html"), 'article')
+        self.assertEqual(self.cache.url_class("https://finance.yahoo.com/video/clip.html"), 'article')
+        self.assertEqual(self.cache.url_class("https://finance.yahoo.com/quote/IBM/"), 'page')
+        self.assertEqual(self.cache.url_class(PAGE), 'page')
+        self.assertEqual(self.cache.url_class("https://example.com/news/x.html"), 'page')
+
+
+class TestPageCacheLru(unittest.TestCase):
+    """In-memory tier bounded to three same-sized article pages"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.urls = [f"https://finance.yahoo.com/news/story-{i}.html" for i in range(4)]
+        self.size = page(self.urls[0]).nbytes
+        self.cache = page_cache(root=self.tmp.name, mem_budget=3 * self.size)
+        self.h = [self.cache.hash_url(u) for u in self.urls]
+
+    def fill(self, n=3):
+        for i in range(n):
+            self.cache[self.h[i]] = page(self.urls[i])
+
+    def test_oldest_evicted_first(self):
+        self.fill(4)
+        self.assertEqual(list(self.cache.keys()), self.h[1:])
+        stats = self.cache.stats()
+        self.assertEqual((stats['evictions'], stats['resident'], stats['resident_bytes']), (1, 3, 3 * self.size))
+
+    def test_hit_refreshes_lru_order(self):
+        self.fill(3)
+        self.cache[self.h[0]]                           # touch 0, so 1 is now least recently used
+        self.cache[self.h[3]] = page(self.urls[3])
+        self.assertEqual(list(self.cache.keys()), [self.h[2], self.h[0], self.h[3]])
+
+    def test_mem_bytes_on_overwrite_and_delete(self):
+        self.fill(2)
+        big = page(self.urls[0], body="<html>" + "x" * 40 + "</html>")
+        self.cache[self.h[0]] = big
+        self.assertEqual(self.cache.mem_bytes, self.size + big.nbytes)
+        self.assertEqual(len(self.cache), 2)
+        del self.cache[self.h[0]]
+        self.assertEqual(self.cache.mem_bytes, self.size)
+        del self.cache[self.h[1]]
+        self.assertEqual(self.cache.stats()['resident_bytes'], 0)
+        self.assertEqual(self.cache.stats()['evictions'], 0)
+
+    def test_oversized_page_stays_resident_alone(self):
+        self.fill(2)
+        huge = page(self.urls[3], body="x" * (4 * self.size))
+        self.cache[self.h[3]] = huge
+        self.assertEqual(list(self.cache.keys()), [self.h[3]])
+        self.assertEqual(self.cache.mem_bytes, huge.nbytes)
+
+    def test_evicted_page_reloads_from_disk(self):
+        self.fill(4)
+        self.assertNotIn(self.h[0], self.cache.keys())
+        self.assertEqual(self.cache[self.h[0]].url, self.urls[0])
+        stats = self.cache.stats()
+        self.assertEqual((stats['disk_hits'], stats['mem_hits'], stats['misses']), (1, 0, 0))
+        self.assertEqual(list(self.cache.keys()), [self.h[2], self.h[3], self.h[0]])
+        self.assertEqual(stats['evictions'], 2)
+        self.assertEqual(stats['resident_bytes'], 3 * self.size)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,6 +9,8 @@ import argparse
 logging.basicConfig(level=logging.INFO)
 
 from requests_html import HTMLSession
+from http_pool import http_pool
+from yf_embedded import yf_embedded
 
 #####################################################
 
@@ -75,8 +77,9 @@ class y_cookiemonster:
 
 ###########################################################################################
 # method #2
-    def get_js_data(self, js_url):
+    def get_js_data(self, js_url, have=None):
         """Connect to finance.yahoo.com and open a Javascript Webpage"""
+        """have = body digest of the copy of this page the caller already holds (see http_pool.cond_get)"""
         """Process with Javascript engine and return JS webpage handle"""
         """Optionally the Javascript engine can render the webspage as Javascript and"""
         """and then hand back the processed JS webpage. - This is currently didabled"""
@@ -93,13 +96,14 @@ class y_cookiemonster:
         logging.info( f"%s - URL: {js_url}" % cmi_debug )
         logging.info( f"%s - Init JS_session HTMLsession() setup" % cmi_debug )
 
-        js_session = HTMLSession()
+        js_session = http_pool.get_session(js_url)     # shared keep-alive session for this site
         
         #js_resp0 = js_session.get( test_url )
         #js_resp0 = js_session.get( test_url, stream=True, headers=self.yahoo_headers, cookies=self.yahoo_headers, timeout=5 ) as js_resp0:
         #with js_session.get( test_url, stream=True, headers=self.yahoo_headers, cookies=self.yahoo_headers, timeout=5 ) as js_resp0:
         # with js_session.get( 'https://www.javatester.org/javascript.html', stream=True, timeout=5 ) as self.js_resp0
-        with js_session.get( js_url ) as self.js_resp0:
+        # conditional get : repeat polls of an unchanged page come back flagged js_resp0.unchanged = True
+        with http_pool.cond_get( js_url, have=have ) as self.js_resp0:
             logging.info( f"%s - JS_session.get() sucessful: {js_url}" % cmi_debug )
         
         logging.info( f"%s - js.render()... diasbled" % cmi_debug )
@@ -119,3 +123,16 @@ class y_cookiemonster:
         # self.js_session.cookies.update(self.nasdaq_headers)    # load cookie/header hack data set into session
 
         return self.js_resp0
+
+###########################################################################################
+# method #3
+    def get_js_json(self):
+        """
+        Decode the JSON data blocks embedded in the last page fetched by get_js_data()
+        Lets callers read the page's own API data (quotes, news stream...) without a BS4 parse
+        return : list of (data_url, decoded JSON). Empty list = no embedded data, use the DOM path
+        """
+        cmi_debug = __name__+"::"+self.get_js_json.__name__+".#"+str(self.yti)
+        self.js_json = yf_embedded.payloads(self.js_resp0.text)
+        logging.info( f"%s - {len(self.js_json)} embedded JSON blocks" % cmi_debug )
+        return self.js_json
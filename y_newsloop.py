@@ -9,6 +9,7 @@ import time
 from datetime import datetime, date
 import hashlib
 import json
+from render_pool import render_pool
 
 # logging setup
 logging.basicConfig(level=logging.INFO)
@@ -59,7 +60,7 @@ class y_newsfilter:
         with self.js_session.get( f'{news_url}', stream=True, timeout=5 ) as self.js_resp0:
             logging.info('%s - JS_Request get() done' % cmi_debug )
 
-        self.js_resp0.html.render()
+        render_pool.get_shared().render_response(self.js_resp0)     # warm shared Chromium pool
         logging.info('%s - Javascript engine completed!' % cmi_debug )
         logging.info('%s - Javascript quote : store FULL json dataset' % cmi_debug )
         self.news_pridata = json.loads(self.js_resp0)
@@ -0,0 +1,125 @@
+#! python3
+import numpy as np
+import pandas as pd
+import logging
+import time
+from md_clean import md_clean
+from yf_embedded import yf_embedded
+
+# logging setup
+logging.basicConfig(level=logging.INFO)
+
+#####################################################
+
+class screen_table:
+    """
+    Shared single pass, columnar extractor for finance.yahoo.com list/screener tables
+    (/markets/stocks/most-active, /markets/stocks/losers, /research-hub/screener/...).
+    Walks the <tbody> <tr> rows once, appends each raw field to its own column list, cleans each
+    column in 1 vectorized md_clean call, then builds the DataFrame exactly once (no per-row DataFrame + concat).
+    Used by y_topgainers, y_daylosers & smallcap_screen.
+    """
+
+    # global accessors
+    columns = [ 'Row', 'Symbol', 'Co_name', 'Cur_price', 'Prc_change', 'Pct_change', 'Mkt_cap', 'M_B', 'Time' ]
+    signs = ("+", "-")                      # dedicated +/- sign cell (ignored, value is in the next cell)
+
+    def __init__(self, yti, lead_cols=0, sym_split=False, mb_prefix="L"):
+        """
+        lead_cols : num of junk cells before the symbol cell (small cap screener has 1)
+        sym_split : symbol cell holds extra text. Take the last whitespace token (screener pages)
+        mb_prefix : 1st char of the M_B scale tag. L = Large cap lists, S = Small cap screener
+        """
+        cmi_debug = __name__+"::"+self.__init__.__name__
+        logging.info( f'%s - Instantiate.#{yti}' % cmi_debug )
+        self.yti = yti
+        self.lead_cols = lead_cols
+        self.sym_split = sym_split
+        self.mb_prefix = mb_prefix
+        return
+
+######################################################################
+# method 1
+    def row_cells(self, datarow):
+        """return : list of the leading text string of every <td> in 1 <tr> (canvas cells -> 'canvas')"""
+        cells = []
+        for i, td in enumerate(datarow.find_all("td")):
+            if td.canvas is not None:
+                cells.append("canvas")
+            elif self.sym_split is True and i == self.lead_cols:
+                cells.append(td.text.split()[-1])
+            else:
+                cells.append(next(td.stripped_strings))
+        return cells
+
+######################################################################
+# method 2
+    def extract(self, tr_rows):
+        """
+        Single pass over the table rows. Only locates each field. All cleaning is done later, per column
+        return : dict of column name -> list of raw cell strings (in page order)
+        """
+        cmi_debug = __name__+"::"+self.extract.__name__+".#"+str(self.yti)
+        cols = { 'Symbol': [], 'Co_name': [], 'Cur_price': [], 'Prc_change': [], 'Pct_change': [], 'Mkt_cap': [] }
+        for datarow in tr_rows:
+            cells = self.row_cells(datarow)
+            c = self.lead_cols
+            cols['Symbol'].append(cells[c])         # ticker symbol info / e.g "NWAU"
+            cols['Co_name'].append(cells[c+1])      # company name / e.g "Consumer Automotive Finance, Inc."
+            cols['Cur_price'].append(cells[c+3])    # price (Intraday) / e.g "0.0031". c+2 = embeded mini GFX chart
+            c += 4
+            if cells[c] in self.signs:              # $ change has a dedicated [+/-] cell
+                c += 1
+            cols['Prc_change'].append(cells[c])
+            c += 1
+            if cells[c] in self.signs:              # % change has a dedicated [+/-] cell
+                c += 1
+            cols['Pct_change'].append(cells[c])
+            cols['Mkt_cap'].append(cells[c+3])      # c+1 = volume / c+2 = avg vol (3 months) / c+3 = mkt cap e.g "15.753B"
+
+        logging.info( f"%s - extracted {len(cols['Symbol'])} rows" % cmi_debug )
+        return cols
+
+######################################################################
+# method 3
+    def build_df(self, tr_rows, time_now=None):
+        """
+        Extract all rows, clean each column in 1 vectorized md_clean call & construct the DataFrame in 1 shot
+        return : DataFrame with the classic screener DF0 columns
+        """
+        time_now = time.strftime("%H:%M:%S", time.localtime() ) if time_now is None else time_now
+        cols = self.extract(tr_rows)
+        n = len(cols['Symbol'])
+        mc_val, mc_scale = md_clean.scale_suffix(cols['Mkt_cap'])      # N/A or unscaled -> NaN / ''
+        return pd.DataFrame( { 'Row': np.arange(n, dtype=np.int64), \
+                               'Symbol': md_clean.series(cols['Symbol']).str.replace("'", "", regex=False).str.ljust(6).values, \
+                               'Co_name': md_clean.pad_name(cols['Co_name'], 60).values, \
+                               'Cur_price': md_clean.to_float(cols['Cur_price']).values, \
+                               'Prc_change': md_clean.to_float(cols['Prc_change']).values, \
+                               'Pct_change': md_clean.percent(cols['Pct_change'], unsigned=True).fillna(0.0).values, \
+                               'Mkt_cap': mc_val.fillna(0.0).values, \
+                               'M_B': (self.mb_prefix + mc_scale.replace('', 'Z')).values, \
+                               'Time': [time_now] * n }, columns=self.columns )
+
+######################################################################
+# method 4
+    def build_df_json(self, quotes, time_now=None):
+        """
+        Same DataFrame as build_df(), built from the page's embedded JSON quote list (see yf_embedded.screener_quotes)
+        Values are already numeric, so only the name padding & market cap scaling need md_clean
+        """
+        cmi_debug = __name__+"::"+self.build_df_json.__name__+".#"+str(self.yti)
+        time_now = time.strftime("%H:%M:%S", time.localtime() ) if time_now is None else time_now
+        n = len(quotes)
+        col = lambda key: pd.to_numeric(pd.Series([yf_embedded.value(q, key) for q in quotes], dtype=object), errors='coerce').astype(np.float64)
+        mc_val, mc_scale = md_clean.scale_down([yf_embedded.value(q, 'marketCap') for q in quotes])
+        logging.info( f"%s - {n} rows from embedded JSON" % cmi_debug )
+        return pd.DataFrame( { 'Row': np.arange(n, dtype=np.int64), \
+                               'Symbol': md_clean.series([q['symbol'] for q in quotes]).str.ljust(6).values, \
+                               'Co_name': md_clean.pad_name([q.get('shortName') or q.get('longName', '') for q in quotes], 60).values, \
+                               'Cur_price': col('regularMarketPrice').values, \
+                               'Prc_change': col('regularMarketChange').values, \
+                               'Pct_change': col('regularMarketChangePercent').abs().fillna(0.0).values, \
+                               'Mkt_cap': mc_val.fillna(0.0).values, \
+                               'M_B': (self.mb_prefix + mc_scale.replace('', 'Z')).values, \
+                               'Time': [time_now] * n }, columns=self.columns )
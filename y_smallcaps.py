@@ -8,6 +8,10 @@ import logging
 import argparse
 import time
 from rich import print
+from http_pool import http_pool
+from fast_parse import fast_parse
+from y_screentable import screen_table
+from yf_embedded import yf_embedded
 
 
 # logging setup
@@ -58,10 +62,12 @@ class smallcap_screen:
         self.dg1_df1 = pd.DataFrame(columns=[ 'ERank', 'Symbol', 'Co_name', 'Cur_price', 'Prc_change', 'Pct_change', 'Mkt_cap', 'M_B', 'Time'] )
         self.dg1_df2 = pd.DataFrame(columns=[ 'ERank', 'Symbol', 'Co_name', 'Cur_price', 'Prc_change', 'Pct_change', 'Mkt_cap', 'M_B', 'Time'] )
         self.yti = yti
+        self.screen_tab = screen_table(yti, lead_cols=1, sym_split=True, mb_prefix="S")    # shared columnar table extractor
+        self.json_quotes = None                         # page rows from the embedded JSON fast path (None = DOM path)
         return
 
     def init_dummy_session(self):
-        self.dummy_resp0 = requests.get(self.dummy_url, stream=True, headers=self.yahoo_headers, cookies=self.yahoo_headers, timeout=5 )
+        self.dummy_resp0 = http_pool.get_session(self.dummy_url).get(self.dummy_url, stream=True, headers=self.yahoo_headers, cookies=self.yahoo_headers, timeout=5 )
         hot_cookies = requests.utils.dict_from_cookiejar(self.dummy_resp0.cookies)
         #self.js_session.cookies.update({'A1': self.js_resp0.cookies['A1']} )    # yahoo cookie hack
         return
@@ -83,8 +89,14 @@ class smallcap_screen:
         logging.info('%s - ext request pre-processed by cookiemonster...' % cmi_debug )
         # use preexisting resposne from  managed req (handled by cookie monster) 
         r = self.ext_req
+        self.json_quotes = yf_embedded.screener_quotes(r.text)     # fast path. Page's embedded JSON, no DOM parse
+        if self.json_quotes is not None:
+            yf_embedded.tally('smallcaps', 'json')
+            logging.info( f"%s - {len(self.json_quotes)} rows from embedded JSON. Skip BS4 parse" % cmi_debug )
+            return
+        yf_embedded.tally('smallcaps', 'dom')
         logging.info( f"%s - BS4 stream processing..." % cmi_debug )
-        self.soup = BeautifulSoup(r.text, 'html.parser')
+        self.soup = fast_parse.soup(r.text, 'screener')     # fast mode = lxml + <tbody> SoupStrainer
         self.tag_tbody = self.soup.find('tbody')
         self.tr_rows = self.tag_tbody.find_all("tr")
         #self.all_tag_tr = self.soup.find(attrs={"class": "simpTblRow"})
@@ -97,162 +109,21 @@ class smallcap_screen:
         """
         Build-out a fully populated Pandas DataFrame containg all the extracted/scraped fields from the
         html/markup table data Wrangle, clean/convert/format the data correctly.
+        All rows are extracted in 1 columnar pass by the shared screen_table extractor.
         """
 
         cmi_debug = __name__+"::"+self.build_df0.__name__+".#"+str(self.yti)
         logging.info('%s - IN' % cmi_debug )
-        time_now = time.strftime("%H:%M:%S", time.localtime() )
-        logging.info('%s - Create clean NULL DataFrame' % cmi_debug )
-        self.dg1_df0 = pd.DataFrame()             # new df, but is NULLed
-        x = 0
-        self.rows_extr = int( len(self.tag_tbody.find_all('tr')) )
-        self.rows_tr_rows = int( len(self.tr_rows) )
-
-        for datarow in self.tr_rows:
-
-            """
-            # >>>DEBUG<< for whedatarow.stripped_stringsn yahoo.com changes data model...
-            y = 1
-            print ( f"===================== Debug =========================" )
-            #print ( f"Data {y}: {datarow}" )
-            for i in datarow.find_all("td"):
-                print ( f"===================================================" )
-                if i.canvas is not None:
-                    print ( f"Data {y}: Found Canvas, skipping..." )
-                elif y == 2:
-                    sym_split = i.text.split()
-                    print ( f"Data {y}.txt: {sym_split[1]}" )
-                    #print ( f"Data {y}.gs1: {next(i.stripped_strings)}" )
-                else:
-                    print ( f"Data {y}.txt: {i.text}" )
-                    print ( f"Data {y}.gs1: {next(i.stripped_strings)}" )
-                #logging.info( f'%s - Data: {debug_data.strings}' % cmi_debug )
-                y += 1
-            print ( f"===================== Debug =========================" )
-            # >>>DEBUG<< for when yahoo.com changes data model...
-            """
-
-            # Data Extractor Generator
-            def extr_gen():
-                gy = 1 
-                for i in datarow.find_all("td"):
-                    if i.canvas is not None:
-                        yield ( f"canvas" )
-                    elif gy == 2:
-                        sym_split = i.text.split()
-                        yield ( f"{sym_split[-1]}" )
-                    else:
-                        yield ( f"{next(i.stripped_strings)}" )
-                    gy += 1
-
-            ################################ 1 ####################################
-            extr_strs = extr_gen()
-            junk0 = next(extr_strs)              # 0 : junk field (not used)
-            co_sym = next(extr_strs)             # 1 : ticker symbol info / e.g "NWAU"
-            co_name = next(extr_strs)            # 2 : company name / e.g "Consumer Automotive Finance, Inc."
-            mini_chart = next(extr_strs)         # 3 : embeded mini GFX chart
-            price = next(extr_strs)              # 3 : price (Intraday) / e.g "0.0031"
-            logging.info( f"{cmi_debug} : Company Symbol : {co_sym}" )
-            logging.info( f"{cmi_debug} : Company name :   {co_name}" )
-
-            ################################ 2 ####################################
-
-            change_sign = next(extr_strs)        # 4 : test for dedicated column for +/- indicator
-            logging.info( f"{cmi_debug} : {co_sym} : Check $ CHANGE dedicated [+-] field..." )
-            if change_sign == "+" or change_sign == "-":    # 4 : is $ change sign [+/-] a dedciated field
-                change_val = next(extr_strs)     # 4 : Yes, advance iterator to next field (ignore dedciated sign field)
-            else:
-                change_val = change_sign         # 4 : get $ change, but its possibly +/- signed
-                #if (re.search(r'\+', change_val)) or (re.search(r'\-', change_val)) is True:
-                if (re.search(r'\+', change_val)) or (re.search(r'\-', change_val)) is not None:
-                    logging.info( f"{cmi_debug} : $ CHANGE: {change_val} [+-], stripping..." )
-                    change_cl = re.sub(r'[\+\-]', "", change_val)       # remove +/- sign
-                    logging.info( f"{cmi_debug} : $ CHANGE cleaned to: {change_cl}" )
-                else:
-                    logging.info( f"{cmi_debug} : {change_val} : $ CHANGE is NOT signed [+-]" )
-                    change_cl = re.sub(r'[\,]', "", change_val)       # remove
-                    logging.info( f"{cmi_debug} : $ CHANGE: {change_cl}" )
-
-            pct_sign = next(extr_strs)              # 5 : test for dedicated column for +/- indicator
-            logging.info( f"{cmi_debug} : {co_sym} : Check % CHANGE dedicated [+-] field..." )
-            if pct_sign == "+" or pct_sign == "-":  # 5 : is %_change sign [+/-] a dedciated field
-                pct_val = next(extr_strs)           # 5 : advance iterator to next field (ignore dedciated sign field)
-            else:
-                pct_val = pct_sign                  # 5 get % change, but its possibly +/- signed
-                if (re.search(r'\+', pct_val)) or (re.search(r'\-', pct_val)) is not None:
-                    logging.info( f"{cmi_debug} : % CHANGE {pct_val} [+-], stripping..." )
-                    pct_cl = re.sub(r'[\+\-\%]', "", pct_val)       # remove +/-/% signs
-                    logging.info( f"{cmi_debug} : % CHANGE cleaned to: {pct_cl}" )
-                else:
-                    logging.info( f"{cmi_debug} : {pct_val} : % CHANGE is NOT signed [+-]" )
-                    change_cl = re.sub(r'[\,\%]', "", pct_val)       # remove
-                    logging.info( f"{cmi_debug} : % CHANGE: {pct_val}" )
- 
-            ################################ 3 ####################################
-            vol = next(extr_strs)            # 6 : volume with scale indicator/ e.g "70.250k"
-            avg_vol = next(extr_strs)        # 7 : Avg. vol over 3 months) / e.g "61,447"
-            mktcap = next(extr_strs)         # 8 : Market cap with scale indicator / e.g "15.753B"
-            ############################### 4 ####################################
-            # now wrangle the data...
-            co_sym_lj = f"{co_sym:<6}"                                   # left justify TXT in DF & convert to raw string
-            co_name_lj = np.array2string(np.char.ljust(co_name, 60) )    # left justify TXT in DF & convert to raw string
-            co_name_lj = (re.sub(r'[\'\"]', '', co_name_lj) )             # remove " ' and strip leading/trailing spaces     
-            price_cl = (re.sub(r'\,', '', price))                         # remove ,
-            price_clean = float(price_cl)
-            change_clean = float(change_val)
-
-            if pct_val == "N/A":
-                pct_val = float(0.0)                               # Bad data. FOund a filed with N/A instead of read num
-            else:
-                pct_cl = re.sub(r'[\%\+\-,]', "", pct_val )
-                pct_clean = float(pct_cl)
-
-            ################################ 5 ####################################
-            mktcap = (re.sub(r'[N\/A]', '0', mktcap))               # handle N/A
-            TRILLIONS = re.search('T', mktcap)
-            BILLIONS = re.search('B', mktcap)
-            MILLIONS = re.search('M', mktcap)
-
-            if TRILLIONS:
-                mktcap_clean = float(re.sub('T', '', mktcap))
-                mb = "ST"
-                logging.info( f'%s : #{x} : {co_sym_lj} Mkt Cap: TRILLIONS : T' % cmi_debug )
-
-            if BILLIONS:
-                mktcap_clean = float(re.sub('B', '', mktcap))
-                mb = "SB"
-                logging.info( f'%s : #{x} : {co_sym_lj} Mkt cap: BILLIONS : B' % cmi_debug )
-
-            if MILLIONS:
-                mktcap_clean = float(re.sub('M', '', mktcap))
-                mb = "SM"
-                logging.info( f'%s : #{x} : {co_sym_lj} Mkt cap: MILLIONS : M' % cmi_debug )
-
-            if not TRILLIONS and not BILLIONS and not MILLIONS:
-                mktcap_clean = 0    # error condition - possible bad data
-                mb = "SZ"           # Zillions
-                logging.info( f'%s : #{x} : {co_sym_lj} bad mktcap data N/A : Z' % cmi_debug )
-                # handle bad data in mktcap html page field
- 
-            ################################ 6 ####################################
-            # now construct our list for concatinating to the dataframe 
-            logging.info( f"%s ============= Data prepared for DF =============" % cmi_debug )
-
-            self.list_data = [[ \
-                       x, \
-                       re.sub(r'\'', '', co_sym_lj), \
-                       co_name_lj, \
-                       price_clean, \
-                       change_clean, \
-                       pct_clean, \
-                       mktcap_clean, \
-                       mb, \
-                       time_now ]]
-            
-            ################################ 6 ####################################
-            self.df_1_row = pd.DataFrame(self.list_data, columns=[ 'Row', 'Symbol', 'Co_name', 'Cur_price', 'Prc_change', 'Pct_change', 'Mkt_cap', 'M_B', 'Time' ], index=[x] )
-            self.dg1_df0 = pd.concat([self.dg1_df0, self.df_1_row])
-            x+=1
+        if self.json_quotes is not None:
+            self.rows_extr = len(self.json_quotes)
+            logging.info( f"%s - {self.rows_extr} rows from embedded JSON" % cmi_debug )
+            self.dg1_df0 = self.screen_tab.build_df_json(self.json_quotes)
+        else:
+            self.rows_extr = int( len(self.tr_rows) )
+            self.rows_tr_rows = self.rows_extr
+            logging.info( f"%s - columnar extract of {self.rows_extr} rows" % cmi_debug )
+            self.dg1_df0 = self.screen_tab.build_df(self.tr_rows)    # single pass. DataFrame built once
+        x = len(self.dg1_df0)
 
         logging.info('%s - populated new DF0 dataset' % cmi_debug )
         return x        # number of rows inserted into DataFrame (0 = some kind of #FAIL)
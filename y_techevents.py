@@ -5,6 +5,7 @@ import pandas as pd
 import logging
 import argparse
 import time
+from http_pool import http_pool
 
 # logging setup
 logging.basicConfig(level=logging.INFO)
@@ -86,7 +87,7 @@ class y_techevents:
         """
         cmi_debug = __name__+"::"+self.get_te_zones.__name__+".#"+str(self.yti)+"."+str(me)
         logging.info( f"{cmi_debug} - IN : {self.te_all_url}" )
-        with requests.get( self.te_all_url, stream=True, timeout=5 ) as self.te_resp0:
+        with http_pool.get_session(self.te_all_url).get( self.te_all_url, stream=True, timeout=5 ) as self.te_resp0:
             logging.info( f"{cmi_debug} - get() data / storing..." )
             self.soup = BeautifulSoup(self.te_resp0.text, 'html.parser')
             logging.info( f"{cmi_debug} - Zone #1 / [Entire page] {len(self.soup)} lines extracted / Done" )
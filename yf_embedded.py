@@ -0,0 +1,147 @@
+#! python3
+import re
+import json
+import logging
+import threading
+from urllib.parse import urlparse
+from rich import print
+
+# logging setup
+logging.basicConfig(level=logging.INFO)
+
+#####################################################
+
+class yf_embedded:
+    """
+    Fast path extractor for the JSON data that finance.yahoo.com ships inside its pages.
+    Yahoo list, screener, quote & news pages embed the API responses they were rendered from as
+    <script type="application/json" data-sveltekit-fetched data-url="..."> blocks. Pulling those out with
+    1 regex + json.loads is far cheaper than building a BS4 soup & walking hashed CSS classes (yf-1ce4p3e...)
+    Every extractor returns None when no usable payload exists, so the caller falls back to its DOM path.
+    served{} counts which path (json / dom) served each page type.
+    """
+
+    # global accessors
+    script_rx = re.compile(r'<script[^>]*type="application/json"([^>]*)>(.*?)</script>', re.S)
+    url_rx = re.compile(r'data-url="([^"]*)"')
+    screener_rx = re.compile(r'/v1/finance/screener(/predefined/saved)?$')    # the list table's own API call
+    tbody_rx = re.compile(r'<tbody[^>]*>(.*?)</tbody>', re.S)
+    tr_rx = re.compile(r'<tr[\s>]')
+    served = {}             # page type -> {'json': n, 'dom': n}
+    stat_lock = threading.Lock()
+
+######################################################################
+# method 1
+    @staticmethod
+    def payloads(html):
+        """
+        Decode every embedded JSON script block.
+        return : list of (data_url, decoded JSON). sveltekit's {"status":..,"body":"<json string>"} wrapper is unwrapped
+        """
+        cmi_debug = __name__+"::"+yf_embedded.payloads.__name__
+        found = []
+        for attrs, blob in yf_embedded.script_rx.findall(html):
+            m = yf_embedded.url_rx.search(attrs)
+            data_url = m.group(1).replace("&amp;", "&") if m else ""
+            try:
+                doc = json.loads(blob)
+                if isinstance(doc, dict) and isinstance(doc.get('body'), str):
+                    doc = json.loads(doc['body'])
+            except ValueError:
+                continue
+            found.append((data_url, doc))
+        logging.info( f"%s - {len(found)} embedded JSON payloads" % cmi_debug )
+        return found
+
+    @staticmethod
+    def find_list(doc, is_item):
+        """Depth 1st search of a decoded JSON doc for the 1st non empty list whose items all pass is_item()"""
+        stack = [doc]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                if node and all(isinstance(i, dict) and is_item(i) for i in node):
+                    return node
+                stack.extend(reversed(node))
+            elif isinstance(node, dict):
+                stack.extend(reversed(list(node.values())))
+        return None
+
+######################################################################
+# method 2
+    @staticmethod
+    def screener_quotes(html):
+        """
+        Screener / list page (most-active, losers, small cap gainers...) table rows
+        Only the payload fetched from the screener endpoint counts. Pages also embed other quote lists
+        (market summary strip, trending tickers...) that look the same but are not the table.
+        return : list of yahoo quote dicts (symbol, shortName, regularMarketPrice, ...) or None
+        """
+        cmi_debug = __name__+"::"+yf_embedded.screener_quotes.__name__
+        is_quote = lambda q: 'symbol' in q and 'regularMarketPrice' in q
+        for data_url, doc in yf_embedded.payloads(html):
+            if not yf_embedded.screener_rx.search(urlparse(data_url).path):
+                continue
+            quotes = yf_embedded.find_list(doc, is_quote)
+            if quotes is None:
+                continue
+            rows = yf_embedded.table_rows(html)
+            if rows is not None and rows != len(quotes):
+                logging.info( f"%s - screener payload has {len(quotes)} quotes, page table has {rows} rows. Use DOM" % cmi_debug )
+                return None
+            return quotes
+        return None
+
+    @staticmethod
+    def table_rows(html):
+        """Number of <tr> rows in the page's 1st <tbody>. None if the page has no table"""
+        m = yf_embedded.tbody_rx.search(html)
+        return len(yf_embedded.tr_rx.findall(m.group(1))) if m else None
+
+    @staticmethod
+    def news_stream(html):
+        """
+        Symbol news feed page stories
+        return : list of {'title', 'url', 'agency'} in page order, or None
+        """
+        is_story = lambda s: isinstance(s.get('content'), dict) and 'title' in s['content']
+        for data_url, doc in yf_embedded.payloads(html):
+            stream = yf_embedded.find_list(doc, is_story)
+            if stream is None:
+                continue
+            stories = []
+            for s in stream:
+                c = s['content']
+                link = c.get('clickThroughUrl') or c.get('canonicalUrl') or {}
+                url = link.get('url') if isinstance(link, dict) else link
+                if not url:
+                    continue                # ads & premium upsell tiles carry no link
+                agency = (c.get('provider') or {}).get('displayName', "Failed to extract News Agency")
+                stories.append({'title': c['title'], 'url': url, 'agency': agency})
+            if stories:
+                return stories
+        return None
+
+    @staticmethod
+    def value(q, key, default=None):
+        """Yahoo numbers come as plain values or {'raw': .., 'fmt': ..} objects"""
+        v = q.get(key, default)
+        return v.get('raw', default) if isinstance(v, dict) else v
+
+######################################################################
+# method 3
+    @staticmethod
+    def tally(page_type, path):
+        """Count which extraction path (json / dom) served a page"""
+        with yf_embedded.stat_lock:
+            ps = yf_embedded.served.setdefault(page_type, {'json': 0, 'dom': 0})
+            ps[path] += 1
+        return
+
+    @staticmethod
+    def print_stats():
+        print ( f"========== Yahoo page extraction : embedded JSON vs DOM ==========" )
+        with yf_embedded.stat_lock:
+            for t, v in sorted(yf_embedded.served.items()):
+                print ( f"{t:16} json: {v['json']:4}  dom: {v['dom']:4}" )
+        return
@@ -0,0 +1,93 @@
+#! python3
+import json
+import logging
+import threading
+import soupsieve
+
+# logging setup
+logging.basicConfig(level=logging.INFO)
+
+#####################################################
+
+class yf_selectors:
+    """
+    Selector profile registry for the Yahoo Finance page layouts the news reader interprets.
+    Each page type (feed, article, stub, video, research) maps zone names -> CSS selectors, compiled once
+    with soupsieve & applied as direct selections (select / select_one) instead of per call find()/find_all()
+    lookups on hard coded class strings or descendant walks.
+    When Yahoo changes a layout (they rotate the hashed yf-xxxxxx class names often), swap the profile
+    with set_profile() or load() & nothing in the reader has to change.
+    """
+
+    # global accessors
+    profiles = { 'feed': { 'container': 'section.yf-1ce4p3e', \
+                           'stories': 'li', \
+                           'headline_link': 'a[href]:has(h3)', \
+                           'agency': '.publishing.yf-1weyqlp' }, \
+                 'article': { 'body': '.body.yf-1ir6o1g', \
+                              'byline': '.byline.yf-1k5w6kz', \
+                              'author': 'div.byline-attr-author.yf-1k5w6kz', \
+                              'pubdate': 'div.byline-attr-time-style', \
+                              'paragraphs': 'p' }, \
+                 'stub': { 'main': 'body main', \
+                           'article': 'article', \
+                           'caption': 'h1.cover-title.yf-1rjrr1', \
+                           'author': 'div.byline-attr-author.yf-1k5w6kz', \
+                           'pubdate': 'time.byline-attr-meta-time', \
+                           'ext_link': 'a', \
+                           'continues': '.article.yf-l7apfj', \
+                           'story': '.body.yf-tsvcyu' }, \
+                 'video': { 'body': '.body.yf-tsvcyu', \
+                            'text': 'p' }, \
+                 'research': { 'body': '.body.yf-tsvcyu' } }
+    compiled = {}               # (page, zone) -> soupsieve.SoupSieve
+    comp_lock = threading.Lock()
+
+######################################################################
+# method 1
+    @staticmethod
+    def sel(page, zone):
+        """Compiled selector for 1 zone of a page profile. Compiled on 1st use, then reused"""
+        key = (page, zone)
+        try:
+            return yf_selectors.compiled[key]
+        except KeyError:
+            pass
+        with yf_selectors.comp_lock:
+            if key not in yf_selectors.compiled:
+                yf_selectors.compiled[key] = soupsieve.compile(yf_selectors.profiles[page][zone])
+        return yf_selectors.compiled[key]
+
+    @staticmethod
+    def one(node, page, zone):
+        """1st match of a zone under node (BS4 doc or tag). None = no match, same as find()"""
+        return yf_selectors.sel(page, zone).select_one(node) if node is not None else None
+
+    @staticmethod
+    def many(node, page, zone):
+        """All matches of a zone under node, in document order. [] = no match"""
+        return yf_selectors.sel(page, zone).select(node) if node is not None else []
+
+######################################################################
+# method 2
+    @staticmethod
+    def set_profile(page, zones):
+        """
+        Swap (or patch) the selectors of a page profile. Only the zones given are replaced
+        Bad selectors fail here (soupsieve.SelectorSyntaxError), not mid scan
+        """
+        cmi_debug = __name__+"::"+yf_selectors.set_profile.__name__
+        fresh = {z: soupsieve.compile(css) for z, css in zones.items()}
+        with yf_selectors.comp_lock:
+            yf_selectors.profiles.setdefault(page, {}).update(zones)
+            yf_selectors.compiled.update({(page, z): c for z, c in fresh.items()})
+        logging.info( f"%s - profile [{page}] updated zones: {list(zones)}" % cmi_debug )
+        return
+
+    @staticmethod
+    def load(path):
+        """Load profile overrides from a JSON file : {"page": {"zone": "css selector", ...}, ...}"""
+        with open(path, encoding='utf-8') as f:
+            for page, zones in json.load(f).items():
+                yf_selectors.set_profile(page, zones)
+        return
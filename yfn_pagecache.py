@@ -0,0 +1,246 @@
+#! python3
+import os
+import re
+import json
+import zlib
+import time
+import hashlib
+import logging
+import threading
+import sys
+from collections import OrderedDict
+from urllib.parse import urlparse
+from requests.cookies import RequestsCookieJar
+from requests_html import HTML
+from net_capture import net_capture
+
+# logging setup
+logging.basicConfig(level=logging.INFO)
+
+#####################################################
+
+class cached_page:
+    """
+    Lightweight stand-in for a requests_html Response, rebuilt from the on-disk page cache.
+    Exposes the handful of attributes the news reader touches: .text .url .html .status_code .headers .cookies
+    """
+
+    def __init__(self, url, text, headers, status_code, fetched, uclass=None):
+        self.url = url
+        self.text = text
+        self.headers = headers
+        self.status_code = status_code
+        self.fetched = fetched              # epoch secs of original network get()
+        self.uclass = uclass                # TTL class (page_cache.url_class). Set by the cache
+        self.cookies = RequestsCookieJar()  # cookies are never cached
+        self.nbytes = sys.getsizeof(text)   # resident size of the decoded body
+        return
+
+    @property
+    def html(self):
+        # build the requests_html doc on demand & dont hold on to it. Keeps resident size == body text
+        return HTML(url=self.url, html=self.text)
+
+    @staticmethod
+    def from_response(resp):
+        """Strip a live requests/requests_html Response down to a cached_page (body text + headers only)"""
+        try:
+            body = resp.html.html               # rendered markup if page went through the JS engine
+        except AttributeError:
+            body = resp.text
+        return cached_page(resp.url, body, dict(resp.headers), resp.status_code, time.time())
+
+#####################################################
+
+class page_cache:
+    """
+    Content addressed, TTL aware, on-disk page cache sitting behind yfnews_reader.yfn_jsdb{}
+    Keys are the same sha256(url) urlhash used everywhere else in the news reader.
+    Behaves like the old dict: cache[urlhash] raises KeyError on a miss, so existing
+    try/except KeyError cache lookups work unchanged, but now survive process exit.
+    Disk layout : <root>/<urlhash[:2]>/<urlhash>.zpg  (zlib compressed JSON: body + headers + fetch time)
+    In-memory tier is an LRU bounded by BYTES (mem_budget), holding only decoded body text (cached_page),
+    never the full Response + request/session object graph.
+    """
+
+    # global accessors
+    root = os.path.expanduser("~/.cache/aop/yfn_pages")
+    # TTL per URL class (secs). None = never expires
+    ttl = { 'feed': 15 * 60, \
+            'article': None, \
+            'page': 60 * 60 }
+    feed_rx = re.compile(r'^/quote/[^/]+/(news|press-releases)')
+    mem_budget = 64 * 1024 * 1024     # max resident bytes of the in-memory tier
+
+    def __init__(self, root=None, mem_budget=None):
+        if root is not None:
+            self.root = root
+        if mem_budget is not None:
+            self.mem_budget = mem_budget
+        self.mem = OrderedDict()    # in-process LRU tier : urlhash -> cached_page (oldest 1st)
+        self.mem_bytes = 0          # resident bytes held by self.mem
+        self.lock = threading.Lock()
+        self.hits_mem = 0
+        self.hits_disk = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        return
+
+######################################################################
+# method 1
+    def url_class(self, url):
+        """Classify a url into a TTL class. feed = symbol news feed, article = YFN hosted story, page = anything else"""
+        up = urlparse(url)
+        if up.netloc.endswith("finance.yahoo.com"):
+            if self.feed_rx.match(up.path):
+                return 'feed'
+            if up.path.startswith(("/news/", "/m/", "/video/")):
+                return 'article'
+        return 'page'
+
+    def stale(self, uclass, fetched):
+        """True if a page of TTL class uclass fetched at epoch secs fetched has outlived its TTL"""
+        ttl = self.ttl.get(uclass)
+        return ttl is not None and time.time() - fetched > ttl
+
+######################################################################
+# method 2
+    def hash_url(self, url):
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def path_of(self, urlhash):
+        return os.path.join(self.root, urlhash[:2], urlhash + ".zpg")
+
+######################################################################
+# method 3
+    def __getitem__(self, urlhash):
+        cmi_debug = __name__+"::"+self.__getitem__.__name__
+        with self.lock:
+            page = self.mem.get(urlhash)
+            if page is not None and not self.stale(page.uclass, page.fetched):
+                self.hits_mem += 1
+                self.mem.move_to_end(urlhash)       # most recently used
+                return page
+        if page is not None:                        # same TTL as the disk tier
+            logging.info( f"%s - EXPIRED {page.uclass} entry: {urlhash}" % cmi_debug )
+            with self.lock:
+                self.expired += 1
+                self.misses += 1
+            self.__delitem__(urlhash)
+            raise KeyError(urlhash)
+        page = self.load(urlhash)
+        if page is None:
+            with self.lock:
+                self.misses += 1
+            raise KeyError(urlhash)
+        logging.info( f"%s - DISK hit: {urlhash}" % cmi_debug )
+        with self.lock:
+            self.hits_disk += 1
+            self.mem_insert(urlhash, page)
+        return page
+
+    def __setitem__(self, urlhash, resp):
+        page = resp if isinstance(resp, cached_page) else cached_page.from_response(resp)
+        page.uclass = self.url_class(page.url)
+        with self.lock:
+            self.mem_insert(urlhash, page)
+        self.store(urlhash, page)
+        return
+
+    def __contains__(self, urlhash):
+        try:
+            self[urlhash]
+        except KeyError:
+            return False
+        return True
+
+    def __delitem__(self, urlhash):
+        with self.lock:
+            old = self.mem.pop(urlhash, None)
+            if old is not None:
+                self.mem_bytes -= old.nbytes
+        try:
+            os.remove(self.path_of(urlhash))
+        except FileNotFoundError:
+            pass
+        return
+
+    def keys(self):
+        return self.mem.keys()
+
+    def __len__(self):
+        return len(self.mem)
+
+######################################################################
+# method 4
+    def mem_insert(self, urlhash, page):
+        """Insert into the LRU tier & evict least recently used pages until under mem_budget. Caller holds self.lock"""
+        old = self.mem.pop(urlhash, None)
+        if old is not None:
+            self.mem_bytes -= old.nbytes
+        self.mem[urlhash] = page
+        self.mem_bytes += page.nbytes
+        while self.mem_bytes > self.mem_budget and len(self.mem) > 1:
+            ev_hash, ev_page = self.mem.popitem(last=False)
+            self.mem_bytes -= ev_page.nbytes
+            self.evictions += 1
+            logging.info( f"{__name__}::mem_insert - EVICT {ev_hash} / {ev_page.nbytes} bytes" )
+        return
+
+######################################################################
+# method 5
+    def load(self, urlhash):
+        """Read 1 page from disk. return : cached_page or None if missing/expired/corrupt"""
+        cmi_debug = __name__+"::"+self.load.__name__
+        if net_capture.active():
+            return None         # record/replay : every page must flow through the fetch layer
+        try:
+            with open(self.path_of(urlhash), "rb") as f:
+                rec = json.loads(zlib.decompress(f.read()))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, zlib.error) as e:
+            logging.info( f"%s - CORRUPT entry {urlhash} / dropped : {e}" % cmi_debug )
+            self.__delitem__(urlhash)
+            return None
+
+        if self.stale(rec['uclass'], rec['fetched']):
+            logging.info( f"%s - EXPIRED {rec['uclass']} entry: {urlhash}" % cmi_debug )
+            with self.lock:
+                self.expired += 1
+            self.__delitem__(urlhash)
+            return None
+        return cached_page(rec['url'], rec['body'], rec['headers'], rec['status'], rec['fetched'], rec['uclass'])
+
+######################################################################
+# method 6
+    def store(self, urlhash, page):
+        """Write 1 cached_page to disk (atomic replace). Only good 200 pages are persisted"""
+        cmi_debug = __name__+"::"+self.store.__name__
+        if page.status_code != 200:
+            return
+        rec = { 'url': page.url, \
+                'uclass': page.uclass or self.url_class(page.url), \
+                'status': page.status_code, \
+                'headers': page.headers, \
+                'fetched': page.fetched, \
+                'body': page.text }
+        fpath = self.path_of(urlhash)
+        try:
+            os.makedirs(os.path.dirname(fpath), exist_ok=True)
+            tpath = f"{fpath}.{threading.get_ident()}.tmp"
+            with open(tpath, "wb") as f:
+                f.write(zlib.compress(json.dumps(rec).encode(), 6))
+            os.replace(tpath, fpath)
+        except OSError as e:
+            logging.info( f"%s - FAILED to persist {urlhash} : {e}" % cmi_debug )
+        return
+
+######################################################################
+# method 7
+    def stats(self):
+        with self.lock:
+            return {'mem_hits': self.hits_mem, 'disk_hits': self.hits_disk, 'misses': self.misses, \
+                    'expired': self.expired, 'evictions': self.evictions, \
+                    'resident': len(self.mem), 'resident_bytes': self.mem_bytes}